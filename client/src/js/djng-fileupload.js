@@ -6,7 +6,7 @@
 var fileuploadModule = angular.module('djng.fileupload', ['ngFileUpload']);
 
 
-fileuploadModule.directive('djngFileuploadUrl', ['Upload', function(Upload) {
+fileuploadModule.directive('djngFileuploadUrl', ['$q', 'Upload', function($q, Upload) {
 	return {
 		restrict: 'A',
 		require: 'ngModel',
@@ -23,29 +23,116 @@ fileuploadModule.directive('djngFileuploadUrl', ['Upload', function(Upload) {
 			}
 
 			scope.uploadFile = function(file, filetype, id, model) {
-				var data = {'file:0': file, filetype: filetype},
-				    element = angular.element(document.querySelector('#' + id));
+				var element = angular.element(document.querySelector('#' + id)),
+				    chunkSize = parseInt(attrs.djngFileuploadChunkSize) || 0,
+				    headers = attrs.djngFileuploadPolicy ? {'DjNg-Upload-Policy': attrs.djngFileuploadPolicy} : {},
+				    promise;
+				if (!file)
+					return;
 				element.addClass('uploading');
-				Upload.upload({
-					data: data,
-					url: attrs.djngFileuploadUrl
-				}).then(function(response) {
+				if (attrs.djngFileuploadDirectUrl) {
+					promise = uploadDirect(file, filetype, headers);
+				} else if (chunkSize && file.size > chunkSize) {
+					promise = uploadChunked(file, filetype, chunkSize, headers);
+				} else {
+					// send the filetype ahead of the file, so that it is known when the upload is aborted
+					promise = Upload.upload({
+						data: {filetype: filetype, 'file:0': file},
+						url: attrs.djngFileuploadUrl,
+						headers: headers
+					});
+				}
+				promise.then(function(response) {
 					var field = response.data['file:0'];
 					var cf = element.data('current_file');
 					element.removeClass('uploading');
 					if (!field)
 						return;
+					if (field.error) {
+						console.error(field.error);
+						return;
+					}
 					element.css('background-image', field.url);
 					element.removeClass('djng-empty');
 					element.removeClass('djng-preset');
 					element.val(field.file_name);
 					delete field.url;  // we don't want to send back the whole image
-					angular.extend(scope.$eval(model), field, cf ? {current_file: cf} : {});
+					var target = scope.$eval(model);
+					delete target.temp_name;  // refer to the file either by its temp_name or its ticket
+					delete target.ticket;
+					angular.extend(target, field, cf ? {current_file: cf} : {});
 				}, function(respose) {
 					element.removeClass('uploading');
 					console.error(respose.statusText);
 				});
 			};
+
+			// Upload the file directly to the storage endpoint, using a ticket issued by the server.
+			function uploadDirect(file, filetype, headers) {
+				var url = attrs.djngFileuploadDirectUrl;
+				return Upload.upload({url: attrs.djngFileuploadUrl, headers: headers, data: {
+					action: 'ticket', filetype: filetype, file_name: file.name, file_size: file.size,
+					content_type: file.type
+				}}).then(function(response) {
+					var ticket = response.data['file:0'].ticket;
+					return Upload.http({
+						url: url + (url.indexOf('?') < 0 ? '?' : '&') + 'ticket=' + encodeURIComponent(ticket),
+						method: 'PUT',
+						headers: {'Content-Type': file.type || 'application/octet-stream'},
+						data: file
+					}).then(function() {
+						return response;
+					});
+				});
+			}
+
+			// Upload a large file in slices of `chunkSize` bytes. A slice which failed to upload, is
+			// retried a few times, starting from the offset the server reported to have received.
+			function uploadChunked(file, filetype, chunkSize, headers) {
+				var url = attrs.djngFileuploadUrl, retries = 0, restarts = 0;
+
+				function appendChunk(tempName, offset) {
+					if (offset >= file.size) {
+						return Upload.upload({url: url, headers: headers, data: {
+							action: 'finalize', filetype: filetype, temp_name: tempName, file_size: file.size,
+							file_name: file.name, content_type: file.type
+						}});
+					}
+					return Upload.upload({url: url, headers: headers, data: {
+						action: 'append', filetype: filetype, temp_name: tempName, offset: offset,
+						chunk: file.slice(offset, offset + chunkSize)
+					}}).then(function(response) {
+						retries = 0;
+						return appendChunk(tempName, response.data.offset);
+					}, function(response) {
+						if (response.status === 413) {
+							return $q.reject(response);
+						}
+						if (response.status === 410) {
+							// the partial file has been swept away, hence upload the whole file again
+							return restarts++ < 1 ? initUpload() : $q.reject(response);
+						}
+						if (response.status === 409 && response.data) {
+							return appendChunk(tempName, response.data.offset);
+						}
+						if (retries++ < 3) {
+							return appendChunk(tempName, offset);
+						}
+						return $q.reject(response);
+					});
+				}
+
+				function initUpload() {
+					return Upload.upload({url: url, headers: headers, data: {
+						action: 'init', filetype: filetype, file_name: file.name, file_size: file.size,
+						content_type: file.type
+					}}).then(function(response) {
+						return appendChunk(response.data.temp_name, response.data.offset);
+					});
+				}
+
+				return initUpload();
+			}
 		}
 	};
 }]);
@@ -64,6 +151,7 @@ fileuploadModule.directive('djngFileuploadButton', function() {
 				element.val(element.data('area_label'));
 				if (model) {
 					model.temp_name = 'delete';  // tags previous image for deletion
+					delete model.ticket;
 				}
 			};
 		}
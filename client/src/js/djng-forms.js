@@ -965,4 +965,84 @@ djngModule.directive('djngBindIf', function() {
 });
 
 
+// Directive <select djng-remote-choices="form_name.field_name"> loads the options of a model choice
+// field declared with `remote_choices=True` lazily, by invoking the remote method `fetch_choices` on
+// the view which rendered this form. The first page of options is loaded, when the select element
+// receives the focus. Whenever the optional expression `djng-remote-search` changes, the options
+// are reloaded, filtered by that search string. Further pages are loaded by invoking
+// `loadMoreChoices()` on the element's scope. Options which already exist, such as those for the
+// selected values, are kept.
+djngModule.directive('djngRemoteChoices', ['$compile', '$http', '$window', function($compile, $http, $window) {
+	return {
+		restrict: 'A',
+		link: function(scope, element, attrs) {
+			var url = attrs.djngRemoteChoicesUrl || $window.location.pathname + $window.location.search;
+			var page = 0, hasMore = true, pending = null, search = '';
+
+			function appendChoices(choices) {
+				var existing = {};
+				angular.forEach(element.find('option'), function(option) {
+					existing[option.value] = true;
+				});
+				angular.forEach(choices, function(choice) {
+					var option, value = String(choice.value);
+					if (existing[value])
+						return;
+					option = angular.element('<option></option>').attr('value', value).text(choice.label);
+					element.append(option);
+					$compile(option)(scope);
+				});
+			}
+
+			function removeUnselectedChoices() {
+				angular.forEach(element.find('option'), function(option) {
+					if (option.value && !option.selected) {
+						angular.element(option).remove();
+					}
+				});
+			}
+
+			function loadChoices() {
+				var data = {field: attrs.djngRemoteChoices, search: search, page: page + 1};
+				var config = {headers: {'DjNg-Remote-Method': 'fetch_choices', 'X-Requested-With': 'XMLHttpRequest'}};
+				if (pending || !hasMore)
+					return pending;
+				pending = $http.post(url, data, config).then(function(response) {
+					if (data.search !== search)
+						return;  // response to an outdated search
+					page++;
+					hasMore = response.data.has_more;
+					appendChoices(response.data.choices);
+				}).finally(function() {
+					if (data.search === search) {
+						pending = null;
+					}
+				});
+				return pending;
+			}
+
+			scope.loadMoreChoices = loadChoices;
+
+			element.one('focus', function() {
+				if (page === 0) {
+					scope.$apply(loadChoices);
+				}
+			});
+
+			if (attrs.djngRemoteSearch) {
+				scope.$watch(attrs.djngRemoteSearch, function(newSearch, oldSearch) {
+					if (newSearch === oldSearch)
+						return;
+					search = newSearch || '';
+					page = 0;
+					hasMore = true;
+					pending = null;
+					removeUnselectedChoices();
+					loadChoices();
+				});
+			}
+		}
+	};
+}]);
+
 })(window.angular);
@@ -1,18 +1,70 @@
+from functools import wraps
+
+from django.core.signals import setting_changed
+from django.utils.functional import SimpleLazyObject, empty
+
+
+def cached_setting(func):
+    """
+    Turn a method of ``AppSettings`` into a property, which is evaluated only once, until one of
+    the settings affecting it is changed.
+    """
+    @wraps(func)
+    def getter(self):
+        try:
+            return self._cache[func.__name__]
+        except KeyError:
+            value = self._cache[func.__name__] = func(self)
+            return value
+    return property(getter)
+
+
 class AppSettings(object):
+    def __init__(self):
+        self._cache = {}
+        self._upload_storage = SimpleLazyObject(self.create_upload_storage)
+
     def _setting(self, name, default=None):
         from django.conf import settings
         return getattr(settings, name, default)
 
+    def reset(self, setting=None, **kwargs):
+        """
+        Receiver of signal ``setting_changed``, discarding all values derived from the changed setting.
+        """
+        if setting is None or setting.startswith('DJNG_') or setting == 'MEDIA_ROOT':
+            self._cache.clear()
+            self._upload_storage._wrapped = empty
+
     @property
     def upload_storage(self):
+        """
+        The storage keeping uploaded files until their form is submitted. This is a lazy object, so
+        that it can be referred by class attributes, while still following changed settings.
+        """
+        return self._upload_storage
+
+    def create_upload_storage(self):
+        """
+        Create the storage configured through ``DJNG_UPLOAD_STORAGE`` and its keyword arguments
+        ``DJNG_UPLOAD_STORAGE_OPTIONS``. File system based storages are located in the folder
+        ``DJNG_UPLOAD_TEMP`` below ``MEDIA_ROOT``, unless another location is given.
+        """
         import os
         from django.core.files.storage import FileSystemStorage
+        from django.utils.module_loading import import_string
 
-        media_root = self._setting('MEDIA_ROOT', '')
-        upload_temp = self._setting('DJNG_UPLOAD_TEMP', 'upload_temp')
-        return FileSystemStorage(location=os.path.join(media_root, upload_temp))
+        storage_class = self._setting('DJNG_UPLOAD_STORAGE', 'django.core.files.storage.FileSystemStorage')
+        if isinstance(storage_class, str):
+            storage_class = import_string(storage_class)
+        options = dict(self._setting('DJNG_UPLOAD_STORAGE_OPTIONS', {}))
+        if issubclass(storage_class, FileSystemStorage) and 'location' not in options:
+            media_root = self._setting('MEDIA_ROOT', '')
+            upload_temp = self._setting('DJNG_UPLOAD_TEMP', 'upload_temp')
+            options['location'] = os.path.join(media_root, upload_temp)
+        return storage_class(**options)
 
-    @property
+    @cached_setting
     def THUMBNAIL_OPTIONS(self):
         """
         Set the size as a 2-tuple for thumbnailed images after uploading them.
@@ -24,8 +76,102 @@ class AppSettings(object):
             raise ImproperlyConfigured("'DJNG_THUMBNAIL_SIZE' must be a 2-tuple of integers.")
         return {'crop': True, 'size': size}
 
+    @cached_setting
+    def THUMBNAIL_WORKERS(self):
+        """
+        Number of background threads generating the thumbnails of uploaded images. Use 0 to generate
+        them synchronously and inline them into the upload response.
+        """
+        from django.core.exceptions import ImproperlyConfigured
+
+        workers = self._setting('DJNG_THUMBNAIL_WORKERS', 2)
+        if not isinstance(workers, int) or workers < 0:
+            raise ImproperlyConfigured("'DJNG_THUMBNAIL_WORKERS' must be a non-negative integer.")
+        return workers
+
+    @cached_setting
+    def UPLOAD_WORKERS(self):
+        """
+        Number of threads storing and previewing the files uploaded within one request concurrently.
+        """
+        from django.core.exceptions import ImproperlyConfigured
+
+        workers = self._setting('DJNG_UPLOAD_WORKERS', 4)
+        if not isinstance(workers, int) or workers < 1:
+            raise ImproperlyConfigured("'DJNG_UPLOAD_WORKERS' must be a positive integer.")
+        return workers
+
+    @cached_setting
+    def UPLOAD_DEDUPLICATE(self):
+        """
+        Store uploaded files by the digest of their content, so that files uploaded more than once
+        are stored and thumbnailed only once.
+        """
+        return bool(self._setting('DJNG_UPLOAD_DEDUPLICATE', False))
+
+    @cached_setting
+    def UPLOAD_TEMP_MAX_AGE(self):
+        """
+        Number of seconds after which files in the temporary upload storage are swept away.
+        """
+        return self._setting('DJNG_UPLOAD_TEMP_MAX_AGE', 86400)
+
+    @cached_setting
+    def UPLOAD_TEMP_MAX_SIZE(self):
+        """
+        Number of bytes the temporary upload storage may occupy, before the oldest files are swept
+        away. ``None`` means unlimited.
+        """
+        return self._setting('DJNG_UPLOAD_TEMP_MAX_SIZE', None)
+
+    @cached_setting
+    def UPLOAD_TEMP_SWEEP_INTERVAL(self):
+        """
+        Number of seconds between two sweeps of the temporary upload storage, performed by the
+        background thread started through ``djng.core.upload_temp.start_upload_temp_sweeper()``.
+        ``0`` disables this thread.
+        """
+        return self._setting('DJNG_UPLOAD_TEMP_SWEEP_INTERVAL', 0)
+
+    @cached_setting
+    def UPLOAD_MAX_SIZE(self):
+        """
+        Default maximum number of bytes accepted for an uploaded file. ``None`` means unlimited.
+        """
+        return self._setting('DJNG_UPLOAD_MAX_SIZE', None)
+
+    @cached_setting
+    def UPLOAD_CHUNK_SIZE(self):
+        """
+        Files larger than this number of bytes are uploaded in chunks of this size. Use 0 to upload
+        all files in one request.
+        """
+        from django.core.exceptions import ImproperlyConfigured
+
+        chunk_size = self._setting('DJNG_UPLOAD_CHUNK_SIZE', 0x200000)
+        if not isinstance(chunk_size, int) or chunk_size < 0:
+            raise ImproperlyConfigured("'DJNG_UPLOAD_CHUNK_SIZE' must be a non-negative integer.")
+        return chunk_size
+
+    @cached_setting
+    def UPLOAD_DIRECT_URL(self):
+        """
+        URL of the endpoint, to which files are uploaded directly using a ticket issued by
+        ``FileUploadView``, instead of passing their content through that view. ``None`` disables
+        direct uploads.
+        """
+        return self._setting('DJNG_UPLOAD_DIRECT_URL', None)
+
+    @cached_setting
+    def UPLOAD_TICKET_MAX_AGE(self):
+        """
+        Number of seconds during which a ticket for a direct upload remains valid.
+        """
+        return self._setting('DJNG_UPLOAD_TICKET_MAX_AGE', 3600)
+
 
 import sys
 app_settings = AppSettings()
 app_settings.__name__ = __name__
 sys.modules[__name__] = app_settings
+setting_changed.connect(app_settings.reset, weak=False)
@@ -0,0 +1,170 @@
+import logging
+import os
+import threading
+import time
+from collections import namedtuple
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+from djng import app_settings
+
+logger = logging.getLogger(__name__)
+
+SweepResult = namedtuple('SweepResult', ['scanned', 'removed', 'reclaimed'])
+
+
+def scan_upload_temp(storage, batch_size=1000):
+    """
+    Yield lists of at most ``batch_size`` tuples ``(name, modified_time, size)`` for all files in the
+    temporary upload storage. Storages on the local file system are scanned using ``os.scandir``,
+    so that large directories are never loaded at once.
+    """
+    batch = []
+    try:
+        root = storage.path('')
+    except NotImplementedError:
+        pending = ['']
+        while pending:
+            directory = pending.pop()
+            directories, files = storage.listdir(directory)
+            pending.extend(os.path.join(directory, name) for name in directories)
+            for name in files:
+                name = os.path.join(directory, name)
+                try:
+                    batch.append((name, storage.get_modified_time(name).timestamp(), storage.size(name)))
+                except (OSError, NotImplementedError):
+                    continue
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+    else:
+        pending = [root]
+        while pending:
+            try:
+                entries = os.scandir(pending.pop())
+            except FileNotFoundError:
+                continue
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                            continue
+                        stat = entry.stat(follow_symlinks=False)
+                    except FileNotFoundError:
+                        continue
+                    batch.append((os.path.relpath(entry.path, root), stat.st_mtime, stat.st_size))
+                    if len(batch) >= batch_size:
+                        yield batch
+                        batch = []
+    if batch:
+        yield batch
+
+
+def check_upload_temp_location(storage):
+    """
+    Raise ``ImproperlyConfigured`` if the temporary upload storage is located in ``MEDIA_ROOT`` or
+    in one of its parent folders, since sweeping it would remove the files kept by the application.
+    """
+    try:
+        location = os.path.realpath(storage.path(''))
+    except NotImplementedError:
+        return
+    if settings.MEDIA_ROOT:
+        media_root = os.path.realpath(settings.MEDIA_ROOT)
+        if os.path.commonpath([location, media_root]) == location:
+            raise ImproperlyConfigured("Refusing to sweep the temporary upload folder '{}', since it "
+                                       "contains MEDIA_ROOT. Point DJNG_UPLOAD_TEMP to a subfolder."
+                                       .format(location))
+
+
+def sweep_upload_temp(storage=None, max_age=None, max_size=None, batch_size=1000, dry_run=False, now=None):
+    """
+    Remove files from the temporary upload storage, which have been uploaded but never been
+    submitted through a form. Files older than ``max_age`` seconds are removed while scanning.
+    Afterwards, if the remaining files occupy more than ``max_size`` bytes, the oldest of them are
+    removed until that quota is met. Return a ``SweepResult`` with the number of scanned and
+    removed files, and the number of reclaimed bytes.
+    """
+    storage = app_settings.upload_storage if storage is None else storage
+    check_upload_temp_location(storage)
+    max_age = app_settings.UPLOAD_TEMP_MAX_AGE if max_age is None else max_age
+    max_size = app_settings.UPLOAD_TEMP_MAX_SIZE if max_size is None else max_size
+    expiry = (time.time() if now is None else now) - max_age if max_age else None
+    scanned = removed = reclaimed = 0
+    remaining, remaining_size = [], 0
+
+    def remove(name, size):
+        if not dry_run:
+            try:
+                storage.delete(name)
+            except FileNotFoundError:
+                return 0
+        return size
+
+    for batch in scan_upload_temp(storage, batch_size):
+        scanned += len(batch)
+        for name, modified_time, size in batch:
+            if expiry is not None and modified_time < expiry:
+                reclaimed += remove(name, size)
+                removed += 1
+            elif max_size:
+                remaining.append((modified_time, name, size))
+                remaining_size += size
+
+    if max_size and remaining_size > max_size:
+        remaining.sort()
+        for modified_time, name, size in remaining:
+            if remaining_size <= max_size:
+                break
+            reclaimed += remove(name, size)
+            removed += 1
+            remaining_size -= size
+    return SweepResult(scanned, removed, reclaimed)
+
+
+class UploadTempSweeper(threading.Thread):
+    """
+    Daemon thread sweeping the temporary upload storage every ``interval`` seconds.
+    """
+    def __init__(self, interval, **kwargs):
+        super(UploadTempSweeper, self).__init__(name='djng-upload-sweeper', daemon=True)
+        self.interval = interval
+        self.sweep_kwargs = kwargs
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            try:
+                result = sweep_upload_temp(**self.sweep_kwargs)
+            except Exception:
+                logger.exception("Failed to sweep the temporary upload storage")
+            else:
+                if result.removed:
+                    logger.info("Removed %d of %d temporary uploaded files, reclaiming %d bytes",
+                                result.removed, result.scanned, result.reclaimed)
+
+    def stop(self):
+        self.stopped.set()
+
+
+_sweeper = None
+_sweeper_lock = threading.Lock()
+
+
+def start_upload_temp_sweeper():
+    """
+    Start the periodic sweeper, if ``DJNG_UPLOAD_TEMP_SWEEP_INTERVAL`` is configured. Call this
+    function from the WSGI or ASGI entry point of the project, so that only server processes, but
+    not management commands, sweep the temporary upload storage.
+    """
+    global _sweeper
+
+    interval = app_settings.UPLOAD_TEMP_SWEEP_INTERVAL
+    with _sweeper_lock:
+        if interval and _sweeper is None:
+            check_upload_temp_location(app_settings.upload_storage)
+            _sweeper = UploadTempSweeper(interval)
+            _sweeper.start()
+    return _sweeper
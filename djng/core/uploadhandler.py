@@ -0,0 +1,102 @@
+import fnmatch
+import os
+from collections import namedtuple
+from hashlib import sha256
+
+from django.core import signing
+from django.core.files.uploadhandler import FileUploadHandler, SkipFile, StopUpload
+from django.template.defaultfilters import filesizeformat
+from django.utils.translation import gettext as _
+
+from djng import app_settings
+
+
+class UploadPolicy(namedtuple('UploadPolicy', ['max_size', 'accept'])):
+    """
+    Constraints declared by a ``FileField`` or ``ImageField`` for the files uploaded through its
+    widget. The policy is signed, passed to the client and sent back with each upload using the
+    header ``DjNg-Upload-Policy``, so that ``FileUploadView`` can enforce it while receiving.
+    """
+    salt = 'djng.core.uploadhandler.UploadPolicy'
+
+    @classmethod
+    def get_default(cls):
+        return cls(app_settings.UPLOAD_MAX_SIZE, '*/*')
+
+    @classmethod
+    def loads(cls, token):
+        max_size, accept = signing.loads(token, salt=cls.salt)
+        return cls(max_size, accept)
+
+    def dumps(self):
+        return signing.dumps(list(self), salt=self.salt, compress=True)
+
+    def accepts(self, content_type, file_name):
+        """
+        Return True, if a file of the given content type and name matches one of the comma separated
+        MIME types, wildcards such as ``image/*`` or file extensions, declared in ``accept``.
+        """
+        extension = os.path.splitext(file_name or '')[1].lower()
+        for pattern in (self.accept or '*/*').split(','):
+            pattern = pattern.strip().lower()
+            if pattern.startswith('.'):
+                if pattern == extension:
+                    return True
+            elif fnmatch.fnmatchcase((content_type or '').lower(), pattern):
+                return True
+        return False
+
+    def exceeds(self, size):
+        return bool(self.max_size) and size > self.max_size
+
+    def get_type_error(self, content_type):
+        return _("Files of type '{}' are not accepted.").format(content_type)
+
+    def get_size_error(self):
+        return _("Files may not be larger than {}.").format(filesizeformat(self.max_size))
+
+
+class StreamingUploadHandler(FileUploadHandler):
+    """
+    Upload handler to be placed in front of Django's default handlers. It rejects files of an
+    unaccepted content type before receiving their content, aborts the upload as soon as a file
+    exceeds the size declared by ``policy``, and computes the SHA-256 digest of each file while it
+    is being received, so that it does not have to be read again for that purpose.
+
+    Rejected files are reported in ``errors``, the digests of the received files in ``digests``,
+    both keyed by the name of the form field. ``oversized`` tells whether the upload has been aborted
+    because of its size. The content type of the field ``chunk``, used for chunked uploads, is not
+    checked.
+    """
+    def __init__(self, request=None, policy=None):
+        super(StreamingUploadHandler, self).__init__(request)
+        self.policy = policy or UploadPolicy.get_default()
+        self.digests = {}
+        self.errors = {}
+        self.oversized = False
+
+    def abort_oversized(self, field_name):
+        self.errors[field_name] = self.policy.get_size_error()
+        self.oversized = True
+        raise StopUpload(connection_reset=True)
+
+    def new_file(self, field_name, file_name, content_type, content_length, charset=None, content_type_extra=None):
+        super(StreamingUploadHandler, self).new_file(field_name, file_name, content_type, content_length,
+                                                     charset, content_type_extra)
+        if field_name != 'chunk' and not self.policy.accepts(content_type, file_name):
+            self.errors[field_name] = self.policy.get_type_error(content_type)
+            raise SkipFile
+        if content_length is not None and self.policy.exceeds(content_length):
+            self.abort_oversized(field_name)
+        self.received = 0
+        self.digest = sha256()
+
+    def receive_data_chunk(self, raw_data, start):
+        self.received += len(raw_data)
+        if self.policy.exceeds(self.received):
+            self.abort_oversized(self.field_name)
+        self.digest.update(raw_data)
+        return raw_data
+
+    def file_complete(self, file_size):
+        self.digests[self.field_name] = self.digest.hexdigest()
@@ -2,6 +2,8 @@
 from django.forms.forms import DeclarativeFieldsMetaclass, BaseForm
 from django.forms.models import BaseModelForm, ModelFormMetaclass
 from .angular_base import BaseFieldsModifierMetaclass, NgFormBaseMixin
+from .angular_cache import NgFormCacheMixin
+from .angular_forms_set import NgFormsSet
 from .angular_model import NgModelFormMixin
 from .angular_validation import NgFormValidationMixin
 
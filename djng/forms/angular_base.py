@@ -1,25 +1,81 @@
 from base64 import b64encode
-from collections import UserList
+from collections import namedtuple, OrderedDict, UserList
+from collections.abc import MutableMapping
+from functools import lru_cache
 import json
 import warnings
 
+from django.core.serializers.json import DjangoJSONEncoder
 from django.forms import forms
 from django.forms.boundfield import BoundField
 from django.http import QueryDict
-from django.utils.html import format_html, format_html_join, escape, conditional_escape
+from django.utils.html import format_html, format_html_join, escape
 from django.utils.encoding import force_text
+from django.utils.functional import Promise
 from django.utils.module_loading import import_string
-from django.utils.safestring import mark_safe, SafeText, SafeData
+from django.utils.safestring import mark_safe, SafeData, SafeText
 from django.core.exceptions import ValidationError, ImproperlyConfigured
 
-from .fields import DefaultFieldMixin
+from .fields import DefaultFieldMixin, MultipleChoiceField
 
 
-class SafeTuple(SafeData, tuple):
+class SafeTuple(namedtuple('SafeTuple', ['identifier', 'ul_class', 'ul_property', 'li_property', 'li_class', 'message'])):
     """
-    Used to bypass escaping of TupleErrorList by the ``conditional_escape`` function in Django's
-    form rendering.
+    A compact and immutable record for each item of a TupleErrorList. It can be accessed as a
+    6-tuple or through its named fields. Method ``__html__`` is used to bypass escaping by the
+    ``conditional_escape`` function in Django's form rendering.
     """
+    __slots__ = ()
+
+    def __new__(cls, iterable):
+        return cls._make(iterable)
+
+    def __html__(self):
+        return self
+
+
+def _render_error_item(identifier, identifier_is_safe, li_property, li_class, message, message_is_safe):
+    if message == '$message':
+        li_format = '<li ng-show="{0}.{1} && {0}.{3}" class="{2}" ng-bind="{0}.{3}"></li>'
+    else:
+        li_format = '<li ng-show="{0}.{1}" class="{2}">{3}</li>'
+    if identifier_is_safe:
+        identifier = mark_safe(identifier)
+    if message_is_safe:
+        message = mark_safe(message)
+    return format_html(li_format, identifier, li_property, li_class, message)
+
+
+# The items for potential errors are identical for each rendering of the same field and language,
+# therefore they can be cached. The flags `*_is_safe` are part of the key, to distinguish
+# strings marked as safe from those which require escaping.
+_render_cached_error_item = lru_cache(maxsize=4096)(_render_error_item)
+
+
+@lru_cache(maxsize=1024)
+def _render_cached_error_list(ul_format, identifier, identifier_is_safe, ul_class, items):
+    if identifier_is_safe:
+        identifier = mark_safe(identifier)
+    return format_html(ul_format, identifier, ul_class,
+                       mark_safe(''.join(_render_cached_error_item(*item) for item in items)))
+
+
+def render_error_list(ul_format, identifier, ul_class, items):
+    """
+    Render a <ul>-element containing a <li>-element for each item. Each item is a 6-tuple of
+    ``identifier``, ``identifier_is_safe``, ``li_property``, ``li_class``, ``message`` and
+    ``message_is_safe``.
+    Lists without server side errors, as signalled by the li_property ``$pristine``, are rendered
+    only once per field and language. Lists containing server side errors are rendered on each
+    invocation, but their static items are taken from the cache.
+    """
+    identifier_is_safe = isinstance(identifier, SafeData)
+    if not any(item[2] == '$pristine' for item in items):
+        return _render_cached_error_list(ul_format, identifier, identifier_is_safe, ul_class, items)
+    if identifier_is_safe:
+        identifier = mark_safe(identifier)
+    return format_html(ul_format, identifier, ul_class, mark_safe(''.join(
+        _render_error_item(*item) if item[2] == '$pristine' else _render_cached_error_item(*item) for item in items)))
 
 
 class TupleErrorList(UserList, list):
@@ -44,6 +100,7 @@ class TupleErrorList(UserList, list):
             self.error_class = 'errorlist'
         else:
             self.error_class = 'errorlist {}'.format(error_class)
+        self._members = None
 
     def as_data(self):
         return ValidationError(self.data).error_list
@@ -69,9 +126,8 @@ class TupleErrorList(UserList, list):
         Instead we discard extends containing strings here and add errors in non_field_errors
         for hidden fields in NgFormBaseMixin
         """
-        for item in iterable:
-            if not isinstance(item, str):
-                self.append(item)
+        self._members = None
+        self.data.extend(item for item in iterable if not isinstance(item, str))
         return None
 
     def as_ul(self):
@@ -81,23 +137,19 @@ class TupleErrorList(UserList, list):
         if isinstance(first, tuple):
             error_lists = {'$pristine': [], '$dirty': []}
             for e in self:
-                if e[5] == '$message':
-                    li_format = '<li ng-show="{0}.{1} && {0}.{3}" class="{2}" ng-bind="{0}.{3}"></li>'
-                else:
-                    li_format = '<li ng-show="{0}.{1}" class="{2}">{3}</li>'
-                err_tuple = (e[0], e[3], e[4], force_text(e[5]))
-                error_lists[e[2]].append(format_html(li_format, *err_tuple))
+                message = force_text(e[5])
+                error_lists[e[2]].append((e[0], isinstance(e[0], SafeData), e[3], e[4], message, isinstance(message, SafeData)))
             # renders and combine both of these lists
             dirty_errors, pristine_errors = '', ''
             if len(error_lists['$dirty']) > 0:
-                dirty_errors = format_html(
+                dirty_errors = render_error_list(
                     '<ul ng-show="{0}.$dirty && !{0}.$untouched" class="{1}" ng-cloak>{2}</ul>',  # duck typing: !...$untouched
-                    first[0], first[1], mark_safe(''.join(error_lists['$dirty']))
+                    first[0], first[1], tuple(error_lists['$dirty'])
                 )
             if len(error_lists['$pristine']) > 0:
-                pristine_errors = format_html(
+                pristine_errors = render_error_list(
                     '<ul ng-show="{0}.$pristine" class="{1}" ng-cloak>{2}</ul>',
-                    first[0], first[1], mark_safe(''.join(error_lists['$pristine']))
+                    first[0], first[1], tuple(error_lists['$pristine'])
                 )
             return format_html('{}{}', dirty_errors, pristine_errors)
         return format_html('<ul class="errorlist">{0}</ul>',
@@ -118,25 +170,231 @@ class TupleErrorList(UserList, list):
             return repr([force_text(e[5]) for e in self])
         return repr([force_text(e) for e in self])
 
-    def __contains__(self, item):
-        return item in list(self)
-
-    def __eq__(self, other):
-        return list(self) == other
-
-    def __ne__(self, other):
-        return list(self) != other
-
-    def __getitem__(self, i):
-        error = self.data[i]
+    @staticmethod
+    def _resolve(error):
         if isinstance(error, tuple):
             if isinstance(error[5], ValidationError):
-                error[5] = list(error[5])[0]
+                return SafeTuple(error[:5] + (list(error[5])[0],))
             return error
         if isinstance(error, ValidationError):
             return list(error)[0]
         return force_text(error)
 
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._resolve(error) for error in self.data[i]]
+        return self._resolve(self.data[i])
+
+    def __iter__(self):
+        for error in self.data:
+            yield self._resolve(error)
+
+    def __contains__(self, item):
+        if self._members is None:
+            try:
+                self._members = set(self)
+            except TypeError:
+                # unhashable items, fall back to a linear search
+                return any(error == item for error in self)
+        try:
+            return item in self._members
+        except TypeError:
+            return any(error == item for error in self)
+
+    def __eq__(self, other):
+        if not isinstance(other, list):
+            return False
+        if len(self) != len(other):
+            return False
+        return all(error == other_error for error, other_error in zip(self, other))
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __setitem__(self, i, item):
+        self._members = None
+        super(TupleErrorList, self).__setitem__(i, item)
+
+    def __delitem__(self, i):
+        self._members = None
+        super(TupleErrorList, self).__delitem__(i)
+
+    def __iadd__(self, other):
+        self._members = None
+        return super(TupleErrorList, self).__iadd__(other)
+
+    def append(self, item):
+        self._members = None
+        super(TupleErrorList, self).append(item)
+
+    def insert(self, i, item):
+        self._members = None
+        super(TupleErrorList, self).insert(i, item)
+
+    def pop(self, i=-1):
+        self._members = None
+        return super(TupleErrorList, self).pop(i)
+
+    def remove(self, item):
+        self._members = None
+        super(TupleErrorList, self).remove(item)
+
+    def clear(self):
+        self._members = None
+        super(TupleErrorList, self).clear()
+
+
+def _unique_css_classes(css_classes):
+    """
+    Remove duplicates from an iterable of CSS classes, while preserving their order.
+    """
+    return tuple(dict.fromkeys(c for c in css_classes if c))
+
+
+def _split_css_classes(css_classes):
+    """
+    Split CSS classes declared as string, list or tuple. Returns a tuple ``(classes, merge_default)``
+    or ``None`` if nothing usable was declared.
+    """
+    if hasattr(css_classes, 'split'):
+        return _unique_css_classes(css_classes.split()), False
+    if isinstance(css_classes, (list, tuple)):
+        return _unique_css_classes(c for c in css_classes if c != '__default__'), '__default__' in css_classes
+    return None
+
+
+class CssClassesLookup(object):
+    """
+    Immutable per-field lookup of the CSS classes declared through a Form's attributes
+    ``field_css_classes`` or ``label_css_classes``. Such a declaration may be a string, a list
+    or a dictionary, whose keys are field names or the wildcard ``'*'``.
+    It is normalized only once, so that during rendering, a precomputed string can be returned.
+    """
+    __slots__ = ('_default', '_fields')
+
+    def __init__(self, declaration, merge_default=False):
+        """
+        If ``merge_default`` is set, the CSS classes declared for a specific field are always
+        merged with those declared by the wildcard. Otherwise they replace them, unless the keyword
+        ``'__default__'`` is part of the declared list.
+        """
+        fields = {}
+        if isinstance(declaration, dict):
+            default = _split_css_classes(declaration.get('*'))
+            default = default[0] if default else ()
+            for name, css_classes in declaration.items():
+                if name == '*':
+                    continue
+                css_classes = _split_css_classes(css_classes)
+                if css_classes is None:
+                    continue
+                if merge_default or css_classes[1]:
+                    fields[name] = ' '.join(_unique_css_classes(default + css_classes[0]))
+                else:
+                    fields[name] = ' '.join(css_classes[0])
+        else:
+            default = _split_css_classes(declaration)
+            default = default[0] if default else ()
+        object.__setattr__(self, '_default', ' '.join(default))
+        object.__setattr__(self, '_fields', fields)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("{} is immutable".format(self.__class__.__name__))
+
+    def get(self, name):
+        """
+        Return the space-separated CSS classes for the field named ``name``.
+        """
+        return self._fields.get(name, self._default)
+
+
+class FormDataView(MutableMapping):
+    """
+    Copy-on-write view onto the data submitted through an Ajax request, used instead of copying
+    and rewriting that data in the form's constructor.
+
+    If ``prefix`` is set, the values are looked up in the nested dictionary named by that prefix,
+    or otherwise in the keys starting with ``<prefix>.``. The values of fields in ``converters``
+    are converted using their method ``convert_ajax_data()`` when they are read for the first time.
+    Values assigned to, or deleted from this view, never modify the submitted data.
+    """
+    _missing = object()
+
+    def __init__(self, data, converters=None, prefix=None):
+        self.submitted_data = data
+        self.converters = converters or {}
+        self.prefix = prefix
+        self.nested_data = None
+        if prefix:
+            nested_data = data.get(prefix)
+            if nested_data and isinstance(nested_data, dict):
+                self.nested_data = nested_data
+        self._values = {}
+        self._deleted = set()
+
+    def _lookup(self, key):
+        if self.nested_data is not None:
+            head, _, name = key.partition('.')
+            if head == self.prefix and name:
+                return self.nested_data.get(name, self._missing)
+            return self._missing
+        if self.prefix and not key.startswith(self.prefix + '.'):
+            return self._missing
+        return self.submitted_data.get(key, self._missing)
+
+    def _submitted_keys(self):
+        if self.nested_data is not None:
+            return ['{}.{}'.format(self.prefix, name) for name in self.nested_data.keys()]
+        if self.prefix:
+            return [key for key in self.submitted_data.keys() if key.startswith(self.prefix + '.')]
+        return self.submitted_data.keys()
+
+    def __getitem__(self, key):
+        if key in self._deleted:
+            raise KeyError(key)
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        value = self._lookup(key)
+        field = self.converters.get(key)
+        if field is not None:
+            try:
+                value = field.convert_ajax_data({} if value is self._missing else value)
+            except AttributeError:
+                pass  # value can not be converted, hence is passed to validation as is
+            self._values[key] = value
+        if value is self._missing:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self._values[key] = value
+        self._deleted.discard(key)
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self._values.pop(key, None)
+        self._deleted.add(key)
+
+    def __iter__(self):
+        keys = OrderedDict.fromkeys(self._submitted_keys())
+        keys.update(OrderedDict.fromkeys(self.converters.keys()))
+        keys.update(OrderedDict.fromkeys(self._values.keys()))
+        return (key for key in keys if key not in self._deleted)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return '<{}: {!r}>'.format(self.__class__.__name__, dict(self))
+
+    def copy(self):
+        return dict(self)
+
 
 class NgWidgetMixin(object):
     def get_context(self, name, value, attrs):
@@ -149,6 +407,15 @@ class NgWidgetMixin(object):
         return context
 
 
+@lru_cache(maxsize=None)
+def get_ng_widget_class(widget_class):
+    """
+    Return a widget class inheriting from ``NgWidgetMixin`` and ``widget_class``. It is created
+    only once per widget class, rather than for each rendered widget.
+    """
+    return type(widget_class.__name__, (NgWidgetMixin, widget_class), {})
+
+
 class NgBoundField(BoundField):
     @property
     def errors(self):
@@ -164,28 +431,15 @@ class NgBoundField(BoundField):
         """
         Returns a string of space-separated CSS classes for the wrapping element of this input field.
         """
+        # field_css_classes is an optional member of a Form optimized for django-angular
+        css_classes = self.form.get_css_classes_lookup('field_css_classes').get(self.name)
+        if not extra_classes and not hasattr(self.form, 'error_css_class') \
+                and not hasattr(self.form, 'required_css_class'):
+            return css_classes
         if hasattr(extra_classes, 'split'):
             extra_classes = extra_classes.split()
         extra_classes = set(extra_classes or [])
-        # field_css_classes is an optional member of a Form optimized for django-angular
-        field_css_classes = getattr(self.form, 'field_css_classes', None)
-        if hasattr(field_css_classes, 'split'):
-            extra_classes.update(field_css_classes.split())
-        elif isinstance(field_css_classes, (list, tuple)):
-            extra_classes.update(field_css_classes)
-        elif isinstance(field_css_classes, dict):
-            extra_field_classes = []
-            for key in ('*', self.name):
-                css_classes = field_css_classes.get(key)
-                if hasattr(css_classes, 'split'):
-                    extra_field_classes = css_classes.split()
-                elif isinstance(css_classes, (list, tuple)):
-                    if '__default__' in css_classes:
-                        css_classes.remove('__default__')
-                        extra_field_classes.extend(css_classes)
-                    else:
-                        extra_field_classes = css_classes
-            extra_classes.update(extra_field_classes)
+        extra_classes.update(css_classes.split())
         return super(NgBoundField, self).css_classes(extra_classes)
 
     def as_widget(self, widget=None, attrs=None, only_initial=False):
@@ -199,7 +453,7 @@ class NgBoundField(BoundField):
         widget._field = self.field
         # Make sure that NgWidgetMixin is not already part of the widget's bases so it doesn't get added twice.
         if not isinstance(widget, NgWidgetMixin):
-            widget.__class__ = type(widget.__class__.__name__, (NgWidgetMixin, widget.__class__), {})
+            widget.__class__ = get_ng_widget_class(widget.__class__)
         return super(NgBoundField, self).as_widget(widget, attrs, only_initial)
 
     def build_widget_attrs(self, attrs, widget=None):
@@ -214,24 +468,14 @@ class NgBoundField(BoundField):
         if self.field.render_label is False:
             return ''  # label shall be rendered by the widget
         attrs = attrs or {}
-        css_classes = getattr(self.field, 'label_css_classes', None)
-        if hasattr(css_classes, 'split'):
-            css_classes = css_classes.split()
-        css_classes = set(css_classes or [])
-        label_css_classes = getattr(self.form, 'label_css_classes', None)
-        if hasattr(label_css_classes, 'split'):
-            css_classes.update(label_css_classes.split())
-        elif isinstance(label_css_classes, (list, tuple)):
-            css_classes.update(label_css_classes)
-        elif isinstance(label_css_classes, dict):
-            for key in (self.name, '*',):
-                extra_label_classes = label_css_classes.get(key)
-                if hasattr(extra_label_classes, 'split'):
-                    extra_label_classes = extra_label_classes.split()
-                extra_label_classes = set(extra_label_classes or [])
-                css_classes.update(extra_label_classes)
+        css_classes = self.form.get_css_classes_lookup('label_css_classes').get(self.name)
+        field_css_classes = getattr(self.field, 'label_css_classes', None)
+        if field_css_classes:
+            if hasattr(field_css_classes, 'split'):
+                field_css_classes = field_css_classes.split()
+            css_classes = ' '.join(_unique_css_classes(list(field_css_classes) + css_classes.split()))
         if css_classes:
-            attrs.update({'class': ' '.join(css_classes)})
+            attrs.update({'class': css_classes})
         return super(NgBoundField, self).label_tag(contents, attrs, label_suffix='')
 
 
@@ -244,6 +488,8 @@ class BaseFieldsModifierMetaclass(type):
         attrs.update(formfield_callback=cls.formfield_callback)
         new_class = super(BaseFieldsModifierMetaclass, cls).__new__(cls, name, bases, attrs)
         cls.validate_formfields(new_class)
+        if callable(getattr(new_class, 'prepare_form_class', None)):
+            new_class.prepare_form_class()
         return new_class
 
     @classmethod
@@ -279,19 +525,37 @@ class NgFormBaseMixin(object):
     field_error_css_classes = 'djng-field-errors'
 
     def __init__(self, *args, **kwargs):
-        try:
-            form_name = self.form_name
-        except AttributeError:
-            # if form_name is unset, generate a pseudo unique name, based upon the class name
-            form_name = b64encode(self.__class__.__name__.encode()).rstrip(b'=').decode('utf-8')
-        self.form_name = kwargs.pop('form_name', form_name)
+        self.form_name = kwargs.pop('form_name', None) or getattr(self, 'form_name', None) \
+            or self.get_default_form_name()
         error_class = kwargs.pop('error_class', TupleErrorList)
         kwargs.setdefault('error_class', error_class)
         super(NgFormBaseMixin, self).__init__(*args, **kwargs)
         if isinstance(self.data, QueryDict):
-            self.data = self.rectify_multipart_form_data(self.data.copy())
+            self.data = self.rectify_multipart_form_data(self.data)
         elif isinstance(self.data, dict) and self.data:
-            self.data = self.rectify_ajax_form_data(self.data.copy())
+            self.data = self.rectify_ajax_form_data(self.data)
+
+    @classmethod
+    def prepare_form_class(cls):
+        """
+        Compute the values derived from the form class, rather than from its instances. This is
+        invoked by the metaclass, whenever a form class is created. Forms using another metaclass
+        compute these values on first usage.
+        """
+        cls.get_default_form_name()
+        cls.get_multi_value_fields()
+
+    @classmethod
+    def get_default_form_name(cls):
+        """
+        Return the form name used if the attribute ``form_name`` is unset. This is a pseudo unique
+        name, based upon the class name, and computed only once per form class.
+        """
+        form_name = cls.__dict__.get('_default_form_name')
+        if form_name is None:
+            form_name = b64encode(cls.__name__.encode()).rstrip(b'=').decode('utf-8')
+            setattr(cls, '_default_form_name', form_name)
+        return form_name
 
     def __getitem__(self, name):
         "Returns a NgBoundField with the given name."
@@ -299,7 +563,40 @@ class NgFormBaseMixin(object):
             field = self.fields[name]
         except KeyError:
             raise KeyError('Key %r not found in Form' % name)
-        return NgBoundField(self, field, name)
+        try:
+            return self._bound_fields_cache[name]
+        except KeyError:
+            bound_field = self._bound_fields_cache[name] = NgBoundField(self, field, name)
+            return bound_field
+
+    def full_clean(self):
+        """
+        Invalidate the errors cached for rendering, since they may have changed after validation.
+        """
+        super(NgFormBaseMixin, self).full_clean()
+        self._hidden_field_errors = None
+        for bound_field in self._bound_fields_cache.values():
+            bound_field.__dict__.pop('_errors_cache', None)
+
+    def get_css_classes_lookup(self, attr):
+        """
+        Return the ``CssClassesLookup`` for the CSS classes declared by the attribute ``attr``.
+        It is created only once per form class and re-created if that declaration is replaced.
+        """
+        declaration = getattr(self, attr, None)
+        lookups = self.__class__.__dict__.get('_css_classes_lookups')
+        if lookups is None:
+            lookups = {}
+            setattr(self.__class__, '_css_classes_lookups', lookups)
+        try:
+            cached_declaration, lookup = lookups[attr]
+            if cached_declaration is declaration:
+                return lookup
+        except KeyError:
+            pass
+        lookup = CssClassesLookup(declaration, merge_default=(attr == 'label_css_classes'))
+        lookups[attr] = (declaration, lookup)
+        return lookup
 
     def add_prefix(self, field_name):
         """
@@ -318,16 +615,26 @@ class NgFormBaseMixin(object):
         return self.error_class([SafeTuple(
             (identifier, self.field_error_css_classes, '$pristine', '$pristine', 'invalid', e)) for e in errors])
 
+    def get_hidden_field_errors(self):
+        """
+        Return the errors of hidden fields, to be rendered as non-field errors.
+        They are computed only once per validation of this form.
+        """
+        if getattr(self, '_hidden_field_errors', None) is None:
+            hidden_field_errors = []
+            for name in self.fields.keys():
+                bf = self[name]
+                if not bf.is_hidden:
+                    continue
+                hidden_field_errors.extend(SafeTuple(
+                    (self.form_name, self.form_error_css_classes, '$pristine', '{}.$isEmpty()'.format(name), 'invalid',
+                        '(Hidden field {}) {}'.format(name, e[5]))) for e in bf.errors)
+            self._hidden_field_errors = hidden_field_errors
+        return self._hidden_field_errors
+
     def non_field_errors(self):
         # See TupleErrorList.extend for an explanation
-        hidden_field_errors = []
-        for name, field in self.fields.items():
-            bf = self[name]
-            bf_errors = [conditional_escape(error) for error in bf.errors]
-            if bf.is_hidden and bf_errors:
-                hidden_field_errors += [SafeTuple(
-                    (self.form_name, self.form_error_css_classes, '$pristine', '{}.$isEmpty()'.format(name), 'invalid',
-                        '(Hidden field {}) {}'.format(name, e[5])) ) for e in bf_errors]
+        hidden_field_errors = self.get_hidden_field_errors()
         errors = super(NgFormBaseMixin, self).non_field_errors()
         return self.error_class(hidden_field_errors + [SafeTuple(
             (self.form_name, self.form_error_css_classes, '$pristine', '$pristine', 'invalid', e)) for e in errors])
@@ -345,26 +652,122 @@ class NgFormBaseMixin(object):
                     attrs.update({'class': widget_classes})
         return attrs
 
+    def get_field_schema(self, bound_field):
+        """
+        Return a dictionary describing a field, its widget, choices, client side validation rules
+        and error messages. Shall be extended by derived forms to add their own properties.
+        """
+        field = bound_field.field
+        # potential errors must be determined first, since this adds the validation attributes to the widget
+        potential_errors = field.get_potential_errors()
+        widget = field.widget
+        schema = {
+            'name': bound_field.name,
+            'identifier': self.add_prefix(bound_field.name),
+            'label': force_text(bound_field.label),
+            'help_text': force_text(field.help_text),
+            'required': field.required,
+            'initial': self.get_initial_for_field(field, bound_field.name),
+            'widget': {
+                'type': widget.__class__.__name__,
+                'input_type': getattr(widget, 'input_type', None),
+                'is_hidden': widget.is_hidden,
+                'multiple': getattr(widget, 'allow_multiple_selected', False),
+                'attrs': {key: force_text(val) if isinstance(val, Promise) else val
+                          for key, val in widget.attrs.items()},
+            },
+            'validation': [{'key': key, 'message': force_text(msg)} for key, msg in potential_errors],
+            'error_messages': {code: force_text(msg) for code, msg in field.error_messages.items()},
+        }
+        if hasattr(field, 'choices'):
+            schema['choices'] = self.get_choices_schema(field.choices)
+        return schema
+
+    def get_choices_schema(self, choices):
+        choices_schema = []
+        for value, label in choices:
+            if isinstance(label, (list, tuple)):
+                choices_schema.append({'label': force_text(value), 'choices': self.get_choices_schema(label)})
+            else:
+                choices_schema.append({'value': getattr(value, 'value', value), 'label': force_text(label)})
+        return choices_schema
+
+    def get_schema_data(self):
+        """
+        Return a dictionary describing this form, so that it can be rendered and validated by the client.
+        """
+        return {
+            'form_name': self.form_name,
+            'fields': [self.get_field_schema(self[name]) for name in self.fields.keys()],
+        }
+
+    def as_schema(self):
+        """
+        Return the schema of this form serialized as JSON.
+        """
+        return json.dumps(self.get_schema_data(), cls=DjangoJSONEncoder)
+
+    @classmethod
+    def get_multi_value_fields(cls):
+        """
+        Return a dictionary of fields, whose values are submitted through multipart requests using
+        one key per value, named ``<field name>.<value>``. Each name is mapped onto a tuple of the
+        field and a flag, telling whether that field still implements the deprecated method
+        ``implode_multi_values(name, data)``. It is computed only once per form class.
+        """
+        multi_value_fields = cls.__dict__.get('_multi_value_fields')
+        if multi_value_fields is None:
+            multi_value_fields = OrderedDict()
+            for name, field in cls.base_fields.items():
+                implode = getattr(type(field), 'implode_multi_values', None)
+                if callable(getattr(field, 'get_multi_values', None)):
+                    multi_value_fields[name] = (field, implode is not MultipleChoiceField.implode_multi_values)
+                elif callable(implode):
+                    multi_value_fields[name] = (field, True)
+            setattr(cls, '_multi_value_fields', multi_value_fields)
+        return multi_value_fields
+
     def rectify_multipart_form_data(self, data):
         """
         If a widget was converted and the Form data was submitted through a multipart request,
-        then these data fields must be converted to suit the Django Form validation
+        then these data fields must be converted to suit the Django Form validation.
+        The submitted keys are grouped by field name in one pass, and the submitted data is copied
+        only once, so that the returned ``QueryDict`` is mutable.
         """
-        for name, field in self.base_fields.items():
-            try:
-                field.implode_multi_values(name, data)
-            except AttributeError:
-                pass
-        return data
+        multi_value_fields = self.get_multi_value_fields()
+        grouped_keys = OrderedDict()
+        for key in data.keys() if multi_value_fields else ():
+            pos = key.find('.')
+            while pos > 0:
+                if key[:pos] in multi_value_fields and not multi_value_fields[key[:pos]][1]:
+                    grouped_keys.setdefault(key[:pos], []).append(key)
+                    break
+                pos = key.find('.', pos + 1)
+        if grouped_keys:
+            imploded_keys = set(key for keys in grouped_keys.values() for key in keys)
+            rectified = QueryDict(mutable=True, encoding=data.encoding)
+            for key, values in data.lists():
+                if key not in imploded_keys:
+                    rectified.setlist(key, values)
+            for name, keys in grouped_keys.items():
+                rectified.setlist(name, multi_value_fields[name][0].get_multi_values(data, keys))
+        else:
+            rectified = data.copy()
+        for name, (field, legacy) in multi_value_fields.items():
+            if legacy:
+                warnings.warn("{}.implode_multi_values(name, data) is deprecated, implement "
+                              "get_multi_values(data, keys) instead.".format(field.__class__.__name__),
+                              DeprecationWarning)
+                field.implode_multi_values(name, rectified)
+        return rectified
 
     def rectify_ajax_form_data(self, data):
         """
         If a widget was converted and the Form data was submitted through an Ajax request,
-        then these data fields must be converted to suit the Django Form validation
+        then these data fields must be converted to suit the Django Form validation.
+        Instead of copying the submitted data, a ``FormDataView`` is returned, which strips the
+        form's prefix and converts the values lazily, when they are read.
         """
-        for name, field in self.base_fields.items():
-            try:
-                data[name] = field.convert_ajax_data(data.get(name, {}))
-            except AttributeError:
-                pass
-        return data
+        converters = {self.add_prefix(name): field for name, field in self.base_fields.items()
+                      if callable(getattr(field, 'convert_ajax_data', None))}
+        return FormDataView(data, converters, prefix=self.prefix)
@@ -0,0 +1,118 @@
+from hashlib import md5
+
+from django.core.cache import caches, DEFAULT_CACHE_ALIAS
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.forms.fields import CallableChoiceIterator
+from django.forms.models import ModelChoiceField
+from django.utils.encoding import force_text
+from django.utils.safestring import mark_safe
+from django.utils.translation import get_language
+
+from djng import __version__
+
+
+class NgFormCacheMixin(object):
+    """
+    Add this NgFormCacheMixin to a form class derived from ``NgForm``, ``NgModelForm`` or one of their
+    Bootstrap3 counterparts, to cache the markup rendered by ``as_div()``, ``as_p()``, ``as_ul()``
+    and ``as_table()`` and the schema exported by ``as_schema()``, while the form is unbound and
+    does not contain any initial data.
+
+    The cache key is build from the form class, its ``form_name``, ``scope_prefix``, renderer,
+    ``error_class``, the current language and a hash over the declared fields. Per request values,
+    such as the initial data for the Angular controller, must therefore not be passed into the form,
+    but should be injected through an Angular binding, for instance ``ng-init``.
+
+    Forms containing a ``ModelChoiceField`` or a field whose choices are provided by a callable,
+    are never cached, since their choices may change at any time. Forms, whose fields are modified
+    in their constructor depending on request specific values, must not use this mixin.
+    """
+    form_cache_alias = DEFAULT_CACHE_ALIAS
+    form_cache_timeout = DEFAULT_TIMEOUT
+    form_cache_version = None
+
+    @classmethod
+    def get_form_version(cls):
+        """
+        Return a hash over the declared fields of this form class. It changes whenever one of its
+        fields, widgets, labels or choices is modified, so that outdated markup is never rendered.
+        It is computed only once per form class.
+        """
+        form_version = cls.__dict__.get('_form_version')
+        if form_version is None:
+            parts = [__version__, cls.__module__, cls.__qualname__, force_text(cls.form_cache_version)]
+            for name, field in cls.base_fields.items():
+                if cls.has_dynamic_choices(field):
+                    continue
+                parts.extend([
+                    name,
+                    field.__class__.__name__,
+                    field.widget.__class__.__name__,
+                    repr(sorted((k, force_text(v)) for k, v in field.widget.attrs.items())),
+                    force_text(field.label),
+                    force_text(field.help_text),
+                    repr(field.required),
+                    repr(field.initial),
+                    repr([(k, force_text(v)) for k, v in getattr(field, 'choices', [])]),
+                ])
+            form_version = md5('\n'.join(parts).encode('utf-8')).hexdigest()
+            setattr(cls, '_form_version', form_version)
+        return form_version
+
+    @staticmethod
+    def has_dynamic_choices(field):
+        return isinstance(field, ModelChoiceField) or \
+            isinstance(getattr(field, 'choices', None), CallableChoiceIterator)
+
+    def get_form_cache_key(self, render_format):
+        """
+        Return the cache key for the markup of this unbound form rendered using ``render_format``,
+        or ``None`` if this form must not be cached.
+        """
+        if self.is_bound or self.initial:
+            return None
+        for field in self.fields.values():
+            if callable(field.initial) or self.has_dynamic_choices(field):
+                return None
+        parts = [
+            self.get_form_version(),
+            self.form_name,
+            force_text(getattr(self, 'scope_prefix', None)),
+            repr(sorted(getattr(self, 'ng_directives', {}).items())),
+            force_text(get_language()),
+            force_text(self.prefix),
+            force_text(self.auto_id),
+            force_text(self.label_suffix),
+            repr(self.use_required_attribute),
+            '{0.__module__}.{0.__qualname__}'.format(type(self.renderer)),
+            '{0.__module__}.{0.__qualname__}'.format(self.error_class),
+            repr(list(self.fields.keys())),
+            render_format,
+        ]
+        digest = md5('\n'.join(parts).encode('utf-8')).hexdigest()
+        return 'djng:form:{}.{}:{}'.format(self.__class__.__module__, self.__class__.__qualname__, digest)
+
+    def _html_output(self, normal_row, error_row, row_ender, help_text_html, errors_on_separate_row):
+        render_format = '\n'.join([normal_row, error_row, row_ender, help_text_html, repr(errors_on_separate_row)])
+        cache_key = self.get_form_cache_key(render_format)
+        if cache_key is None:
+            return super(NgFormCacheMixin, self)._html_output(
+                normal_row, error_row, row_ender, help_text_html, errors_on_separate_row)
+        cache = caches[self.form_cache_alias]
+        html_output = cache.get(cache_key)
+        if html_output is None:
+            html_output = super(NgFormCacheMixin, self)._html_output(
+                normal_row, error_row, row_ender, help_text_html, errors_on_separate_row)
+            cache.set(cache_key, str(html_output), self.form_cache_timeout)
+        return mark_safe(html_output)
+
+    def as_schema(self):
+        cache_key = self.get_form_cache_key('as_schema')
+        if cache_key is None:
+            return super(NgFormCacheMixin, self).as_schema()
+        cache = caches[self.form_cache_alias]
+        schema = cache.get(cache_key)
+        if schema is None:
+            schema = super(NgFormCacheMixin, self).as_schema()
+            cache.set(cache_key, schema, self.form_cache_timeout)
+        return schema
@@ -0,0 +1,96 @@
+from collections import OrderedDict
+
+from django.core.exceptions import ValidationError
+
+
+class NgFormsSet(object):
+    """
+    Container for a set of forms inheriting from ``NgModelFormMixin``, which are rendered inside the
+    ``djng-forms-set`` directive and hence submitted altogether using one JSON payload.
+
+    The payload is dispatched to each form using its ``scope_prefix``. Before validation, the
+    submitted values of ``ModelChoiceField``-s sharing the same queryset are looked up using one
+    database query for all forms, rather than one query per field. The errors of all forms are
+    combined into one document, keyed by each form's ``form_name``.
+    """
+    def __init__(self, form_classes, data=None, **kwargs):
+        self.data = data
+        self.forms = OrderedDict()
+        for form_class in form_classes:
+            form = form_class(data=self.get_form_data(form_class), **kwargs)
+            if form.form_name in self.forms:
+                raise ValueError("Form name '{}' is used more than once in this forms set".format(form.form_name))
+            self.forms[form.form_name] = form
+
+    def __iter__(self):
+        return iter(self.forms.values())
+
+    def __getitem__(self, form_name):
+        return self.forms[form_name]
+
+    @property
+    def is_bound(self):
+        return self.data is not None
+
+    def get_form_data(self, form_class):
+        """
+        Return the part of the submitted payload, which belongs to the given form class.
+        """
+        if self.data is None:
+            return None
+        if form_class.scope_prefix:
+            return self.data.get(form_class.scope_prefix, {})
+        return self.data
+
+    def prefetch_choices(self):
+        """
+        Look up the model instances for the submitted values of all fields supporting prefetching,
+        such as ``djng.forms.fields.ModelChoiceField``, using one query per distinct queryset.
+        Values which have not been prefetched, are validated by the field itself.
+        """
+        groups = OrderedDict()
+        for form in self:
+            for name, field in form.fields.items():
+                if field.disabled or not hasattr(field, 'get_prefetch_key'):
+                    continue
+                prefetch_key = field.get_prefetch_key()
+                if prefetch_key is None:
+                    continue
+                queryset, values, fields = groups.setdefault(prefetch_key, (field.queryset, set(), []))
+                value = field.widget.value_from_datadict(form.data, form.files, form.add_prefix(name))
+                if value not in field.empty_values and not isinstance(value, (list, tuple, dict)):
+                    values.add(str(value))
+                fields.append(field)
+
+        for (model, key, _), (queryset, values, fields) in groups.items():
+            if len(fields) < 2 or not values:
+                continue
+            try:
+                instances = list(queryset.filter(**{'{}__in'.format(key): values}))
+            except (ValueError, TypeError, ValidationError):
+                continue  # at least one value is malformed, let each field report its own error
+            prefetched_choices = {str(getattr(instance, key)): instance for instance in instances}
+            for field in fields:
+                field.prefetched_choices = prefetched_choices
+
+    def is_valid(self):
+        """
+        Return ``True`` if all forms of this set are valid. All forms are validated, so that the
+        errors of each of them can be reported.
+        """
+        if not self.is_bound:
+            return False
+        self.prefetch_choices()
+        return all([form.is_valid() for form in self])
+
+    @property
+    def errors(self):
+        return OrderedDict((form.form_name, form.errors) for form in self)
+
+    def errors_as_json_data(self):
+        """
+        Return the errors of all forms of this set, suitable for the Angular controller, which
+        handles the response of a rejected submission:
+        ``JsonResponse(forms_set.errors_as_json_data(), status=422)``.
+        """
+        return {form.form_name: form.errors_as_json_data() for form in self}
@@ -1,6 +1,26 @@
+from functools import lru_cache
+from types import MappingProxyType
+
+from django.core.exceptions import ValidationError
 from django.forms.utils import ErrorDict
+from django.utils.encoding import force_text
 from django.utils.html import format_html
-from djng.forms.angular_base import NgFormBaseMixin, SafeTuple
+from djng.forms.angular_base import FormDataView, NgFormBaseMixin, SafeTuple
+
+
+@lru_cache(maxsize=4096)
+def _compile_ng_field_attrs(name, identifier, scope_prefix, is_ng_model, ng_directives):
+    ng = {
+        'name': name,
+        'identifier': identifier,
+        'model': ('%s[\'%s\']' % (scope_prefix, identifier)) if scope_prefix else identifier
+    }
+    attrs = {}
+    if is_ng_model:
+        attrs['ng-model'] = ng['model']
+    for key, fmtstr in ng_directives:
+        attrs[key] = fmtstr % ng
+    return MappingProxyType(attrs)
 
 
 class NgModelFormMixin(NgFormBaseMixin):
@@ -21,14 +41,11 @@ class NgModelFormMixin(NgFormBaseMixin):
             if key.startswith('ng_'):
                 fmtstr = kwargs.pop(key)
                 self.ng_directives[key.replace('_', '-')] = fmtstr
-        if hasattr(self, 'Meta') and hasattr(self.Meta, 'ng_models'):
-            if not isinstance(getattr(self.Meta, 'ng_models'), list):
-                raise TypeError('Meta.ng_model is not of type list')
-        elif 'ng-model' not in self.ng_directives:
+        if self.get_ng_models() is None and 'ng-model' not in self.ng_directives:
             self.ng_directives['ng-model'] = '%(model)s'
         super(NgModelFormMixin, self).__init__(*args, **kwargs)
         self.prefix = kwargs.get('prefix')
-        if self.prefix and self.data:
+        if self.prefix and self.data and not isinstance(self.data, FormDataView):
             if self.data.get(self.prefix):
                 self.data = {self.add_prefix(name): value for (name, value) in self.data.get(self.prefix).items()}
             else:
@@ -36,6 +53,35 @@ class NgModelFormMixin(NgFormBaseMixin):
         if self.scope_prefix == self.form_name:
             raise ValueError("The form's name may not be identical with its scope_prefix")
 
+    @classmethod
+    def prepare_form_class(cls):
+        super(NgModelFormMixin, cls).prepare_form_class()
+        try:
+            cls.get_ng_models()
+        except TypeError:
+            pass  # reported, when the form is instantiated
+
+    @classmethod
+    def get_ng_models(cls):
+        """
+        Return the set of field names declared in ``Meta.ng_models``, or ``None`` if that list is
+        not declared, meaning that all fields are bound to an Angular model. This is computed only
+        once per form class.
+        """
+        try:
+            return cls.__dict__['_ng_models']
+        except KeyError:
+            pass
+        meta = getattr(cls, 'Meta', None)
+        if meta is not None and hasattr(meta, 'ng_models'):
+            if not isinstance(meta.ng_models, list):
+                raise TypeError('Meta.ng_model is not of type list')
+            ng_models = frozenset(meta.ng_models)
+        else:
+            ng_models = None
+        setattr(cls, '_ng_models', ng_models)
+        return ng_models
+
     def _post_clean(self):
         """
         Rewrite the error dictionary, so that its keys correspond to the model fields.
@@ -44,6 +90,40 @@ class NgModelFormMixin(NgFormBaseMixin):
         if self._errors and self.prefix:
             self._errors = ErrorDict((self.add_prefix(name), value) for name, value in self._errors.items())
 
+    def errors_as_json_data(self):
+        """
+        Return a dictionary containing a list of error messages for each rejected field, suitable
+        for the Angular controller, which handles the response of a rejected form submission:
+        ``JsonResponse({form.form_name: form.errors_as_json_data()}, status=422)``.
+        The keys of this dictionary are the prefixed field names. In contrast to serializing
+        ``form.errors``, the error messages are resolved in one pass and lazy translations shared
+        by many fields are evaluated only once.
+        """
+        translated = {}
+
+        def translate(message):
+            try:
+                return translated[id(message)][1]
+            except KeyError:
+                text = force_text(message)
+                translated[id(message)] = message, text  # keep a reference, so that id() remains unique
+                return text
+
+        json_data = {}
+        for name, errors in self.errors.items():
+            messages = []
+            for error in getattr(errors, 'data', errors):
+                if isinstance(error, ValidationError):
+                    for error in error.error_list:
+                        if error.params:
+                            messages.append(force_text(error.message % error.params))
+                        else:
+                            messages.append(translate(error.message))
+                else:
+                    messages.append(translate(error))
+            json_data[name] = messages
+        return json_data
+
     def get_initial_data(self):
         """
         Return a dictionary specifying the defaults for this form. This dictionary can be used to
@@ -51,7 +131,7 @@ class NgModelFormMixin(NgFormBaseMixin):
         ``ng-init={{ thisform.get_initial_data|js|safe }}``.
         """
         data = {}
-        ng_models = hasattr(self, 'Meta') and getattr(self.Meta, 'ng_models', []) or []
+        ng_models = self.get_ng_models() or ()
         for name, field in self.fields.items():
             if 'ng-model' in self.ng_directives or name in ng_models:
                 data[name] = self.initial.get(name) if self.initial else field.initial
@@ -70,16 +150,33 @@ class NgModelFormMixin(NgFormBaseMixin):
         errors.append(SafeTuple((self.form_name, self.form_error_css_classes, '$pristine', '$error.rejected', 'invalid', '$message')))
         return errors
 
+    def get_field_schema(self, bound_field):
+        schema = super(NgModelFormMixin, self).get_field_schema(bound_field)
+        identifier = self.add_prefix(bound_field.name)
+        if 'ng-model' in self.ng_directives or bound_field.name in (self.get_ng_models() or ()):
+            schema['model'] = ('%s[\'%s\']' % (self.scope_prefix, identifier)) if self.scope_prefix else identifier
+        return schema
+
+    def get_schema_data(self):
+        schema = super(NgModelFormMixin, self).get_schema_data()
+        schema['scope_prefix'] = self.scope_prefix
+        return schema
+
+    def get_ng_field_attrs(self, name):
+        """
+        Return a read-only mapping with the attributes added by the Angular directives to the widget
+        of the field named ``name``. The directive's format strings are applied only once for each
+        combination of field, prefixes and directives, and shared between form instances.
+        """
+        identifier = self.add_prefix(name)
+        is_ng_model = name in (self.get_ng_models() or ())
+        ng_directives = tuple(self.ng_directives.items())
+        try:
+            return _compile_ng_field_attrs(name, identifier, self.scope_prefix, is_ng_model, ng_directives)
+        except TypeError:  # unhashable directive
+            return _compile_ng_field_attrs.__wrapped__(name, identifier, self.scope_prefix, is_ng_model, ng_directives)
+
     def update_widget_attrs(self, bound_field, attrs):
         super(NgModelFormMixin, self).update_widget_attrs(bound_field, attrs)
-        identifier = self.add_prefix(bound_field.name)
-        ng = {
-            'name': bound_field.name,
-            'identifier': identifier,
-            'model': ('%s[\'%s\']' % (self.scope_prefix, identifier)) if self.scope_prefix else identifier
-        }
-        if hasattr(self, 'Meta') and bound_field.name in getattr(self.Meta, 'ng_models', []):
-            attrs['ng-model'] = ng['model']
-        for key, fmtstr in self.ng_directives.items():
-            attrs[key] = fmtstr % ng
+        attrs.update(self.get_ng_field_attrs(bound_field.name))
         return attrs
@@ -1,19 +1,38 @@
-import re
+import copy
+import json
 import mimetypes
+import operator
+import os
+import re
+import threading
+import uuid
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from base64 import b64encode
+from functools import reduce
+from hashlib import md5, sha256
+from io import BytesIO
 
 from django.conf import settings
 from django.contrib.staticfiles.storage import staticfiles_storage
 from django.core import signing
-from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.core.cache import caches, DEFAULT_CACHE_ALIAS
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.exceptions import EmptyResultSet, ImproperlyConfigured, ValidationError
+from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
 from django.core.files.uploadedfile import InMemoryUploadedFile, TemporaryUploadedFile
+from django.db.models import Q
 from django.urls import reverse_lazy
 from django.forms import fields, models as model_fields, widgets
+from django.utils.encoding import force_text
+from django.utils.http import urlencode
 from django.utils.html import format_html
 from django.utils.safestring import mark_safe
-from django.utils.translation import ugettext_lazy as _, ungettext_lazy
+from django.utils.translation import get_language, ugettext_lazy as _, ungettext_lazy
 
 from djng import app_settings
+from djng.core.uploadhandler import UploadPolicy
 from .widgets import DropFileWidget, DropImageWidget
 
 
@@ -283,8 +302,190 @@ class ChoiceField(RadioFieldMixin, fields.ChoiceField):
         return context
 
 
-class ModelChoiceField(RadioFieldMixin, model_fields.ModelChoiceField):
-    pass
+class CachedModelChoiceIterator(model_fields.ModelChoiceIterator):
+    """
+    Iterate over the choices of a model choice field, which have been cached by
+    ``ModelChoicesMixin.get_cached_choices()`` rather than querying the database.
+    """
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        for choice in self.field.get_cached_choices():
+            yield choice
+
+    def __len__(self):
+        return len(self.field.get_cached_choices()) + (1 if self.field.empty_label is not None else 0)
+
+    def __bool__(self):
+        return self.field.empty_label is not None or bool(self.field.get_cached_choices())
+
+
+class RemoteModelChoiceIterator(model_fields.ModelChoiceIterator):
+    """
+    Iterate over the choices of a model choice field, whose options are loaded by the client.
+    Only the options for the selected values are rendered, see
+    ``ModelChoicesMixin.update_widget_rendering_context()``.
+    """
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+
+    def __len__(self):
+        return 1 if self.field.empty_label is not None else 0
+
+    def __bool__(self):
+        return self.field.empty_label is not None
+
+
+class ModelChoicesMixin(object):
+    """
+    Add choice caching and lazy choice loading to ``ModelChoiceField`` and
+    ``ModelMultipleChoiceField``.
+
+    With ``cache_choices=True``, the rendered options are built from a list of ``(value, label)``
+    tuples, which is stored in the cache for ``cache_timeout`` seconds. Pass another
+    ``cache_version`` to invalidate them, for instance after the underlying table has been modified.
+
+    With ``remote_choices=True``, only the options for the selected values are rendered. All other
+    options are loaded by the client through the remote method ``fetch_choices`` of a view
+    inheriting from ``djng.views.mixins.RemoteChoicesMixin``, filtered by ``search_fields`` and
+    paginated by ``remote_page_size``.
+    """
+    choices_cache_alias = DEFAULT_CACHE_ALIAS
+    remote_page_size = 50
+
+    def __init__(self, queryset, cache_choices=False, cache_timeout=DEFAULT_TIMEOUT, cache_version=None,
+                 remote_choices=False, search_fields=(), **kwargs):
+        self.cache_choices = cache_choices
+        self.cache_timeout = cache_timeout
+        self.cache_version = cache_version
+        self.remote_choices = remote_choices
+        self.search_fields = search_fields
+        super(ModelChoicesMixin, self).__init__(queryset, **kwargs)
+        if remote_choices and not isinstance(self.widget, widgets.Select):
+            raise ImproperlyConfigured("Remote choices can only be loaded into a select widget.")
+
+    def _get_choices(self):
+        if not hasattr(self, '_choices'):
+            if self.remote_choices:
+                return RemoteModelChoiceIterator(self)
+            if self.cache_choices:
+                return CachedModelChoiceIterator(self)
+        return super(ModelChoicesMixin, self)._get_choices()
+
+    choices = property(_get_choices, fields.ChoiceField._set_choices)
+
+    def get_choices_cache_key(self):
+        parts = [
+            self.queryset.model._meta.label,
+            self.to_field_name or 'pk',
+            '{}.{}'.format(self.__class__.__module__, self.__class__.__qualname__),
+            force_text(get_language()),
+            str(self.queryset.query),
+        ]
+        digest = md5('\n'.join(parts).encode('utf-8')).hexdigest()
+        return 'djng:choices:{}:{}'.format(self.queryset.model._meta.label_lower, digest)
+
+    def get_cached_choices(self):
+        """
+        Return the list of ``(value, label)`` tuples for all instances of this field's queryset.
+        This list is retrieved from the cache and rebuilt only after it has expired.
+        """
+        try:
+            return self._cached_choices
+        except AttributeError:
+            pass
+        try:
+            cache_key = self.get_choices_cache_key()
+        except EmptyResultSet:
+            self._cached_choices = []
+            return self._cached_choices
+        cache = caches[self.choices_cache_alias]
+        cached_choices = cache.get(cache_key, version=self.cache_version)
+        if cached_choices is None:
+            cached_choices = [
+                (self.prepare_value(obj), force_text(self.label_from_instance(obj)))
+                for obj in self.queryset.iterator()
+            ]
+            cache.set(cache_key, cached_choices, self.cache_timeout, version=self.cache_version)
+        self._cached_choices = cached_choices
+        return cached_choices
+
+    def get_selected_choices(self, values):
+        """
+        Return the list of ``(value, label)`` tuples for the given values, using one query.
+        """
+        values = [value for value in values if value not in self.empty_values]
+        if not values:
+            return []
+        key = self.to_field_name or 'pk'
+        try:
+            instances = self.queryset.filter(**{'{}__in'.format(key): values})
+            return [(self.prepare_value(obj), self.label_from_instance(obj)) for obj in instances]
+        except (ValueError, TypeError, ValidationError):
+            return []
+
+    def fetch_choices(self, search='', page=1):
+        """
+        Return a page of choices, optionally filtered by ``search``, serializable as JSON.
+        The lookups used for filtering are declared through ``search_fields``, for instance
+        ``search_fields=['name__istartswith']``.
+        """
+        queryset = self.queryset
+        if search and self.search_fields:
+            queryset = queryset.filter(reduce(operator.or_, [Q(**{lookup: search}) for lookup in self.search_fields]))
+        try:
+            page = max(int(page), 1)
+        except (ValueError, TypeError):
+            page = 1
+        offset = (page - 1) * self.remote_page_size
+        instances = list(queryset[offset:offset + self.remote_page_size + 1])
+        return {
+            'choices': [{'value': self.prepare_value(obj), 'label': self.label_from_instance(obj)}
+                        for obj in instances[:self.remote_page_size]],
+            'has_more': len(instances) > self.remote_page_size,
+        }
+
+    def update_widget_attrs(self, bound_field, attrs):
+        attrs = super(ModelChoicesMixin, self).update_widget_attrs(bound_field, attrs)
+        if self.remote_choices:
+            attrs['djng-remote-choices'] = '{}.{}'.format(bound_field.form.form_name, bound_field.name)
+        return attrs
+
+    def update_widget_rendering_context(self, context):
+        if self.remote_choices:
+            widget = copy.copy(self.widget)
+            widget.choices = list(RemoteModelChoiceIterator(self))
+            widget.choices.extend(self.get_selected_choices(context['widget']['value']))
+            context['widget']['optgroups'] = widget.optgroups(
+                context['widget']['name'], context['widget']['value'], context['widget']['attrs'])
+        return context
+
+
+class ModelChoiceField(ModelChoicesMixin, RadioFieldMixin, model_fields.ModelChoiceField):
+    prefetched_choices = None
+
+    def get_prefetch_key(self):
+        """
+        Return a key identifying the queryset of this field, or ``None`` if it can not be shared.
+        The submitted values of fields with the same key, but belonging to different forms, are
+        looked up using one database query, see ``NgFormsSet.prefetch_choices()``.
+        """
+        try:
+            return self.queryset.model, self.to_field_name or 'pk', str(self.queryset.query)
+        except EmptyResultSet:
+            return None
+
+    def to_python(self, value):
+        if self.prefetched_choices is not None and value not in self.empty_values:
+            key = self.to_field_name or 'pk'
+            if isinstance(value, self.queryset.model):
+                value = getattr(value, key)
+            try:
+                return self.prefetched_choices[str(value)]
+            except KeyError:
+                pass  # not prefetched, let Django's implementation decide
+        return super(ModelChoiceField, self).to_python(value)
 
 
 class TypedChoiceField(RadioFieldMixin, fields.TypedChoiceField):
@@ -319,14 +520,24 @@ class MultipleChoiceField(MultipleFieldMixin, fields.MultipleChoiceField):
         bound_field.form.update_widget_attrs(bound_field, attrs)
         return attrs
 
-    def implode_multi_values(self, name, data):
+    def get_multi_values(self, data, keys):
         """
         Due to the way Angular organizes it model, when Form data is sent via a POST request,
         then for this kind of widget, the posted data must to be converted into a format suitable
-        for Django's Form validation.
+        for Django's Form validation. Return the list of values submitted through ``keys``, which
+        are the keys of ``data`` named ``<field name>.<value>``.
+        """
+        return [data.getlist(key)[0] for key in keys]
+
+    def implode_multi_values(self, name, data):
+        """
+        Deprecated in favor of ``get_multi_values()``. Replace the keys ``<name>.<value>`` of the
+        mutable ``data`` by the list of their values, stored under ``name``.
         """
         mkeys = [k for k in data.keys() if k.startswith(name + '.')]
-        mvls = [data.pop(k)[0] for k in mkeys]
+        mvls = self.get_multi_values(data, mkeys)
+        for k in mkeys:
+            data.pop(k)
         if mvls:
             data.setlist(name, mvls)
 
@@ -352,7 +563,7 @@ class MultipleChoiceField(MultipleFieldMixin, fields.MultipleChoiceField):
         return context
 
 
-class ModelMultipleChoiceField(MultipleFieldMixin, model_fields.ModelMultipleChoiceField):
+class ModelMultipleChoiceField(ModelChoicesMixin, MultipleFieldMixin, model_fields.ModelMultipleChoiceField):
     pass
 
 
@@ -370,7 +581,39 @@ class UUIDField(DefaultFieldMixin, fields.UUIDField):
         return errors
 
 
+def _remove_stored_file(path, identity):
+    try:
+        stat = os.stat(path)
+        if (stat.st_dev, stat.st_ino) == identity:
+            os.remove(path)
+    except FileNotFoundError:
+        pass  # file has been moved away, for instance by FileSystemStorage.save()
+
+
+class StoredTemporaryFile(TemporaryUploadedFile):
+    """
+    A file uploaded through the ``FileUploadView``, which is handed over to the form without copying
+    its content into a new temporary file. It remains in the temporary upload storage, until it is
+    moved away by ``FileSystemStorage.save()`` through ``temporary_file_path()``, or otherwise is
+    removed when closed or garbage collected.
+    """
+    def __init__(self, path, name, content_type, size, charset, content_type_extra=None):
+        file = open(path, 'rb')
+        stat = os.fstat(file.fileno())
+        self._finalizer = weakref.finalize(self, _remove_stored_file, path, (stat.st_dev, stat.st_ino))
+        super(TemporaryUploadedFile, self).__init__(file, name, content_type, size, charset, content_type_extra)
+
+    def close(self):
+        try:
+            return self.file.close()
+        finally:
+            self._finalizer()
+
+
 class FileFieldMixin(DefaultFieldMixin):
+    digest_directory = 'sha256'
+    ticket_signer = signing.TimestampSigner(salt='djng.upload-ticket')
+
     def to_python(self, value):
         # handle previously existing file
         try:
@@ -385,13 +628,19 @@ class FileFieldMixin(DefaultFieldMixin):
         # handle new uploaded image
         try:
             obj = ''
-            if ':' in value['temp_name']:
+            temp_name = None
+            if isinstance(value, dict) and value.get('ticket'):
+                temp_name = self.redeem_upload_ticket(value['ticket'])
+            elif ':' in value['temp_name']:
                 temp_name = self.signer.unsign(value['temp_name'])
-                temp_file = self.storage.open(temp_name, 'rb')
+            elif value['temp_name'] == 'delete':
+                self.remove_current(current_file)
+            if temp_name:
                 file_size = self.storage.size(temp_name)
+                self.check_upload_policy(temp_name, value, file_size)
                 if file_size < settings.FILE_UPLOAD_MAX_MEMORY_SIZE:
                     obj = InMemoryUploadedFile(
-                        file=temp_file,
+                        file=self.storage.open(temp_name, 'rb'),
                         field_name=None,
                         name=value['file_name'],
                         charset=value['charset'],
@@ -399,37 +648,259 @@ class FileFieldMixin(DefaultFieldMixin):
                         content_type_extra=value['content_type_extra'],
                         size=file_size,
                     )
+                    if not self.is_shared_temp_file(temp_name):
+                        self.storage.delete(temp_name)
                 else:
-                    obj = TemporaryUploadedFile(
-                        value['file_name'],
-                        value['content_type'],
-                        0,
-                        value['charset'],
-                        content_type_extra=value['content_type_extra'],
-                    )
-                    while True:
-                        chunk = temp_file.read(0x10000)
-                        if not chunk:
-                            break
-                        obj.file.write(chunk)
-                    obj.file.seek(0)
-                    obj.file.size = file_size
-                self.storage.delete(temp_name)
-                self.remove_current(current_file)
-            elif value['temp_name'] == 'delete':
+                    obj = self.handover_temp_file(temp_name, value, file_size)
+                if not self.is_shared_temp_file(temp_name):
+                    self.remove_temp_preview(temp_name)
                 self.remove_current(current_file)
         except signing.BadSignature:
             raise ValidationError("Got bogus upstream data")
+        except ValidationError:
+            raise
         except (IOError, KeyError, TypeError):
             obj = current_file
         except Exception as excp:
             raise ValidationError("File upload failed. {}: {}".format(excp.__class__.__name__, excp))
         return obj
 
+    def pop_upload_attrs(self, accept, kwargs):
+        """
+        Pop the upload options ``chunk_size``, ``direct_upload_url`` and ``max_size`` from the
+        keyword arguments of the field, and return the attributes of its widget, declaring them
+        together with the signed upload policy.
+        """
+        chunk_size = kwargs.pop('chunk_size', app_settings.UPLOAD_CHUNK_SIZE)
+        direct_upload_url = kwargs.pop('direct_upload_url', app_settings.UPLOAD_DIRECT_URL)
+        self.max_size = kwargs.pop('max_size', app_settings.UPLOAD_MAX_SIZE)
+        self.accept = accept
+        attrs = {
+            'accept': accept,
+            'ngf-pattern': accept,
+            'djng-fileupload-policy': UploadPolicy(self.max_size, accept).dumps(),
+        }
+        if chunk_size:
+            attrs['djng-fileupload-chunk-size'] = chunk_size
+        if direct_upload_url:
+            attrs['djng-fileupload-direct-url'] = direct_upload_url
+        return attrs
+
+    def check_upload_policy(self, temp_name, value, file_size):
+        """
+        Enforce the maximum size and the accepted content types of this field on submission, since
+        the policy enforced by ``FileUploadView`` is the one sent by the client. The content type is
+        derived from the name of the stored file, falling back to the one reported by the client.
+        """
+        policy = UploadPolicy(self.max_size, self.accept)
+        if policy.exceeds(file_size):
+            raise ValidationError(policy.get_size_error())
+        content_type = mimetypes.guess_type(temp_name)[0] or value['content_type']
+        if not policy.accepts(content_type, temp_name):
+            raise ValidationError(policy.get_type_error(content_type))
+
+    def handover_temp_file(self, temp_name, value, file_size):
+        """
+        Return a ``TemporaryUploadedFile`` for a large file in the temporary upload storage. If that
+        storage keeps its files on the local file system, the file is used in place, otherwise its
+        content is copied into a new temporary file. Deduplicated files, which may be shared with
+        other uploads, are used through a hard link.
+        """
+        shared = self.is_shared_temp_file(temp_name)
+        try:
+            path = self.storage.path(temp_name)
+            if shared:
+                link_path = '{}.{}'.format(path, uuid.uuid4().hex)
+                os.link(path, link_path)
+                path = link_path
+        except (NotImplementedError, OSError):
+            pass
+        else:
+            return StoredTemporaryFile(path, value['file_name'], value['content_type'], file_size,
+                                       value['charset'], value['content_type_extra'])
+
+        obj = TemporaryUploadedFile(
+            value['file_name'],
+            value['content_type'],
+            0,
+            value['charset'],
+            content_type_extra=value['content_type_extra'],
+        )
+        with self.storage.open(temp_name, 'rb') as temp_file:
+            while True:
+                chunk = temp_file.read(0x10000)
+                if not chunk:
+                    break
+                obj.file.write(chunk)
+        obj.file.seek(0)
+        obj.file.size = file_size
+        if not shared:
+            self.storage.delete(temp_name)
+        return obj
+
+    def redeem_upload_ticket(self, ticket):
+        """
+        Verify the ticket of a file uploaded directly to the storage, and return the name of that
+        file in the temporary upload storage, if its upload has been completed.
+        """
+        ticket = self.load_upload_ticket(ticket)
+        if self.storage.size(ticket['name']) != ticket['size']:
+            raise ValidationError(_("The upload of this file has not been completed."))
+        return ticket['name']
+
     def remove_current(self, filename):
         if filename:
             default_storage.delete(filename)
 
+    def remove_temp_preview(self, temp_name):
+        pass
+
+    @classmethod
+    def is_shared_temp_file(cls, temp_name):
+        return temp_name.startswith(cls.digest_directory + '/')
+
+    @classmethod
+    def get_digest_name(cls, digest, file_name):
+        """
+        Return the name of a deduplicated file in the temporary upload storage.
+        """
+        extension = os.path.splitext(file_name)[1].lower()
+        return '{0}/{1}/{2}{3}'.format(cls.digest_directory, digest[:2], digest, extension)
+
+    @classmethod
+    def compute_digest(cls, file_obj):
+        if getattr(file_obj, 'content_digest', None):
+            return file_obj.content_digest  # computed by StreamingUploadHandler while receiving
+        digest = sha256()
+        for chunk in file_obj.chunks():
+            digest.update(chunk)
+        file_obj.seek(0)
+        return digest.hexdigest()
+
+    @classmethod
+    def store_temp_file(cls, file_obj):
+        """
+        Store an uploaded file in the temporary upload storage and return its name. With
+        ``DJNG_UPLOAD_DEDUPLICATE``, files are stored by the digest of their content, so that
+        uploading the same file again reuses the stored file and its thumbnail.
+        """
+        if app_settings.UPLOAD_DEDUPLICATE:
+            digest_name = cls.get_digest_name(cls.compute_digest(file_obj), file_obj.name)
+            if cls.storage.exists(digest_name):
+                cls.touch_temp_file(digest_name)
+                return digest_name
+            return cls.storage.save(digest_name, file_obj)
+        available_name = cls.storage.get_available_name(file_obj.name)
+        return cls.storage.save(available_name, file_obj)
+
+    @classmethod
+    def deduplicate_temp_file(cls, temp_name, file_name):
+        """
+        Replace a file, which has been written into the temporary upload storage by other means,
+        such as appending chunks to it, by its deduplicated counterpart.
+        """
+        if not app_settings.UPLOAD_DEDUPLICATE or cls.is_shared_temp_file(temp_name):
+            return temp_name
+        with cls.storage.open(temp_name, 'rb') as temp_file:
+            digest_name = cls.get_digest_name(cls.compute_digest(temp_file), file_name)
+            if cls.storage.exists(digest_name):
+                cls.touch_temp_file(digest_name)
+            else:
+                digest_name = cls.storage.save(digest_name, temp_file)
+        cls.storage.delete(temp_name)
+        return digest_name
+
+    @classmethod
+    def touch_temp_file(cls, temp_name):
+        """
+        Update the modification time of a deduplicated file, which is reused by another upload,
+        so that it is not swept away before the form of that upload is submitted. This is only
+        possible for storages on the local file system.
+        """
+        try:
+            os.utime(cls.storage.path(temp_name))
+        except (NotImplementedError, FileNotFoundError):
+            pass
+
+    @classmethod
+    def preview(cls, file_obj, preview_url=None):
+        """
+        Store the uploaded file in the temporary upload storage and return the data required by
+        the client to render a preview and to refer to that file when submitting the form.
+        If ``preview_url`` is given, previews may be generated in the background and served from
+        that URL.
+        """
+        temp_name = cls.store_temp_file(file_obj)
+        return cls.preview_temp_file(temp_name, file_obj.name, file_obj.content_type, file_obj.charset,
+                                     file_obj.content_type_extra, file_size=file_obj.size,
+                                     preview_url=preview_url)
+
+    @classmethod
+    def preview_temp_file(cls, temp_name, file_name, content_type, charset=None, content_type_extra=None,
+                          file_size=None, preview_url=None):
+        """
+        Return the preview data for a file, which already has been written into the temporary upload
+        storage, for instance by appending chunks to it.
+        """
+        return {
+            'url': 'url({})'.format(cls.get_preview_url(temp_name, content_type, preview_url)),
+            'temp_name': cls.signer.sign(temp_name),
+            'file_name': file_name,
+            'file_size': cls.storage.size(temp_name) if file_size is None else file_size,
+            'charset': charset,
+            'content_type': content_type,
+            'content_type_extra': content_type_extra,
+        }
+
+    @classmethod
+    def issue_upload_ticket(cls, file_name, file_size):
+        """
+        Reserve a name in the temporary upload storage for a file of ``file_size`` bytes, which the
+        client uploads directly to the storage endpoint, rather than through ``FileUploadView``.
+        Return the ticket authorizing that upload, signed with its own salt, so that it can not be
+        confused with a signed ``temp_name``.
+        """
+        temp_name = cls.storage.save(cls.storage.get_available_name(file_name), ContentFile(b''))
+        payload = {'name': temp_name, 'size': file_size}
+        return cls.ticket_signer.sign(signing.b64_encode(json.dumps(payload).encode('utf-8')).decode('ascii'))
+
+    @classmethod
+    def load_upload_ticket(cls, ticket, max_age=None):
+        """
+        Return the content of a ticket issued by ``issue_upload_ticket`` as dictionary. Raise
+        ``BadSignature`` if the ticket has been tampered with, or ``SignatureExpired`` if it has
+        been issued more than ``max_age`` seconds ago.
+        """
+        payload = cls.ticket_signer.unsign(ticket, max_age=max_age)
+        try:
+            payload = json.loads(signing.b64_decode(payload.encode('ascii')).decode('utf-8'))
+            return {'name': str(payload['name']), 'size': int(payload['size'])}
+        except (KeyError, TypeError, ValueError):
+            raise signing.BadSignature("Malformed upload ticket")
+
+    @classmethod
+    def preview_upload_ticket(cls, file_name, file_size, content_type, charset=None, preview_url=None):
+        """
+        Issue an upload ticket and return the preview data for the file to be uploaded with it.
+        Since that file has not been received yet, previews rendered from its content are served
+        later on from ``preview_url``.
+        """
+        ticket = cls.issue_upload_ticket(file_name, file_size)
+        temp_name = cls.load_upload_ticket(ticket)['name']
+        return {
+            'url': 'url({})'.format(cls.get_deferred_preview_url(temp_name, content_type, preview_url)),
+            'ticket': ticket,
+            'file_name': file_name,
+            'file_size': file_size,
+            'charset': charset,
+            'content_type': content_type,
+            'content_type_extra': None,
+        }
+
+    @classmethod
+    def get_deferred_preview_url(cls, temp_name, content_type, preview_url=None):
+        return cls.get_preview_url(temp_name, content_type, preview_url)
+
 
 class FileField(FileFieldMixin, fields.FileField):
     storage = app_settings.upload_storage
@@ -439,37 +910,51 @@ class FileField(FileFieldMixin, fields.FileField):
         accept = kwargs.pop('accept', '*/*')
         fileupload_url = kwargs.pop('fileupload_url', reverse_lazy('fileupload'))
         area_label = kwargs.pop('area_label', _("Drop file here or click to upload"))
-        attrs = {
-            'accept': accept,
-            'ngf-pattern': accept,
-        }
+        attrs = self.pop_upload_attrs(accept, kwargs)
         kwargs.update(widget=DropFileWidget(area_label, fileupload_url, attrs=attrs))
         super(FileField, self).__init__(*args, **kwargs)
 
     @classmethod
-    def preview(cls, file_obj):
-        available_name = cls.storage.get_available_name(file_obj.name)
-        temp_name = cls.storage.save(available_name, file_obj)
-        extension = mimetypes.guess_extension(file_obj.content_type)
+    def get_preview_url(cls, temp_name, content_type, preview_url=None):
+        extension = mimetypes.guess_extension(content_type) if content_type else None
         if extension:
             extension = extension[1:]
         else:
             extension = '_blank'
-        icon_url = staticfiles_storage.url('djng/icons/{}.png'.format(extension))
-        return {
-            'url': 'url({})'.format(icon_url),
-            'temp_name': cls.signer.sign(temp_name),
-            'file_name': file_obj.name,
-            'file_size': file_obj.size,
-            'charset': file_obj.charset,
-            'content_type': file_obj.content_type,
-            'content_type_extra': file_obj.content_type_extra,
-        }
+        return staticfiles_storage.url('djng/icons/{}.png'.format(extension))
+
+
+pending_thumbnails = {}
+
+
+def get_image_mime_type(content):
+    from PIL import Image
+
+    try:
+        return Image.MIME.get(Image.open(BytesIO(content)).format, 'application/octet-stream')
+    except IOError:
+        return 'application/octet-stream'
+
+_thumbnail_executor = None
+_thumbnail_executor_lock = threading.Lock()
+
+
+def get_thumbnail_executor():
+    """
+    Return the pool of ``DJNG_THUMBNAIL_WORKERS`` threads, generating thumbnails of uploaded images.
+    """
+    global _thumbnail_executor
+
+    with _thumbnail_executor_lock:
+        if _thumbnail_executor is None:
+            _thumbnail_executor = ThreadPoolExecutor(max_workers=app_settings.THUMBNAIL_WORKERS,
+                                                     thread_name_prefix='djng-thumbnail')
+    return _thumbnail_executor
 
 
 class ImageField(FileFieldMixin, fields.ImageField):
     storage = app_settings.upload_storage
-    signer = signing.Signer()
+    signer = DropImageWidget.signer  # salted, so that names signed by FileField are not taken for images
 
     def __init__(self, *args, **kwargs):
         if 'easy_thumbnails' not in settings.INSTALLED_APPS:
@@ -477,10 +962,7 @@ class ImageField(FileFieldMixin, fields.ImageField):
         accept = kwargs.pop('accept', 'image/*')
         fileupload_url = kwargs.pop('fileupload_url', reverse_lazy('fileupload'))
         area_label = kwargs.pop('area_label', _("Drop image here or click to upload"))
-        attrs = {
-            'accept': accept,
-            'ngf-pattern': accept,
-        }
+        attrs = self.pop_upload_attrs(accept, kwargs)
         kwargs.update(widget=DropImageWidget(area_label, fileupload_url, attrs=attrs))
         super(ImageField, self).__init__(*args, **kwargs)
 
@@ -497,21 +979,103 @@ class ImageField(FileFieldMixin, fields.ImageField):
             pass
         super(ImageField, self).remove_current(image_name)
 
+    def remove_temp_preview(self, temp_name):
+        thumbnail_name = self.get_thumbnail_name(temp_name)
+        future = pending_thumbnails.get(temp_name)
+        if future and not future.cancel():
+            future.add_done_callback(lambda f: self.storage.delete(thumbnail_name))
+        else:
+            self.storage.delete(thumbnail_name)
+
     @classmethod
-    def preview(cls, file_obj):
-        from easy_thumbnails.files import get_thumbnailer
+    def get_preview_url(cls, temp_name, content_type, preview_url=None):
+        """
+        Return the thumbnail of the uploaded image as data URI. If background workers are configured
+        through ``DJNG_THUMBNAIL_WORKERS``, the thumbnail is generated asynchronously instead, and
+        the returned URL points onto ``preview_url``, which serves it as soon as it is ready.
+        """
         from easy_thumbnails.templatetags.thumbnail import data_uri
 
-        available_name = cls.storage.get_available_name(file_obj.name)
-        temp_name = cls.storage.save(available_name, file_obj)
-        thumbnailer = get_thumbnailer(cls.storage.path(temp_name), relative_name=available_name)
-        thumbnail = thumbnailer.generate_thumbnail(app_settings.THUMBNAIL_OPTIONS)
-        return {
-            'url': 'url({})'.format(data_uri(thumbnail)),
-            'temp_name': cls.signer.sign(temp_name),
-            'file_name': file_obj.name,
-            'file_size': file_obj.size,
-            'charset': file_obj.charset,
-            'content_type': file_obj.content_type,
-            'content_type_extra': file_obj.content_type_extra,
-        }
+        cls.verify_image(temp_name)
+        shared = cls.is_shared_temp_file(temp_name)
+        if preview_url and app_settings.THUMBNAIL_WORKERS:
+            if not (shared and cls.has_thumbnail(temp_name)):
+                future = get_thumbnail_executor().submit(cls.store_thumbnail, temp_name)
+                pending_thumbnails[temp_name] = future
+                future.add_done_callback(lambda f: pending_thumbnails.pop(temp_name, None))
+            return '{}?{}'.format(preview_url, urlencode({'thumbnail': cls.signer.sign(temp_name)}))
+        if shared:
+            # keep the thumbnail of deduplicated images, so that it can be reused by later uploads
+            if not cls.has_thumbnail(temp_name):
+                cls.store_thumbnail(temp_name)
+            content = cls.read_thumbnail(temp_name)
+            return 'data:{};base64,{}'.format(get_image_mime_type(content), b64encode(content).decode('utf-8'))
+        return data_uri(cls.generate_thumbnail(temp_name))
+
+    @classmethod
+    def verify_image(cls, temp_name):
+        """
+        Raise ``ValueError`` and remove the uploaded file, if it can not be read as an image, so
+        that no preview is promised for it.
+        """
+        from PIL import Image
+
+        try:
+            with cls.storage.open(temp_name, 'rb') as image_file:
+                Image.open(image_file).verify()
+        except Exception:
+            if not cls.is_shared_temp_file(temp_name):
+                cls.storage.delete(temp_name)
+            raise ValueError(str(cls.default_error_messages['invalid_image']))
+
+    @classmethod
+    def get_deferred_preview_url(cls, temp_name, content_type, preview_url=None):
+        """
+        Return the URL onto ``preview_url``, serving the thumbnail of an image, once it has been
+        uploaded directly to the storage.
+        """
+        return '{}?{}'.format(preview_url, urlencode({'thumbnail': cls.signer.sign(temp_name)}))
+
+    @classmethod
+    def has_thumbnail(cls, temp_name):
+        return temp_name in pending_thumbnails or cls.storage.exists(cls.get_thumbnail_name(temp_name))
+
+    @classmethod
+    def generate_thumbnail(cls, temp_name):
+        from easy_thumbnails.files import get_thumbnailer
+
+        with cls.storage.open(temp_name, 'rb') as image_file:
+            thumbnailer = get_thumbnailer(image_file, relative_name=temp_name)
+            return thumbnailer.generate_thumbnail(app_settings.THUMBNAIL_OPTIONS)
+
+    @classmethod
+    def get_thumbnail_name(cls, temp_name):
+        return '{}.thumbnail'.format(temp_name)
+
+    @classmethod
+    def store_thumbnail(cls, temp_name):
+        """
+        Generate the thumbnail for an uploaded image and store it next to that image.
+        """
+        thumbnail = cls.generate_thumbnail(temp_name)
+        thumbnail_name = cls.get_thumbnail_name(temp_name)
+        cls.storage.delete(thumbnail_name)
+        return cls.storage.save(thumbnail_name, thumbnail)
+
+    @classmethod
+    def read_thumbnail(cls, temp_name, timeout=None):
+        """
+        Return the content of the thumbnail for an uploaded image. Thumbnails still being generated
+        by this process are awaited. If the thumbnail can not be found in the upload storage, for
+        instance because it has been requested from another process, it is generated right away
+        and stored for subsequent requests.
+        """
+        future = pending_thumbnails.get(temp_name)
+        thumbnail_name = future.result(timeout) if future else cls.get_thumbnail_name(temp_name)
+        try:
+            with cls.storage.open(thumbnail_name, 'rb') as thumbnail_file:
+                return thumbnail_file.read()
+        except FileNotFoundError:
+            thumbnail_name = cls.store_thumbnail(temp_name)
+        with cls.storage.open(thumbnail_name, 'rb') as thumbnail_file:
+            return thumbnail_file.read()
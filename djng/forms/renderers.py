@@ -0,0 +1,166 @@
+from django.forms.renderers import BaseRenderer, DjangoTemplates, get_default_renderer
+from django.utils.formats import localize
+from django.utils.functional import cached_property
+from django.utils.html import conditional_escape, escape
+from django.utils.safestring import SafeData
+from django.utils.timezone import template_localtime
+
+
+def format_string(value):
+    """
+    Equivalent to the template expression ``{{ value|stringformat:'s' }}``.
+    """
+    if isinstance(value, SafeData):
+        return '%s' % value
+    return escape('%s' % value)
+
+
+def format_value(value):
+    """
+    Equivalent to the template expression ``{{ value }}``.
+    """
+    value = localize(template_localtime(value))
+    if not issubclass(type(value), str):
+        value = str(value)
+    return conditional_escape(value)
+
+
+def render_attrs(attrs):
+    """
+    Equivalent to the template ``django/forms/widgets/attrs.html``.
+    """
+    return ''.join(
+        ' {}'.format(format_value(name)) if value is True else ' {}="{}"'.format(format_value(name), format_string(value))
+        for name, value in attrs.items() if value is not False
+    )
+
+
+class CompiledWidgetRenderer(BaseRenderer):
+    """
+    Form renderer, which builds the HTML for Django's built-in widgets by direct string building,
+    rather than loading and rendering their templates. The generated markup is identical to that
+    rendered by the templates found in ``django/forms/templates/django/forms/widgets``.
+
+    Widgets using any other template are rendered by the fallback renderer. Since templates
+    overriding Django's built-in widget templates are ignored, this renderer must be enabled
+    explicitly, either by adding ``default_renderer = CompiledWidgetRenderer`` to the form class,
+    or by setting ``FORM_RENDERER = 'djng.forms.renderers.CompiledWidgetRenderer'``.
+    """
+    @cached_property
+    def fallback_renderer(self):
+        renderer = get_default_renderer()
+        if isinstance(renderer, CompiledWidgetRenderer):
+            renderer = DjangoTemplates()
+        return renderer
+
+    def get_template(self, template_name):
+        return self.fallback_renderer.get_template(template_name)
+
+    def render(self, template_name, context, request=None):
+        if template_name not in self.render_methods:
+            return self.fallback_renderer.render(template_name, context, request=request)
+        return self.render_include(template_name, context).strip()
+
+    def render_include(self, template_name, context):
+        """
+        Render a template, as if it had been included by ``{% include template_name %}``.
+        Each render method returns the same output as its template, including the trailing
+        newline of the template file. Templates, which merely include another template, are
+        emulated by appending another newline.
+        """
+        try:
+            render_method, suffix = self.render_methods[template_name]
+        except KeyError:
+            return self.get_template(template_name).render(context)
+        return render_method(self, context) + suffix
+
+    def render_input(self, context):
+        widget = context['widget']
+        value = widget['value']
+        return '<input type="{}" name="{}"{}{}>\n'.format(
+            format_value(widget['type']),
+            format_value(widget['name']),
+            '' if value is None else ' value="{}"'.format(format_string(value)),
+            render_attrs(widget['attrs']),
+        )
+
+    def render_input_option(self, context):
+        widget = context['widget']
+        if not widget.get('wrap_label'):
+            return self.render_input(context) + '\n'
+        widget_id = widget['attrs'].get('id')
+        return '<label{}>{} {}</label>\n'.format(
+            ' for="{}"'.format(format_value(widget_id)) if widget_id else '',
+            self.render_input(context),
+            format_value(widget['label']),
+        )
+
+    def render_multiple_input(self, context):
+        widget = context['widget']
+        widget_id = widget['attrs'].get('id')
+        css_class = widget['attrs'].get('class')
+        output = ['<ul{}{}>'.format(
+            ' id="{}"'.format(format_value(widget_id)) if widget_id else '',
+            ' class="{}"'.format(format_value(css_class)) if css_class else '',
+        )]
+        for group, options, index in widget['optgroups']:
+            if group:
+                output.append('\n  <li>{}<ul{}>'.format(
+                    format_value(group),
+                    ' id="{}_{}"'.format(format_value(widget_id), format_value(index)) if widget_id else '',
+                ))
+            for option in options:
+                option_context = dict(context, widget=option)
+                output.append('\n    <li>{}</li>'.format(self.render_include(option['template_name'], option_context)))
+            if group:
+                output.append('\n  </ul></li>')
+        output.append('\n</ul>\n')
+        return ''.join(output)
+
+    def render_select(self, context):
+        widget = context['widget']
+        output = ['<select name="{}"{}>'.format(format_value(widget['name']), render_attrs(widget['attrs']))]
+        for group_name, group_choices, group_index in widget['optgroups']:
+            if group_name:
+                output.append('\n  <optgroup label="{}">'.format(format_value(group_name)))
+            for option in group_choices:
+                option_context = dict(context, widget=option)
+                output.append('\n  {}'.format(self.render_include(option['template_name'], option_context)))
+            if group_name:
+                output.append('\n  </optgroup>')
+        output.append('\n</select>\n')
+        return ''.join(output)
+
+    def render_select_option(self, context):
+        widget = context['widget']
+        return '<option value="{}"{}>{}</option>\n'.format(
+            format_string(widget['value']),
+            render_attrs(widget['attrs']),
+            format_value(widget['label']),
+        )
+
+    def render_textarea(self, context):
+        widget = context['widget']
+        return '<textarea name="{}"{}>\n{}</textarea>\n'.format(
+            format_value(widget['name']),
+            render_attrs(widget['attrs']),
+            format_value(widget['value']) if widget['value'] else '',
+        )
+
+    render_methods = {
+        'django/forms/widgets/input.html': (render_input, ''),
+        'django/forms/widgets/input_option.html': (render_input_option, ''),
+        'django/forms/widgets/radio_option.html': (render_input_option, '\n'),
+        'django/forms/widgets/checkbox_option.html': (render_input_option, '\n'),
+        'django/forms/widgets/multiple_input.html': (render_multiple_input, ''),
+        'django/forms/widgets/radio.html': (render_multiple_input, '\n'),
+        'django/forms/widgets/checkbox_select.html': (render_multiple_input, '\n'),
+        'django/forms/widgets/select.html': (render_select, ''),
+        'django/forms/widgets/select_option.html': (render_select_option, ''),
+        'django/forms/widgets/textarea.html': (render_textarea, ''),
+    }
+    render_methods.update(dict.fromkeys(
+        ['django/forms/widgets/{}.html'.format(name)
+         for name in ('text', 'email', 'url', 'number', 'password', 'hidden', 'date', 'datetime', 'time', 'checkbox')],
+        (render_input, '\n'),
+    ))
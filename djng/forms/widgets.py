@@ -1,7 +1,13 @@
 import mimetypes
+import threading
+import time
+from collections import OrderedDict
+from hashlib import md5
 
 from django.contrib.staticfiles.storage import staticfiles_storage
 from django.core import signing
+from django.core.cache import caches, DEFAULT_CACHE_ALIAS
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
 from django.forms import widgets
 from django.forms.utils import flatatt
 from django.utils.safestring import mark_safe
@@ -81,7 +87,27 @@ class DropFileWidget(widgets.Widget):
             })
 
 
+_thumbnail_urls = OrderedDict()
+_modified_times = OrderedDict()
+_thumbnail_urls_lock = threading.Lock()
+
+
 class DropImageWidget(DropFileWidget):
+    """
+    The URLs of thumbnails rendered as background of this widget, are kept in a bounded
+    in-process dictionary and in the cache ``thumbnail_cache_alias``, keyed by the name, the
+    modification time and the thumbnail options of the image. The modification times are kept in
+    another bounded in-process dictionary and looked up again only after ``modified_time_timeout``
+    seconds. Forms containing many images therefore can be rendered without accessing the storage
+    or the tables of easy-thumbnails, while images replaced under the same name show their new
+    thumbnail after that timeout at the latest.
+    """
+    signer = signing.Signer(salt='djng.forms.fields.ImageField')
+    thumbnail_cache_alias = DEFAULT_CACHE_ALIAS
+    thumbnail_cache_timeout = DEFAULT_TIMEOUT
+    thumbnail_urls_max_entries = 1000
+    modified_time_timeout = 60
+
     def __init__(self, area_label, fileupload_url, attrs=None):
         super(DropImageWidget, self).__init__(area_label, fileupload_url, attrs=attrs)
         self.filetype = 'image'
@@ -95,7 +121,66 @@ class DropImageWidget(DropFileWidget):
                     'current-file': self.signer.sign(value.name)
                 })
 
+    def get_thumbnail_cache_key(self, value):
+        """
+        Return the cache key for the thumbnail URL of the given image, or ``None`` if that image can
+        not be found.
+        """
+        storage = getattr(value, 'storage', None)
+        if storage is None or not getattr(value, 'name', None):
+            return
+        try:
+            modified_time = self.get_modified_time(storage, value.name)
+        except (OSError, ValueError):
+            return
+        options = sorted(app_settings.THUMBNAIL_OPTIONS.items())
+        parts = [storage.__class__.__module__, storage.__class__.__name__, value.name, modified_time, options]
+        return 'djng:thumbnail-url:{}'.format(md5(repr(parts).encode('utf-8')).hexdigest())
+
+    def get_modified_time(self, storage, name):
+        """
+        Return the modification time of the given image, looking it up in the storage at most once
+        every ``modified_time_timeout`` seconds, since for remote storages, each lookup is a request.
+        """
+        key = (storage.__class__.__module__, storage.__class__.__name__, name)
+        now = time.monotonic()
+        with _thumbnail_urls_lock:
+            entry = _modified_times.get(key)
+            if entry is not None and now - entry[1] < self.modified_time_timeout:
+                _modified_times.move_to_end(key)
+                return entry[0]
+        try:
+            modified_time = storage.get_modified_time(name).timestamp()
+        except NotImplementedError:
+            modified_time = None
+        with _thumbnail_urls_lock:
+            _modified_times[key] = (modified_time, now)
+            while len(_modified_times) > self.thumbnail_urls_max_entries:
+                _modified_times.popitem(last=False)
+        return modified_time
+
     def get_background_url(self, value):
+        cache_key = self.get_thumbnail_cache_key(value)
+        if cache_key is None:
+            return self.build_background_url(value)
+        with _thumbnail_urls_lock:
+            background_url = _thumbnail_urls.get(cache_key)
+            if background_url is not None:
+                _thumbnail_urls.move_to_end(cache_key)
+                return background_url or None
+        cache = caches[self.thumbnail_cache_alias]
+        background_url = cache.get(cache_key)
+        if background_url is None:
+            # an empty string marks images for which no thumbnail can be built
+            background_url = self.build_background_url(value) or ''
+            cache.set(cache_key, background_url, self.thumbnail_cache_timeout)
+        with _thumbnail_urls_lock:
+            _thumbnail_urls[cache_key] = background_url
+            while len(_thumbnail_urls) > self.thumbnail_urls_max_entries:
+                _thumbnail_urls.popitem(last=False)
+        return background_url or None
+
+    def build_background_url(self, value):
         from easy_thumbnails.exceptions import InvalidImageFormatError
         from easy_thumbnails.files import get_thumbnailer
 
@@ -0,0 +1,31 @@
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand, CommandError
+from django.template.defaultfilters import filesizeformat
+
+from djng.core.upload_temp import sweep_upload_temp
+
+
+class Command(BaseCommand):
+    help = "Remove files from the temporary upload folder, which have never been submitted through a form."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--max-age', type=int, default=None,
+                            help="Remove files older than this number of seconds. Defaults to DJNG_UPLOAD_TEMP_MAX_AGE.")
+        parser.add_argument('--max-size', type=int, default=None,
+                            help="Remove the oldest files until the remaining ones occupy at most this number "
+                                 "of bytes. Defaults to DJNG_UPLOAD_TEMP_MAX_SIZE.")
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help="Number of files examined per batch.")
+        parser.add_argument('--dry-run', action='store_true',
+                            help="Only report the files which would be removed.")
+
+    def handle(self, *args, **options):
+        try:
+            result = sweep_upload_temp(max_age=options['max_age'], max_size=options['max_size'],
+                                       batch_size=options['batch_size'], dry_run=options['dry_run'])
+        except ImproperlyConfigured as exc:
+            raise CommandError(exc)
+        msg = "{} {} of {} files, reclaiming {}.".format(
+            "Would remove" if options['dry_run'] else "Removed", result.removed, result.scanned,
+            filesizeformat(result.reclaimed))
+        self.stdout.write(msg)
@@ -111,3 +111,38 @@ class JSONResponseMixin(JSONBaseMixin):
             return handler(request, *args, **kwargs)
         # HttpResponseNotAllowed expects permitted methods.
         return HttpResponseBadRequest('This view can not handle method {0}'.format(request.method), status=405)
+
+
+class RemoteChoicesMixin(object):
+    """
+    Add this mixin to a view class inheriting from ``JSONResponseMixin``, which renders forms
+    containing a ``ModelChoiceField`` or ``ModelMultipleChoiceField`` declared with
+    ``remote_choices=True``. It offers the remote method ``fetch_choices``, which is invoked by
+    the directive ``djng-remote-choices`` to load the options of such a field page by page.
+    """
+    def get_remote_choices_form_classes(self):
+        """
+        Return the form classes rendered by this view. Defaults to the attribute ``form_classes``,
+        as used for forms sets, or to the form class of a ``FormView``.
+        """
+        form_classes = getattr(self, 'form_classes', None)
+        if form_classes is None and callable(getattr(self, 'get_form_class', None)):
+            form_classes = [self.get_form_class()]
+        return form_classes or []
+
+    def get_remote_choices_field(self, form_name, field_name):
+        for form_class in self.get_remote_choices_form_classes():
+            form = form_class()
+            if form.form_name == form_name:
+                field = form.fields.get(field_name)
+                if getattr(field, 'remote_choices', False):
+                    return field
+        raise JSONResponseException("No field '{}' with remote choices in form '{}'".format(field_name, form_name), 404)
+
+    @allow_remote_invocation
+    def fetch_choices(self, in_data=None):
+        if not isinstance(in_data, dict):
+            raise JSONResponseException("Invalid payload")
+        form_name, _, field_name = str(in_data.get('field', '')).partition('.')
+        field = self.get_remote_choices_field(form_name, field_name)
+        return field.fetch_choices(search=in_data.get('search', ''), page=in_data.get('page', 1))
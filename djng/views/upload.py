@@ -1,25 +1,317 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from tempfile import TemporaryFile
+
 from django.core.exceptions import SuspiciousMultipartForm
 from django.core import signing
+from django.core.files.base import ContentFile, File
+from django.utils.decorators import method_decorator
+from django.views.decorators.csrf import csrf_exempt, csrf_protect
 from django.views.generic import View
-from django.http import JsonResponse
+from django.http import Http404, HttpResponse, JsonResponse
 
 from djng import app_settings
-from djng.forms.fields import FileField, ImageField
+from djng.core.uploadhandler import StreamingUploadHandler, UploadPolicy
+from djng.forms.fields import FileField, ImageField, get_image_mime_type
+
+logger = logging.getLogger(__name__)
+
+_upload_executor = None
+_upload_executor_lock = threading.Lock()
+
+
+def get_upload_executor():
+    """
+    Return the pool of ``DJNG_UPLOAD_WORKERS`` threads, storing and previewing uploaded files.
+    """
+    global _upload_executor
 
+    with _upload_executor_lock:
+        if _upload_executor is None:
+            _upload_executor = ThreadPoolExecutor(max_workers=app_settings.UPLOAD_WORKERS,
+                                                  thread_name_prefix='djng-upload')
+    return _upload_executor
 
+
+@method_decorator(csrf_exempt, name='dispatch')
 class FileUploadView(View):
+    """
+    Receive files dropped onto a ``DropFileWidget`` or ``DropImageWidget`` and store them in the
+    temporary upload storage.
+
+    Files are either uploaded in one multipart request, or in chunks, if the client passes the field
+    ``action`` with one of these values:
+
+    * ``init``: Create an empty temporary file for ``file_name`` and return its signed ``temp_name``.
+    * ``append``: Append the uploaded file ``chunk`` to the temporary file referred by ``temp_name``,
+      if ``offset`` matches the number of bytes received so far. Otherwise respond with status 409
+      and the expected ``offset``, so that the client can resume the upload from there. If the
+      temporary file no longer exists, respond with status 410, so that the client restarts.
+    * ``finalize``: Check that ``file_size`` bytes have been received, and return the preview data
+      for the temporary file, just as for files uploaded in one request.
+
+    Instead of uploading their content through this view, files may also be uploaded directly to
+    the storage endpoint configured through ``DJNG_UPLOAD_DIRECT_URL``. The client then passes the
+    field ``action`` with value ``ticket``, and receives the preview data together with a signed
+    ``ticket``, authorizing the upload of ``file_size`` bytes to that endpoint.
+
+    Multiple files uploaded in one request are processed concurrently by a pool of
+    ``DJNG_UPLOAD_WORKERS`` threads. If a file can not be processed, its entry in the response
+    contains an ``error`` message, rather than its preview data.
+
+    Uploaded files are received by a ``StreamingUploadHandler``, which enforces the maximum size
+    and the accepted content types signed into the header ``DjNg-Upload-Policy`` by the field's
+    widget, and computes the digest of each file while receiving it. Since the upload handlers
+    must be installed before the request body is parsed, the CSRF check is performed by this view
+    itself, rather than by the middleware. Requests without a valid policy are rejected. Since the
+    view can not tell which field a policy belongs to, the field enforces it once more on submission.
+
+    Thumbnails of uploaded images which are generated in the background, are served by this view
+    through ``GET`` requests, using the signed ``temp_name`` as query parameter ``thumbnail``.
+    """
     storage = app_settings.upload_storage
-    thumbnail_size = app_settings.THUMBNAIL_OPTIONS
     signer = signing.Signer()
+    chunked_signer = signing.Signer(salt='djng.views.upload.chunked')
+    chunked_actions = ['init', 'append', 'finalize']
+    thumbnail_timeout = 30
 
-    def post(self, request, *args, **kwargs):
+    def dispatch(self, request, *args, **kwargs):
+        if request.method == 'POST':
+            self.upload_handler = StreamingUploadHandler(request, self.get_upload_policy(request))
+            request.upload_handlers.insert(0, self.upload_handler)
+        return csrf_protect(super(FileUploadView, self).dispatch)(request, *args, **kwargs)
+
+    def get_upload_policy(self, request):
+        token = request.META.get('HTTP_DJNG_UPLOAD_POLICY')
+        if not token:
+            raise SuspiciousMultipartForm("Missing header 'DjNg-Upload-Policy'.")
+        try:
+            return UploadPolicy.loads(token)
+        except (signing.BadSignature, TypeError, ValueError):
+            raise SuspiciousMultipartForm("Got bogus upload policy.")
+
+    def get_field_class(self, request):
         if request.POST.get('filetype') == 'file':
-            field = FileField
-        elif request.POST.get('filetype') == 'image':
-            field = ImageField
+            return FileField
+        if request.POST.get('filetype') == 'image':
+            return ImageField
+        raise SuspiciousMultipartForm("Missing attribute 'filetype' in form data.")
+
+    def post(self, request, *args, **kwargs):
+        files = list(request.FILES.items())
+        rejected = {name: {'error': error} for name, error in self.upload_handler.errors.items()}
+        if rejected and not files:
+            # the chunked upload client retries chunks, unless their size is rejected with status 413
+            return JsonResponse(rejected, status=413 if self.upload_handler.oversized else 422)
+        field = self.get_field_class(request)
+        action = request.POST.get('action')
+        if action == 'ticket':
+            return self.issue_ticket(request, field)
+        if action:
+            if action not in self.chunked_actions:
+                raise SuspiciousMultipartForm("Unknown upload action '{}'.".format(action))
+            try:
+                return getattr(self, 'chunked_{}'.format(action))(request, field)
+            except FileNotFoundError:
+                # the temporary file has been swept away, hence the client must restart the upload
+                return JsonResponse({'error': "This upload has expired."}, status=410)
+        for name, file_obj in files:
+            file_obj.content_digest = self.upload_handler.digests.get(name)
+        if len(files) > 1 and app_settings.UPLOAD_WORKERS > 1:
+            executor = get_upload_executor()
+            futures = [(name, executor.submit(self.preview_file, field, file_obj, request.path))
+                       for name, file_obj in files]
+            data = {name: future.result() for name, future in futures}
         else:
-            raise SuspiciousMultipartForm("Missing attribute 'filetype' in form data.")
-        data = {}
-        for name, file_obj in request.FILES.items():
-            data[name] = field.preview(file_obj)
+            data = {name: self.preview_file(field, file_obj, request.path) for name, file_obj in files}
+        data.update(rejected)
         return JsonResponse(data)
+
+    def preview_file(self, field, file_obj, preview_url):
+        try:
+            return field.preview(file_obj, preview_url=preview_url)
+        except Exception as excp:
+            logger.warning("Failed to process uploaded file '%s'", file_obj.name, exc_info=True)
+            return {'file_name': file_obj.name, 'error': "{}: {}".format(excp.__class__.__name__, excp)}
+
+    def get(self, request, *args, **kwargs):
+        from easy_thumbnails.engine import NoSourceGenerator
+        from easy_thumbnails.exceptions import EasyThumbnailsError
+
+        try:
+            temp_name = ImageField.signer.unsign(request.GET['thumbnail'])
+            if not ImageField.storage.size(temp_name):
+                # the image has been announced by an upload ticket, but not been received yet
+                return self.retry_later()
+            content = ImageField.read_thumbnail(temp_name, timeout=self.thumbnail_timeout)
+        except TimeoutError:
+            return self.retry_later()
+        except (KeyError, signing.BadSignature, OSError, EasyThumbnailsError, NoSourceGenerator):
+            raise Http404("No thumbnail found for this upload.")
+        response = HttpResponse(content, content_type=get_image_mime_type(content))
+        response['Cache-Control'] = 'private, max-age=3600'
+        return response
+
+    def retry_later(self):
+        response = HttpResponse(status=503)
+        response['Retry-After'] = 1
+        return response
+
+    def get_chunked_temp_name(self, request):
+        try:
+            return self.chunked_signer.unsign(request.POST['temp_name'])
+        except (KeyError, signing.BadSignature):
+            raise SuspiciousMultipartForm("Missing or bogus attribute 'temp_name' in form data.")
+
+    def get_announced_file(self, request):
+        """
+        Return the name, content type and size of a file announced by the client before uploading
+        its content, together with an error response, if the upload policy rejects that file.
+        """
+        file_name = request.POST.get('file_name')
+        if not file_name:
+            raise SuspiciousMultipartForm("Missing attribute 'file_name' in form data.")
+        policy = self.upload_handler.policy
+        content_type = request.POST.get('content_type')
+        try:
+            file_size = int(request.POST.get('file_size') or 0)
+        except ValueError:
+            raise SuspiciousMultipartForm("Attribute 'file_size' must be an integer.")
+        error_response = None
+        if content_type is not None and not policy.accepts(content_type, file_name):
+            error_response = JsonResponse({'error': policy.get_type_error(content_type)}, status=422)
+        elif policy.exceeds(file_size):
+            error_response = JsonResponse({'error': policy.get_size_error()}, status=413)
+        return file_name, content_type, file_size, error_response
+
+    def issue_ticket(self, request, field):
+        file_name, content_type, file_size, error_response = self.get_announced_file(request)
+        if error_response:
+            return error_response
+        data = field.preview_upload_ticket(
+            file_name,
+            file_size,
+            content_type or 'application/octet-stream',
+            charset=request.POST.get('charset') or None,
+            preview_url=request.path,
+        )
+        return JsonResponse({'file:0': data})
+
+    def chunked_init(self, request, field):
+        file_name, content_type, file_size, error_response = self.get_announced_file(request)
+        if error_response:
+            return error_response
+        temp_name = field.storage.save(field.storage.get_available_name(file_name), ContentFile(b''))
+        return JsonResponse({'temp_name': self.chunked_signer.sign(temp_name), 'offset': 0})
+
+    def chunked_append(self, request, field):
+        temp_name = self.get_chunked_temp_name(request)
+        try:
+            offset = int(request.POST['offset'])
+            chunk = request.FILES['chunk']
+        except (KeyError, ValueError):
+            raise SuspiciousMultipartForm("Missing attribute 'offset' or 'chunk' in form data.")
+        received = field.storage.size(temp_name)
+        if offset != received:
+            return JsonResponse({'temp_name': request.POST['temp_name'], 'offset': received}, status=409)
+        if self.upload_handler.policy.exceeds(received + chunk.size):
+            field.storage.delete(temp_name)
+            return JsonResponse({'error': self.upload_handler.policy.get_size_error()}, status=413)
+        self.append_chunk(field.storage, temp_name, chunk)
+        return JsonResponse({'temp_name': request.POST['temp_name'], 'offset': received + chunk.size})
+
+    def append_chunk(self, storage, temp_name, chunk):
+        """
+        Append the content of ``chunk`` to a file in the temporary upload storage. Storages which do
+        not keep their files on the local file system, usually can not append to them. There the
+        file is rewritten with the chunk appended, hence chunks should be large.
+        """
+        try:
+            path = storage.path(temp_name)
+        except NotImplementedError:
+            with TemporaryFile() as buffer:
+                with storage.open(temp_name, 'rb') as temp_file:
+                    for data in temp_file.chunks():
+                        buffer.write(data)
+                for data in chunk.chunks():
+                    buffer.write(data)
+                storage.delete(temp_name)
+                storage.save(temp_name, File(buffer))
+        else:
+            with open(path, 'ab') as temp_file:
+                for data in chunk.chunks():
+                    temp_file.write(data)
+
+    def chunked_finalize(self, request, field):
+        temp_name = self.get_chunked_temp_name(request)
+        received = field.storage.size(temp_name)
+        if str(received) != request.POST.get('file_size'):
+            return JsonResponse({'temp_name': request.POST['temp_name'], 'offset': received}, status=409)
+        file_name = request.POST.get('file_name') or temp_name
+        try:
+            data = field.preview_temp_file(
+                field.deduplicate_temp_file(temp_name, file_name),
+                file_name,
+                request.POST.get('content_type') or 'application/octet-stream',
+                charset=request.POST.get('charset') or None,
+                file_size=received,
+                preview_url=request.path,
+            )
+        except ValueError as excp:
+            return JsonResponse({'file:0': {'file_name': file_name, 'error': str(excp)}}, status=422)
+        return JsonResponse({'file:0': data})
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class DirectUploadView(View):
+    """
+    Lightweight endpoint receiving the raw content of a file through a ``PUT`` request, authorized
+    by the upload ticket passed as query parameter ``ticket``. The content is streamed into the
+    reserved file of the temporary upload storage, without being parsed as form data.
+
+    This view does not require sessions, authentication or CSRF protection, since the signed ticket
+    is its only credential. It therefore may be served by a dedicated process with a minimal set of
+    middleware, while the Django workers serving the forms are not occupied by uploads. Other
+    services writing into the temporary upload storage may take its place, as long as they verify
+    the ticket using the same secret key.
+    """
+    storage = app_settings.upload_storage
+    ticket_field = FileField
+    read_size = 0x10000
+
+    def put(self, request, *args, **kwargs):
+        try:
+            ticket = self.ticket_field.load_upload_ticket(request.GET['ticket'],
+                                                          max_age=app_settings.UPLOAD_TICKET_MAX_AGE)
+        except signing.SignatureExpired:
+            return JsonResponse({'error': "This upload ticket has expired."}, status=403)
+        except (KeyError, signing.BadSignature):
+            return JsonResponse({'error': "Missing or bogus upload ticket."}, status=400)
+        try:
+            if self.storage.size(ticket['name']):
+                return JsonResponse({'error': "This file has already been uploaded."}, status=409)
+        except FileNotFoundError:
+            return JsonResponse({'error': "This upload ticket has been withdrawn."}, status=410)
+        content_length = int(request.META.get('CONTENT_LENGTH') or 0)
+        if content_length and content_length != ticket['size']:
+            return self.reject(ticket, content_length)
+
+        received = 0
+        with self.storage.open(ticket['name'], 'wb') as temp_file:
+            while received <= ticket['size']:
+                data = request.read(self.read_size)
+                if not data:
+                    break
+                received += len(data)
+                temp_file.write(data)
+        if received != ticket['size']:
+            with self.storage.open(ticket['name'], 'wb'):
+                pass  # truncate the file, so that its upload can be retried
+            return self.reject(ticket, received)
+        return JsonResponse({'file_size': received})
+
+    def reject(self, ticket, size):
+        if size > ticket['size']:
+            return JsonResponse({'error': "The uploaded file is larger than announced."}, status=413)
+        return JsonResponse({'error': "The uploaded file is smaller than announced."}, status=400)
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark the creation, rendering and validation of forms with 10, 50 and 200 fields, for each
+of the form flavours offered by django-angular, as well as the conversion of multipart form data
+and the serialization of the errors of rejected forms. Run from the ``examples`` directory:
+
+    python -m benchmarks.form_rendering --output baseline.json
+
+and after applying a change, compare the timings against the stored baseline:
+
+    python -m benchmarks.form_rendering --baseline baseline.json
+
+The latter exits with status 1, if one of the measured timings is slower than its baseline by more
+than the given tolerance. Since absolute timings depend on the machine, a baseline shall only be
+compared with timings measured on the same machine.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+from collections import OrderedDict
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'benchmarks.settings')
+
+import django
+from django import forms
+from django.forms import widgets
+from django.http import JsonResponse, QueryDict
+
+django.setup()
+
+from djng import __version__ as djng_version
+from djng.forms import fields, NgForm, NgModelForm, NgModelFormMixin, NgFormValidationMixin
+from djng.styling.bootstrap3.forms import Bootstrap3Form
+
+from benchmarks.models import FORM_SIZES, CHOICES, benchmark_models
+
+
+FLAVOURS = OrderedDict([
+    ('NgForm', (NgForm,)),
+    ('NgModelFormMixin', (NgModelFormMixin, NgForm)),
+    ('NgModelForm', (NgModelFormMixin, NgModelForm)),
+    ('NgFormValidationMixin', (NgFormValidationMixin, NgForm)),
+    ('Bootstrap3Form', (NgModelFormMixin, NgFormValidationMixin, Bootstrap3Form)),
+])
+
+VALID_VALUES = (
+    (forms.MultipleChoiceField, {'choice_1': True, 'choice_4': True}),
+    (forms.ChoiceField, 'choice_3'),
+    (forms.EmailField, 'john@example.com'),
+    (forms.IntegerField, 42),
+    (forms.DateField, '2020-02-29'),
+    (forms.CharField, 'John Doe'),
+)
+
+
+def build_fields(num_fields):
+    attrs = OrderedDict()
+    for counter in range(num_fields):
+        kind = counter % 6
+        if kind == 0:
+            attrs['field_{}'.format(counter)] = fields.CharField(min_length=2, max_length=50)
+        elif kind == 1:
+            attrs['field_{}'.format(counter)] = fields.EmailField()
+        elif kind == 2:
+            attrs['field_{}'.format(counter)] = fields.IntegerField(min_value=0, max_value=100)
+        elif kind == 3:
+            attrs['field_{}'.format(counter)] = fields.ChoiceField(choices=CHOICES)
+        elif kind == 4:
+            attrs['field_{}'.format(counter)] = fields.DateField()
+        else:
+            attrs['field_{}'.format(counter)] = fields.MultipleChoiceField(
+                choices=CHOICES, widget=widgets.CheckboxSelectMultiple)
+    return attrs
+
+
+def build_form_class(flavour, num_fields):
+    """
+    Create a form class of the given flavour containing ``num_fields`` fields.
+    """
+    attrs = {'__module__': __name__, 'scope_prefix': 'bench_data', 'form_name': 'bench_form'}
+    if flavour == 'NgModelForm':
+        attrs['Meta'] = type(str('Meta'), (), {'model': benchmark_models[num_fields], 'fields': '__all__'})
+    else:
+        attrs.update(build_fields(num_fields))
+    return type(str('{}{}'.format(flavour, num_fields)), FLAVOURS[flavour], attrs)
+
+
+def build_valid_data(form_class):
+    data = {}
+    for name, field in form_class.base_fields.items():
+        data[name] = next(value for field_class, value in VALID_VALUES if isinstance(field, field_class))
+    return data
+
+
+def build_invalid_data(form_class):
+    return {name: 'x' for name in form_class.base_fields.keys()}
+
+
+def build_multipart_data(valid_data):
+    """
+    Convert the valid data into a ``QueryDict``, as submitted by a multipart request, where the
+    checked choices of a ``CheckboxSelectMultiple`` are sent as separate keys.
+    """
+    query_dict = QueryDict(mutable=True)
+    for name, value in valid_data.items():
+        if isinstance(value, dict):
+            for choice in value.keys():
+                query_dict['{}.{}'.format(name, choice)] = choice
+        else:
+            query_dict[name] = str(value)
+    query_dict._mutable = False
+    return query_dict
+
+
+def get_benchmarks(flavour, num_fields):
+    """
+    Return the callables to be measured. Apart from ``class_creation``, each callable instantiates
+    a new form, since rendered fields and validation results are cached by the form instance.
+    """
+    form_class = build_form_class(flavour, num_fields)
+    valid_data = build_valid_data(form_class)
+    invalid_data = build_invalid_data(form_class)
+    multipart_data = build_multipart_data(valid_data)
+    assert form_class(data=valid_data).is_valid(), "Data for {} shall be valid".format(form_class)
+    assert form_class(data=multipart_data).is_valid(), "Multipart data for {} shall be valid".format(form_class)
+    rejected_form = form_class(data=invalid_data)
+    rejected_form.is_valid()
+
+    benchmarks = OrderedDict([
+        ('class_creation', lambda: build_form_class(flavour, num_fields)),
+        ('instance_unbound', lambda: form_class()),
+        ('instance_bound', lambda: form_class(data=valid_data)),
+        ('as_ul_unbound', lambda: form_class().as_ul()),
+        ('as_ul_bound', lambda: form_class(data=invalid_data).as_ul()),
+        ('is_valid', lambda: form_class(data=valid_data).is_valid()),
+        ('is_valid_rejected', lambda: form_class(data=invalid_data).is_valid()),
+        ('instance_multipart', lambda: form_class(data=multipart_data)),
+        ('errors_json', lambda: JsonResponse({rejected_form.form_name: rejected_form.errors}, status=422)),
+    ])
+    if hasattr(form_class, 'errors_as_json_data'):
+        benchmarks['errors_as_json_data'] = lambda: JsonResponse(
+            {rejected_form.form_name: rejected_form.errors_as_json_data()}, status=422)
+    if hasattr(form_class, 'as_div'):
+        benchmarks['as_div_unbound'] = lambda: form_class().as_div()
+        benchmarks['as_div_bound'] = lambda: form_class(data=invalid_data).as_div()
+    return benchmarks
+
+
+def measure(func, num_fields, repeat):
+    number = max(2, 1000 // num_fields)
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def run(flavours, sizes, repeat):
+    results = OrderedDict()
+    for flavour in flavours:
+        results[flavour] = OrderedDict()
+        for num_fields in sizes:
+            timings = results[flavour][str(num_fields)] = OrderedDict()
+            for name, func in get_benchmarks(flavour, num_fields).items():
+                timings[name] = measure(func, num_fields, repeat)
+                print("{:<22} {:>4} fields {:<20} {:10.3f} ms".format(
+                    flavour, num_fields, name, timings[name] * 1000))
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """
+    Compare the measured timings against those of the baseline and return the list of regressions.
+    """
+    regressions = []
+    for flavour, sizes in results.items():
+        for num_fields, timings in sizes.items():
+            for name, elapsed in timings.items():
+                try:
+                    reference = baseline[flavour][num_fields][name]
+                except KeyError:
+                    continue
+                ratio = elapsed / reference
+                print("{:<22} {:>4} fields {:<20} {:10.3f} ms {:10.3f} ms {:7.2f}x".format(
+                    flavour, num_fields, name, reference * 1000, elapsed * 1000, ratio))
+                if ratio > 1 + tolerance:
+                    regressions.append((flavour, num_fields, name, ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the forms of django-angular.")
+    parser.add_argument('--flavour', dest='flavours', action='append', choices=list(FLAVOURS.keys()),
+                        help="Form flavour to benchmark, may be repeated. Defaults to all flavours.")
+    parser.add_argument('--size', dest='sizes', action='append', type=int,
+                        help="Number of fields per form, may be repeated. Defaults to 10, 50 and 200.")
+    parser.add_argument('--repeat', type=int, default=5,
+                        help="Number of repetitions, of which the fastest one is taken.")
+    parser.add_argument('--output', help="Write the measured timings as JSON into this file.")
+    parser.add_argument('--baseline', help="Compare the measured timings against this JSON file.")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="Relative slowdown accepted before reporting a regression.")
+    args = parser.parse_args(argv)
+
+    results = run(args.flavours or list(FLAVOURS.keys()), args.sizes or FORM_SIZES, args.repeat)
+    if args.output:
+        document = {
+            'meta': {
+                'python': platform.python_version(),
+                'django': django.get_version(),
+                'djng': djng_version,
+                'machine': platform.machine(),
+                'repeat': args.repeat,
+            },
+            'results': results,
+        }
+        with open(args.output, 'w') as fh:
+            json.dump(document, fh, indent=2)
+    if args.baseline:
+        with open(args.baseline) as fh:
+            baseline = json.load(fh)['results']
+        regressions = compare(results, baseline, args.tolerance)
+        for flavour, num_fields, name, ratio in regressions:
+            print("Regression: {} with {} fields, {} is {:.2f}x slower".format(flavour, num_fields, name, ratio))
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
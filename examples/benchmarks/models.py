@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+from django.db import models
+
+FORM_SIZES = (10, 50, 200)
+
+CHOICES = [('choice_{}'.format(k), "Choice {}".format(k)) for k in range(5)]
+
+
+def build_model_class(num_fields):
+    """
+    Create a model with ``num_fields`` fields of different types, used to benchmark model forms.
+    """
+    attrs = {'__module__': __name__}
+    for counter in range(num_fields):
+        kind = counter % 5
+        if kind == 0:
+            attrs['field_{}'.format(counter)] = models.CharField(max_length=50)
+        elif kind == 1:
+            attrs['field_{}'.format(counter)] = models.EmailField()
+        elif kind == 2:
+            attrs['field_{}'.format(counter)] = models.IntegerField()
+        elif kind == 3:
+            attrs['field_{}'.format(counter)] = models.CharField(max_length=20, choices=CHOICES)
+        else:
+            attrs['field_{}'.format(counter)] = models.DateField()
+    return type(str('BenchmarkModel{}'.format(num_fields)), (models.Model,), attrs)
+
+
+benchmark_models = {num_fields: build_model_class(num_fields) for num_fields in FORM_SIZES}
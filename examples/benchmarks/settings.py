@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""
+Django settings for the benchmark suite. All data is kept in an in-memory SQLite database, so that
+the measured timings do not depend on the file system.
+"""
+DEBUG = False
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    },
+}
+
+SECRET_KEY = 'secret'
+
+INSTALLED_APPS = [
+    'django.contrib.auth',
+    'django.contrib.contenttypes',
+    'djng',
+    'benchmarks',
+]
+
+USE_I18N = True
+
+USE_L10N = True
+
+TEMPLATES = [
+    {
+        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'DIRS': [],
+        'APP_DIRS': True,
+    },
+]
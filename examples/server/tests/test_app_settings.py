@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+import os
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.storage import FileSystemStorage
+from django.test import SimpleTestCase, override_settings
+
+from djng import app_settings
+from djng.forms.fields import ImageField
+
+
+class RecordingStorage(FileSystemStorage):
+    def __init__(self, **kwargs):
+        self.options = kwargs
+        super(RecordingStorage, self).__init__(location='/nonexistent')
+
+
+class AppSettingsTest(SimpleTestCase):
+    def test_cached_thumbnail_options(self):
+        self.assertIs(app_settings.THUMBNAIL_OPTIONS, app_settings.THUMBNAIL_OPTIONS)
+        with override_settings(DJNG_THUMBNAIL_SIZE=(80, 60)):
+            self.assertEqual(app_settings.THUMBNAIL_OPTIONS['size'], (80, 60))
+        self.assertEqual(app_settings.THUMBNAIL_OPTIONS['size'], (200, 200))
+        with override_settings(DJNG_THUMBNAIL_SIZE=80):
+            with self.assertRaises(ImproperlyConfigured):
+                app_settings.THUMBNAIL_OPTIONS
+
+    def test_upload_storage_follows_settings(self):
+        storage = app_settings.upload_storage
+        self.assertIs(ImageField.storage, storage)
+        location = storage.location
+        with override_settings(DJNG_UPLOAD_TEMP='other_temp'):
+            self.assertEqual(ImageField.storage.location, os.path.join(os.path.dirname(location), 'other_temp'))
+        self.assertEqual(ImageField.storage.location, location)
+
+    def test_pluggable_upload_storage(self):
+        with override_settings(DJNG_UPLOAD_STORAGE='server.tests.test_app_settings.RecordingStorage',
+                               DJNG_UPLOAD_STORAGE_OPTIONS={'location': '/tmp', 'base_url': '/x/'}):
+            self.assertDictEqual(ImageField.storage.options, {'location': '/tmp', 'base_url': '/x/'})
+        self.assertFalse(hasattr(ImageField.storage, 'options'))
@@ -1,20 +1,29 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
-import os, json
+import hashlib, os, json, shutil
+from unittest import mock
 
 from django.conf import settings
 from django.urls import reverse
 from django.core import signing
-from django.core.files.uploadedfile import InMemoryUploadedFile, TemporaryUploadedFile
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage, Storage
+from django.core.files.uploadedfile import InMemoryUploadedFile, SimpleUploadedFile, TemporaryUploadedFile
+from django.db import models
+from django.db.models.fields.files import ImageFieldFile
 from django.test import override_settings, TestCase
 from django.test.client import Client
+from django.utils import timezone
 
 from pyquery.pyquery import PyQuery
 
 from djng import app_settings
+from djng.core.uploadhandler import UploadPolicy
 from djng.forms import NgModelFormMixin, NgForm
 from djng.forms.fields import ImageField
+from djng.forms.widgets import _modified_times, _thumbnail_urls
 
 
 class TestUploadForm(NgModelFormMixin, NgForm):
@@ -24,26 +33,31 @@ class TestUploadForm(NgModelFormMixin, NgForm):
     avatar = ImageField()
 
 
+# the upload policy, which the widget passes to the client, and the client sends back with each upload
+UPLOAD_HEADERS = {'HTTP_DJNG_UPLOAD_POLICY': TestUploadForm.base_fields['avatar'].widget.attrs['djng-fileupload-policy']}
+
 
 class FileUploadTest(TestCase):
-    signer = signing.Signer()
+    signer = ImageField.signer
     storage = app_settings.upload_storage
 
     def tearDown(self):
-        try:
-            os.remove(os.path.join(settings.MEDIA_ROOT, 'upload_temp/sample-image.jpg'))
-        except:
-            pass
+        for filename in ('sample-image.jpg', 'sample-image.jpg.thumbnail'):
+            try:
+                os.remove(os.path.join(settings.MEDIA_ROOT, 'upload_temp', filename))
+            except:
+                pass
 
     def upload_image(self):
         client = Client()
         upload_filename = os.path.join(os.path.dirname(__file__), 'sample-image.jpg')
         with open(upload_filename, 'rb') as fp:
             upload_url = reverse('fileupload')
-            response = client.post(upload_url, {'file:0': fp, 'filetype': 'image'})
+            response = client.post(upload_url, {'file:0': fp, 'filetype': 'image'}, **UPLOAD_HEADERS)
         self.assertEqual(response.status_code, 200)
         return json.loads(response.content.decode('utf-8'))
 
+    @override_settings(DJNG_THUMBNAIL_WORKERS=0)
     def test_upload(self):
         content = self.upload_image()
         self.assertTrue('file:0' in content)
@@ -52,6 +66,55 @@ class FileUploadTest(TestCase):
         self.assertEqual(content['file:0']['content_type'], 'image/jpeg')
         self.assertEqual(self.signer.unsign(content['file:0']['temp_name']), 'sample-image.jpg')
 
+    def test_upload_async_thumbnail(self):
+        content = self.upload_image()
+        thumbnail_url = content['file:0']['url']
+        self.assertTrue(thumbnail_url.startswith('url(/upload/?thumbnail=sample-image.jpg'))
+        response = Client().get(thumbnail_url[4:-1])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'image/jpeg')
+        self.assertTrue(os.path.exists(self.storage.path('sample-image.jpg.thumbnail')))
+
+        content['file:0'].pop('url')
+        form = TestUploadForm(data={'avatar': content['file:0']})
+        self.assertTrue(form.is_valid())
+        self.assertFalse(os.path.exists(self.storage.path('sample-image.jpg.thumbnail')))
+
+    def test_upload_invalid_image(self):
+        response = Client().post(reverse('fileupload'), {
+            'filetype': 'image', 'file:0': SimpleUploadedFile('corrupt.jpg', b'no image', 'image/jpeg'),
+        }, **UPLOAD_HEADERS)
+        self.assertEqual(response.status_code, 200)
+        content = json.loads(response.content.decode('utf-8'))['file:0']
+        self.assertIn("Upload a valid image", content['error'])
+        self.assertFalse(self.storage.exists('corrupt.jpg'))
+
+    def test_thumbnail_of_non_image(self):
+        self.storage.save('notes.txt', ContentFile(b'no image'))
+        try:
+            # names signed for a FileField are not accepted for thumbnails
+            response = Client().get(reverse('fileupload'), {'thumbnail': signing.Signer().sign('notes.txt')})
+            self.assertEqual(response.status_code, 404)
+            response = Client().get(reverse('fileupload'), {'thumbnail': ImageField.signer.sign('notes.txt')})
+            self.assertEqual(response.status_code, 404)
+        finally:
+            self.storage.delete('notes.txt')
+
+    def test_thumbnail_on_demand(self):
+        content = self.upload_image()['file:0']
+        self.assertEqual(Client().get(content['url'][4:-1]).status_code, 200)
+        # as if the thumbnail was requested from another process
+        self.storage.delete('sample-image.jpg.thumbnail')
+        with mock.patch.object(ImageField, 'generate_thumbnail', wraps=ImageField.generate_thumbnail) as generate:
+            for _ in range(2):
+                response = Client().get(content['url'][4:-1])
+                self.assertEqual(response.status_code, 200)
+        self.assertEqual(generate.call_count, 1)
+
+    def test_bogus_thumbnail(self):
+        response = Client().get(reverse('fileupload'), {'thumbnail': 'sample-image.jpg:bogus'})
+        self.assertEqual(response.status_code, 404)
+
     def test_render_widget(self):
         form = TestUploadForm()
         htmlsource = form.as_p()
@@ -90,3 +153,462 @@ class FileUploadTest(TestCase):
         self.assertTrue(form.is_valid())
         self.assertIsInstance(form.cleaned_data['avatar'], TemporaryUploadedFile)
         self.assertEqual(form.cleaned_data['avatar'].name, "sample-image.jpg")
+
+    @override_settings(FILE_UPLOAD_MAX_MEMORY_SIZE=50000)
+    def test_handover_large_image(self):
+        content = self.upload_image()
+        content['file:0'].pop('url')
+        temp_path = self.storage.path('sample-image.jpg')
+        form = TestUploadForm(data={'avatar': content['file:0']})
+        self.assertTrue(form.is_valid())
+        avatar = form.cleaned_data['avatar']
+        self.assertEqual(avatar.temporary_file_path(), temp_path)
+        self.assertEqual(avatar.size, os.path.getsize(temp_path))
+        avatar.close()
+        self.assertFalse(os.path.exists(temp_path))
+
+
+class ChunkedUploadTest(TestCase):
+    signer = ImageField.signer
+
+    def tearDown(self):
+        for filename in ('sample-image.jpg', 'sample-image.jpg.thumbnail'):
+            try:
+                os.remove(os.path.join(settings.MEDIA_ROOT, 'upload_temp', filename))
+            except:
+                pass
+
+    def post(self, **data):
+        data.setdefault('filetype', 'image')
+        return Client().post(reverse('fileupload'), data, **UPLOAD_HEADERS)
+
+    @override_settings(DJNG_THUMBNAIL_WORKERS=0)
+    def test_chunked_upload(self):
+        upload_filename = os.path.join(os.path.dirname(__file__), 'sample-image.jpg')
+        with open(upload_filename, 'rb') as fp:
+            payload = fp.read()
+        response = self.post(action='init', file_name='sample-image.jpg')
+        self.assertEqual(response.status_code, 200)
+        content = json.loads(response.content.decode('utf-8'))
+        temp_name, offset = content['temp_name'], content['offset']
+        self.assertEqual(offset, 0)
+
+        chunk_size = 10000
+        while offset < len(payload):
+            chunk = SimpleUploadedFile('blob', payload[offset:offset + chunk_size])
+            response = self.post(action='append', temp_name=temp_name, offset=offset, chunk=chunk)
+            self.assertEqual(response.status_code, 200)
+            offset = json.loads(response.content.decode('utf-8'))['offset']
+
+        # resend the last chunk, as if its response got lost
+        chunk = SimpleUploadedFile('blob', payload[-10:])
+        response = self.post(action='append', temp_name=temp_name, offset=len(payload) - 10, chunk=chunk)
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(json.loads(response.content.decode('utf-8'))['offset'], len(payload))
+
+        response = self.post(action='finalize', temp_name=temp_name, file_size=len(payload),
+                             file_name='sample-image.jpg', content_type='image/jpeg')
+        self.assertEqual(response.status_code, 200)
+        content = json.loads(response.content.decode('utf-8'))['file:0']
+        self.assertTrue(content['url'].startswith('url(data:application/octet-stream;base64,/9j/4AAQSkZJRgABA'))
+        self.assertEqual(content['file_size'], len(payload))
+        self.assertEqual(self.signer.unsign(content['temp_name']), 'sample-image.jpg')
+
+        content.pop('url')
+        form = TestUploadForm(data={'avatar': content})
+        self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data['avatar'].read(), payload)
+
+    def test_swept_temp_file(self):
+        response = self.post(action='init', file_name='sample-image.jpg')
+        temp_name = json.loads(response.content.decode('utf-8'))['temp_name']
+        os.remove(os.path.join(settings.MEDIA_ROOT, 'upload_temp', 'sample-image.jpg'))
+        chunk = SimpleUploadedFile('blob', b'x' * 100)
+        response = self.post(action='append', temp_name=temp_name, offset=0, chunk=chunk)
+        self.assertEqual(response.status_code, 410)
+        response = self.post(action='finalize', temp_name=temp_name, file_size=100)
+        self.assertEqual(response.status_code, 410)
+
+    def test_bogus_temp_name(self):
+        response = self.post(action='finalize', temp_name=self.signer.sign('sample-image.jpg'), file_size=0)
+        self.assertEqual(response.status_code, 400)
+
+    def test_chunk_size_attribute(self):
+        dom = PyQuery(TestUploadForm().as_p())
+        self.assertEqual(dom('div.drop-box textarea').attr('djng-fileupload-chunk-size'), str(0x200000))
+
+
+class MultiFileUploadTest(TestCase):
+    signer = ImageField.signer
+
+    def tearDown(self):
+        for filename in os.listdir(os.path.join(settings.MEDIA_ROOT, 'upload_temp')):
+            if filename.startswith('gallery'):
+                os.remove(os.path.join(settings.MEDIA_ROOT, 'upload_temp', filename))
+
+    @override_settings(DJNG_THUMBNAIL_WORKERS=0)
+    def test_upload_multiple_images(self):
+        upload_filename = os.path.join(os.path.dirname(__file__), 'sample-image.jpg')
+        with open(upload_filename, 'rb') as fp:
+            payload = fp.read()
+        data = {'filetype': 'image'}
+        for k in range(8):
+            data['file:{}'.format(k)] = SimpleUploadedFile('gallery-{}.jpg'.format(k), payload, 'image/jpeg')
+        data['file:8'] = SimpleUploadedFile('gallery-bogus.jpg', b'no image', 'image/jpeg')
+        response = Client().post(reverse('fileupload'), data, **UPLOAD_HEADERS)
+        self.assertEqual(response.status_code, 200)
+        content = json.loads(response.content.decode('utf-8'))
+        for k in range(8):
+            self.assertEqual(self.signer.unsign(content['file:{}'.format(k)]['temp_name']), 'gallery-{}.jpg'.format(k))
+            self.assertTrue(content['file:{}'.format(k)]['url'].startswith('url(data:'))
+        self.assertEqual(content['file:8']['file_name'], 'gallery-bogus.jpg')
+        self.assertIn('error', content['file:8'])
+
+
+class ThumbnailUrlCacheTest(TestCase):
+    def setUp(self):
+        upload_filename = os.path.join(os.path.dirname(__file__), 'sample-image.jpg')
+        with open(upload_filename, 'rb') as fp:
+            self.image_name = default_storage.save('thumbnail-cache.jpg', fp)
+        self.initial = {'avatar': ImageFieldFile(None, models.ImageField(name='avatar'), self.image_name)}
+
+    def tearDown(self):
+        ImageField().remove_current(self.image_name)
+        _thumbnail_urls.clear()
+        _modified_times.clear()
+        cache.clear()
+
+    def test_cached_background_url(self):
+        html = TestUploadForm(initial=self.initial).as_p()
+        background_image = PyQuery(html)('div.drop-box textarea').attr('style')
+        self.assertIn('thumbnail-cache.jpg.', background_image)
+        with self.assertNumQueries(0):
+            self.assertEqual(TestUploadForm(initial=self.initial).as_p(), html)
+
+        # the in-process dictionary is backed by Django's cache
+        _thumbnail_urls.clear()
+        with self.assertNumQueries(0):
+            self.assertEqual(TestUploadForm(initial=self.initial).as_p(), html)
+
+    def test_memoized_modified_time(self):
+        html = TestUploadForm(initial=self.initial).as_p()
+        with mock.patch.object(default_storage, 'get_modified_time') as get_modified_time:
+            self.assertEqual(TestUploadForm(initial=self.initial).as_p(), html)
+            self.assertEqual(TestUploadForm(initial=self.initial).as_p(), html)
+        self.assertFalse(get_modified_time.called)
+
+
+@override_settings(DJNG_UPLOAD_DEDUPLICATE=True, DJNG_THUMBNAIL_WORKERS=0)
+class DeduplicatedUploadTest(TestCase):
+    signer = ImageField.signer
+    storage = app_settings.upload_storage
+    upload_image = FileUploadTest.upload_image
+
+    def tearDown(self):
+        shutil.rmtree(self.storage.path('sha256'), ignore_errors=True)
+
+    def test_upload(self):
+        with mock.patch.object(ImageField, 'generate_thumbnail', wraps=ImageField.generate_thumbnail) as generate:
+            first = self.upload_image()['file:0']
+            second = self.upload_image()['file:0']
+        self.assertEqual(generate.call_count, 1)
+        self.assertEqual(first, second)
+        temp_name = self.signer.unsign(first['temp_name'])
+        self.assertRegex(temp_name, r'^sha256/[0-9a-f]{2}/[0-9a-f]{64}\.jpg$')
+        self.assertTrue(first['url'].startswith('url(data:image/jpeg;base64,'))
+        self.assertEqual(first['file_name'], 'sample-image.jpg')
+
+    @override_settings(FILE_UPLOAD_MAX_MEMORY_SIZE=50000)
+    def test_receive_shared_image(self):
+        content = self.upload_image()['file:0']
+        content.pop('url')
+        temp_path = self.storage.path(self.signer.unsign(content['temp_name']))
+        for _ in range(2):
+            form = TestUploadForm(data={'avatar': content})
+            self.assertTrue(form.is_valid())
+            avatar = form.cleaned_data['avatar']
+            self.assertNotEqual(avatar.temporary_file_path(), temp_path)
+            self.assertEqual(avatar.read(), open(temp_path, 'rb').read())
+            avatar.close()
+        self.assertTrue(os.path.exists(temp_path))
+
+
+class UploadPolicyTest(TestCase):
+    signer = ImageField.signer
+    storage = app_settings.upload_storage
+
+    def tearDown(self):
+        shutil.rmtree(self.storage.path('sha256'), ignore_errors=True)
+        try:
+            os.remove(self.storage.path('sample-image.jpg'))
+        except:
+            pass
+
+    def upload_image(self, policy, **data):
+        upload_filename = os.path.join(os.path.dirname(__file__), 'sample-image.jpg')
+        with open(upload_filename, 'rb') as fp:
+            data.update({'filetype': 'image', 'file:0': fp})
+            return Client().post(reverse('fileupload'), data, HTTP_DJNG_UPLOAD_POLICY=policy.dumps())
+
+    def test_accepts(self):
+        policy = UploadPolicy(None, 'image/*, .pdf')
+        self.assertTrue(policy.accepts('image/jpeg', 'photo.jpg'))
+        self.assertTrue(policy.accepts('application/octet-stream', 'document.PDF'))
+        self.assertFalse(policy.accepts('text/plain', 'notes.txt'))
+
+    def test_reject_content_type(self):
+        response = self.upload_image(UploadPolicy(None, 'application/pdf'))
+        self.assertEqual(response.status_code, 422)
+        self.assertIn("'image/jpeg' are not accepted", json.loads(response.content.decode('utf-8'))['file:0']['error'])
+        self.assertFalse(os.path.exists(self.storage.path('sample-image.jpg')))
+
+    def test_reject_size(self):
+        response = self.upload_image(UploadPolicy(10000, 'image/*'))
+        self.assertEqual(response.status_code, 413)
+        self.assertIn('error', json.loads(response.content.decode('utf-8'))['file:0'])
+        self.assertFalse(os.path.exists(self.storage.path('sample-image.jpg')))
+
+    def test_missing_policy(self):
+        response = self.upload_image(UploadPolicy(None, 'image/*'))
+        self.assertEqual(response.status_code, 200)
+        with open(os.path.join(os.path.dirname(__file__), 'sample-image.jpg'), 'rb') as fp:
+            response = Client().post(reverse('fileupload'), {'filetype': 'image', 'file:0': fp})
+        self.assertEqual(response.status_code, 400)
+
+    @override_settings(DJNG_THUMBNAIL_WORKERS=0)
+    def test_enforce_policy_on_submission(self):
+        class StrictUploadForm(NgModelFormMixin, NgForm):
+            scope_prefix = 'my_data'
+            form_name = 'my_form'
+            avatar = ImageField(max_size=10000)
+            document = ImageField(accept='.png')
+
+        # the client replays the token of a permissive field, which the view can not tell apart
+        response = self.upload_image(UploadPolicy(None, '*/*'))
+        content = json.loads(response.content.decode('utf-8'))['file:0']
+        content.pop('url')
+        form = StrictUploadForm(data={'avatar': content, 'document': content})
+        self.assertFalse(form.is_valid())
+        self.assertIn("Files may not be larger than", form.errors['avatar'][0])
+        self.assertIn("'image/jpeg' are not accepted", form.errors['document'][0])
+
+    def test_bogus_policy(self):
+        response = Client().post(reverse('fileupload'), {'filetype': 'image'}, HTTP_DJNG_UPLOAD_POLICY='bogus')
+        self.assertEqual(response.status_code, 400)
+
+    @override_settings(DJNG_UPLOAD_DEDUPLICATE=True, DJNG_THUMBNAIL_WORKERS=0)
+    def test_streamed_digest(self):
+        with mock.patch('djng.forms.fields.sha256') as sha256:
+            response = self.upload_image(UploadPolicy(None, 'image/*'))
+        self.assertFalse(sha256.called)
+        temp_name = self.signer.unsign(json.loads(response.content.decode('utf-8'))['file:0']['temp_name'])
+        with open(os.path.join(os.path.dirname(__file__), 'sample-image.jpg'), 'rb') as fp:
+            self.assertIn(hashlib.sha256(fp.read()).hexdigest(), temp_name)
+
+    def test_chunked_size_limit(self):
+        policy = UploadPolicy(1000, 'image/*')
+        response = Client().post(reverse('fileupload'), {
+            'filetype': 'image', 'action': 'init', 'file_name': 'sample-image.jpg', 'file_size': 5000,
+            'content_type': 'image/jpeg'}, HTTP_DJNG_UPLOAD_POLICY=policy.dumps())
+        self.assertEqual(response.status_code, 413)
+
+    def test_oversized_chunk(self):
+        policy = UploadPolicy(1000, 'image/*')
+        response = Client().post(reverse('fileupload'), {
+            'filetype': 'image', 'action': 'append', 'temp_name': 'irrelevant', 'offset': 0,
+            'chunk': SimpleUploadedFile('blob', b'x' * 5000)}, HTTP_DJNG_UPLOAD_POLICY=policy.dumps())
+        self.assertEqual(response.status_code, 413)
+
+    def test_widget_policy(self):
+        field = ImageField(max_size=5000)
+        policy = UploadPolicy.loads(field.widget.attrs['djng-fileupload-policy'])
+        self.assertEqual(policy, (5000, 'image/*'))
+
+
+class DirectUploadTest(TestCase):
+    storage = app_settings.upload_storage
+
+    def setUp(self):
+        upload_filename = os.path.join(os.path.dirname(__file__), 'sample-image.jpg')
+        with open(upload_filename, 'rb') as fp:
+            self.payload = fp.read()
+
+    def tearDown(self):
+        for filename in ('sample-image.jpg', 'sample-image.jpg.thumbnail'):
+            try:
+                os.remove(os.path.join(settings.MEDIA_ROOT, 'upload_temp', filename))
+            except:
+                pass
+
+    def request_ticket(self, **data):
+        data.update(action='ticket', filetype='image', file_name='sample-image.jpg', content_type='image/jpeg')
+        data.setdefault('file_size', len(self.payload))
+        return Client().post(reverse('fileupload'), data, **UPLOAD_HEADERS)
+
+    def put(self, ticket, payload):
+        url = '{}?ticket={}'.format(reverse('fileupload-direct'), ticket)
+        return Client().put(url, payload, content_type='image/jpeg')
+
+    def test_direct_upload(self):
+        response = self.request_ticket()
+        self.assertEqual(response.status_code, 200)
+        content = json.loads(response.content.decode('utf-8'))['file:0']
+        self.assertIn('?thumbnail=', content['url'])
+        self.assertEqual(self.storage.size('sample-image.jpg'), 0)
+
+        # the thumbnail is not available, as long as the file has not been uploaded
+        response = Client().get(content['url'][4:-1])
+        self.assertEqual(response.status_code, 503)
+
+        # the form refuses the ticket, as long as the file has not been uploaded
+        data = dict(content)
+        data.pop('url')
+        self.assertFalse(TestUploadForm(data={'avatar': data}).is_valid())
+
+        response = self.put(content['ticket'], self.payload)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.storage.size('sample-image.jpg'), len(self.payload))
+        response = self.put(content['ticket'], self.payload)
+        self.assertEqual(response.status_code, 409)
+
+        thumbnail_url = content['url'][4:-1]
+        response = Client().get(thumbnail_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'image/jpeg')
+
+        form = TestUploadForm(data={'avatar': data})
+        self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data['avatar'].read(), self.payload)
+        self.assertFalse(self.storage.exists('sample-image.jpg'))
+
+    def test_size_mismatch(self):
+        content = json.loads(self.request_ticket().content.decode('utf-8'))['file:0']
+        response = self.put(content['ticket'], self.payload + b'trailing garbage')
+        self.assertEqual(response.status_code, 413)
+        response = self.put(content['ticket'], self.payload[:100])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.storage.size('sample-image.jpg'), 0)
+        response = self.put(content['ticket'], self.payload)
+        self.assertEqual(response.status_code, 200)
+
+    def test_bogus_ticket(self):
+        content = json.loads(self.request_ticket().content.decode('utf-8'))['file:0']
+        response = self.put(content['ticket'] + 'x', self.payload)
+        self.assertEqual(response.status_code, 400)
+        data = dict(content, ticket=content['ticket'] + 'x')
+        form = TestUploadForm(data={'avatar': data})
+        self.assertFalse(form.is_valid())
+        self.assertIn("Got bogus upstream data", form.errors['avatar'])
+
+    def test_forged_ticket(self):
+        # a signed temp_name must not pass as ticket, even if its file name looks like one
+        self.storage.save('secret.txt', ContentFile(b'TOP SECRET'))
+        try:
+            payload = json.dumps({'name': 'secret.txt', 'size': 10}).encode('utf-8')
+            forged = ImageField.signer.sign(signing.b64_encode(payload).decode('ascii'))
+            response = self.put(forged, b'0123456789')
+            self.assertEqual(response.status_code, 400)
+            form = TestUploadForm(data={'avatar': {'ticket': forged, 'file_name': 'secret.txt',
+                                                   'content_type': 'text/plain', 'charset': None,
+                                                   'content_type_extra': None}})
+            self.assertFalse(form.is_valid())
+            self.assertIn("Got bogus upstream data", form.errors['avatar'])
+        finally:
+            self.storage.delete('secret.txt')
+
+    @override_settings(DJNG_UPLOAD_TICKET_MAX_AGE=-1)
+    def test_expired_ticket(self):
+        content = json.loads(self.request_ticket().content.decode('utf-8'))['file:0']
+        response = self.put(content['ticket'], self.payload)
+        self.assertEqual(response.status_code, 403)
+
+    def test_ticket_policy(self):
+        policy = UploadPolicy(1000, 'image/*')
+        response = Client().post(reverse('fileupload'), {
+            'action': 'ticket', 'filetype': 'image', 'file_name': 'sample-image.jpg',
+            'content_type': 'image/jpeg', 'file_size': len(self.payload),
+        }, HTTP_DJNG_UPLOAD_POLICY=policy.dumps())
+        self.assertEqual(response.status_code, 413)
+        self.assertFalse(self.storage.exists('sample-image.jpg'))
+
+    def test_direct_url_attribute(self):
+        field = ImageField(direct_upload_url='/upload/direct/')
+        self.assertEqual(field.widget.attrs['djng-fileupload-direct-url'], '/upload/direct/')
+        self.assertNotIn('djng-fileupload-direct-url', TestUploadForm().fields['avatar'].widget.attrs)
+
+
+class MemoryStorage(Storage):
+    """
+    Storage keeping its files in memory, and hence, as most remote storages, offering no ``path()``.
+    """
+    files = {}
+
+    def _open(self, name, mode='rb'):
+        try:
+            return ContentFile(self.files[name][0], name=name)
+        except KeyError:
+            raise FileNotFoundError(name)
+
+    def _save(self, name, content):
+        self.files[name] = (b''.join(content.chunks()), timezone.now())
+        return name
+
+    def delete(self, name):
+        self.files.pop(name, None)
+
+    def exists(self, name):
+        return name in self.files
+
+    def size(self, name):
+        return len(self._open(name).file.getvalue())
+
+    def get_modified_time(self, name):
+        return self.files[name][1]
+
+
+@override_settings(DJNG_UPLOAD_STORAGE='server.tests.test_fileupload.MemoryStorage')
+class RemoteStorageUploadTest(TestCase):
+    signer = ImageField.signer
+    storage = app_settings.upload_storage
+
+    def setUp(self):
+        MemoryStorage.files.clear()
+        upload_filename = os.path.join(os.path.dirname(__file__), 'sample-image.jpg')
+        with open(upload_filename, 'rb') as fp:
+            self.payload = fp.read()
+
+    def post(self, **data):
+        data.setdefault('filetype', 'image')
+        return Client().post(reverse('fileupload'), data, **UPLOAD_HEADERS)
+
+    def submit(self, content):
+        content.pop('url')
+        form = TestUploadForm(data={'avatar': content})
+        self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data['avatar'].read(), self.payload)
+
+    def test_upload(self):
+        response = self.post(**{'file:0': SimpleUploadedFile('sample-image.jpg', self.payload, 'image/jpeg')})
+        content = json.loads(response.content.decode('utf-8'))['file:0']
+        self.assertIn('sample-image.jpg', MemoryStorage.files)
+        response = Client().get(content['url'][4:-1])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'image/jpeg')
+        self.submit(content)
+        self.assertNotIn('sample-image.jpg', MemoryStorage.files)
+
+    @override_settings(DJNG_THUMBNAIL_WORKERS=0, DJNG_UPLOAD_DEDUPLICATE=True, FILE_UPLOAD_MAX_MEMORY_SIZE=1000)
+    def test_chunked_upload(self):
+        content = json.loads(self.post(action='init', file_name='sample-image.jpg').content.decode('utf-8'))
+        temp_name, offset = content['temp_name'], content['offset']
+        while offset < len(self.payload):
+            chunk = SimpleUploadedFile('blob', self.payload[offset:offset + 10000])
+            response = self.post(action='append', temp_name=temp_name, offset=offset, chunk=chunk)
+            offset = json.loads(response.content.decode('utf-8'))['offset']
+        response = self.post(action='finalize', temp_name=temp_name, file_size=len(self.payload),
+                             file_name='sample-image.jpg', content_type='image/jpeg')
+        self.assertEqual(response.status_code, 200)
+        content = json.loads(response.content.decode('utf-8'))['file:0']
+        self.assertTrue(content['url'].startswith('url(data:image/jpeg;base64,'))
+        self.assertTrue(self.signer.unsign(content['temp_name']).startswith('sha256/'))
+        self.submit(content)
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+from unittest import mock
+
+from django.core.cache import cache
+from django.forms.forms import BaseForm
+from django.forms.renderers import DjangoTemplates
+from django.test import TestCase
+from django.utils import translation
+
+from djng.forms import fields, NgFormCacheMixin, NgModelFormMixin
+from djng.styling.bootstrap3.forms import Bootstrap3Form
+
+
+class CachedForm(NgFormCacheMixin, NgModelFormMixin, Bootstrap3Form):
+    scope_prefix = 'cached_data'
+    form_name = 'cached_form'
+
+    first_name = fields.CharField(label='First name', min_length=3, max_length=20)
+    continent = fields.ChoiceField(choices=[('eu', 'Europe'), ('as', 'Asia')])
+
+
+class UncachedForm(NgModelFormMixin, Bootstrap3Form):
+    scope_prefix = 'cached_data'
+    form_name = 'cached_form'
+
+    first_name = fields.CharField(label='First name', min_length=3, max_length=20)
+    continent = fields.ChoiceField(choices=[('eu', 'Europe'), ('as', 'Asia')])
+
+
+class NgFormCacheMixinTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_cached_markup(self):
+        html = CachedForm().as_div()
+        self.assertHTMLEqual(html, UncachedForm().as_div())
+        self.assertEqual(CachedForm().as_div(), html)
+        self.assertEqual(CachedForm().as_p(), UncachedForm().as_p())
+
+    def test_cache_hit(self):
+        with mock.patch.object(BaseForm, '_html_output', autospec=True, side_effect=BaseForm._html_output) as html_output:
+            CachedForm().as_div()
+            CachedForm().as_div()
+            self.assertEqual(html_output.call_count, 1)
+            CachedForm().as_p()
+            self.assertEqual(html_output.call_count, 2)
+            UncachedForm().as_div()
+            UncachedForm().as_div()
+            self.assertEqual(html_output.call_count, 4)
+
+    def test_cache_key(self):
+        form = CachedForm()
+        cache_key = form.get_form_cache_key('as_div')
+        self.assertTrue(cache_key.startswith('djng:form:server.tests.test_form_cache.CachedForm:'))
+        self.assertNotEqual(CachedForm(scope_prefix='other_data').get_form_cache_key('as_div'), cache_key)
+        self.assertNotEqual(CachedForm(form_name='other_form').get_form_cache_key('as_div'), cache_key)
+        with translation.override('de'):
+            self.assertNotEqual(CachedForm().get_form_cache_key('as_div'), cache_key)
+        self.assertEqual(CachedForm().get_form_cache_key('as_div'), cache_key)
+
+    def test_cache_key_renderer_and_error_class(self):
+        class OtherRenderer(DjangoTemplates):
+            pass
+
+        class OtherErrorList(CachedForm().error_class):
+            pass
+
+        cache_key = CachedForm().get_form_cache_key('as_div')
+        self.assertNotEqual(CachedForm(renderer=OtherRenderer()).get_form_cache_key('as_div'), cache_key)
+        self.assertNotEqual(CachedForm(error_class=OtherErrorList).get_form_cache_key('as_div'), cache_key)
+
+    def test_uncacheable_forms(self):
+        self.assertIsNone(CachedForm(data={'first_name': 'John'}).get_form_cache_key('as_div'))
+        self.assertIsNone(CachedForm(initial={'first_name': 'John'}).get_form_cache_key('as_div'))
+        form = CachedForm(initial={'first_name': 'John'})
+        self.assertIn('value="John"', form.as_div())
+
+    def test_callable_choices(self):
+        continents = [('eu', 'Europe'), ('as', 'Asia')]
+
+        class CallableChoicesForm(NgFormCacheMixin, NgModelFormMixin, Bootstrap3Form):
+            continents = fields.MultipleChoiceField(choices=lambda: continents)
+
+        self.assertIsNone(CallableChoicesForm().get_form_cache_key('as_div'))
+        CallableChoicesForm().as_div()
+        continents.append(('af', 'Africa'))
+        self.assertIn('Africa', CallableChoicesForm().as_div())
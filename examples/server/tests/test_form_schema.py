@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+import json
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import translation
+
+from djng.forms import fields, NgFormCacheMixin, NgModelFormMixin, NgFormValidationMixin
+from djng.styling.bootstrap3.forms import Bootstrap3Form
+
+from server.forms.client_validation import SubscribeForm as ClientValidatedForm
+
+
+class SchemaForm(NgFormCacheMixin, NgModelFormMixin, NgFormValidationMixin, Bootstrap3Form):
+    scope_prefix = 'schema_data'
+    form_name = 'schema_form'
+
+    first_name = fields.CharField(label='First name', min_length=3, max_length=20, help_text='Your name')
+    continent = fields.ChoiceField(choices=[('Old world', [('eu', 'Europe'), ('as', 'Asia')]), ('am', 'America')])
+    weight = fields.IntegerField(min_value=42, required=False, initial=70)
+
+
+class FormSchemaTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_schema(self):
+        schema = json.loads(SchemaForm().as_schema())
+        self.assertEqual(schema['form_name'], 'schema_form')
+        self.assertEqual(schema['scope_prefix'], 'schema_data')
+        self.assertEqual([f['name'] for f in schema['fields']], ['first_name', 'continent', 'weight'])
+
+        first_name = schema['fields'][0]
+        self.assertEqual(first_name['label'], 'First name')
+        self.assertEqual(first_name['help_text'], 'Your name')
+        self.assertEqual(first_name['model'], "schema_data['first_name']")
+        self.assertTrue(first_name['required'])
+        self.assertEqual(first_name['widget']['type'], 'TextInput')
+        self.assertEqual(first_name['widget']['input_type'], 'text')
+        self.assertEqual(first_name['widget']['attrs']['ng-minlength'], 3)
+        self.assertEqual(first_name['widget']['attrs']['ng-required'], 'true')
+        self.assertEqual([v['key'] for v in first_name['validation']],
+                         ['$error.required', '$error.minlength', '$error.maxlength'])
+        self.assertEqual(first_name['validation'][1]['message'], 'Ensure this value has at least 3 characters')
+        self.assertEqual(first_name['error_messages']['required'], 'This field is required.')
+
+        continent = schema['fields'][1]
+        self.assertListEqual(continent['choices'], [
+            {'label': 'Old world', 'choices': [{'value': 'eu', 'label': 'Europe'}, {'value': 'as', 'label': 'Asia'}]},
+            {'value': 'am', 'label': 'America'},
+        ])
+
+        weight = schema['fields'][2]
+        self.assertEqual(weight['initial'], 70)
+        self.assertEqual(weight['widget']['attrs']['min'], 42)
+        self.assertEqual(weight['validation'][0]['key'], '$error.min')
+
+    def test_schema_without_cache(self):
+        schema = json.loads(ClientValidatedForm().as_schema())
+        self.assertNotIn('scope_prefix', schema)
+        sex = [f for f in schema['fields'] if f['name'] == 'sex'][0]
+        self.assertEqual(sex['widget']['type'], 'RadioSelect')
+        self.assertEqual(sex['validation'][0]['message'], 'At least one radio button has to be selected.')
+
+    def test_cached_schema(self):
+        schema = SchemaForm().as_schema()
+        self.assertEqual(cache.get(SchemaForm().get_form_cache_key('as_schema')), schema)
+        with translation.override('de'):
+            german_schema = json.loads(SchemaForm().as_schema())
+        self.assertEqual(german_schema['fields'][0]['error_messages']['required'], 'Dieses Feld ist zwingend erforderlich.')
@@ -1,11 +1,16 @@
 # -*- coding: utf-8 -*-
 import copy
+import json
+from django.core.exceptions import ValidationError
 from django.db import models
 from django.forms import forms, widgets
-from django.http import QueryDict
+from django.http import JsonResponse, QueryDict
 from django.test import TestCase
+from django.utils.html import conditional_escape
+from django.utils.safestring import mark_safe
 import six
 from djng.forms import fields, NgModelFormMixin, NgForm, NgModelForm, NgDeclarativeFieldsMetaclass, NgFormValidationMixin
+from djng.forms.angular_base import FormDataView, SafeTuple, TupleErrorList, _render_cached_error_list
 from pyquery.pyquery import PyQuery
 import unittest
 from lxml import html
@@ -199,6 +204,40 @@ class NgModelFormMixinTest(TestCase):
         self.assertTrue(bound_form.is_bound)
         self.assertTrue(bound_form.is_valid())
 
+    def test_multipart_multi_values(self):
+        query = QueryDict('email=john@example.com&onoff=on&sex=f&select_multi=a&select_multi=d'
+                          '&check_multi.b=b&check_multi.c=c&hide_me=hidden')
+        bound_form = DummyForm(data=query)
+        self.assertListEqual(bound_form.data.getlist('check_multi'), ['b', 'c'])
+        self.assertListEqual(bound_form.data.getlist('select_multi'), ['a', 'd'])
+        self.assertNotIn('check_multi.b', bound_form.data)
+        self.assertFalse(bound_form.errors)
+        self.assertListEqual(bound_form.cleaned_data['check_multi'], ['b', 'c'])
+        self.assertTrue(query.get('check_multi.b'), "submitted data must remain unmodified")
+
+        query = QueryDict('email=john@example.com&sex=f')
+        bound_form = DummyForm(data=query)
+        self.assertIsNot(bound_form.data, query)
+        self.assertTrue(bound_form.data._mutable)
+        self.assertEqual(bound_form.data.get('sex'), 'f')
+
+    def test_multipart_legacy_implode_multi_values(self):
+        class LegacyMultipleChoiceField(fields.MultipleChoiceField):
+            def implode_multi_values(self, name, data):
+                super(LegacyMultipleChoiceField, self).implode_multi_values(name, data)
+                data.setlist(name, [value.upper() for value in data.getlist(name)])
+
+        class LegacyForm(NgForm):
+            check_multi = LegacyMultipleChoiceField(choices=(('A', 'A'), ('B', 'B')),
+                                                    widget=widgets.CheckboxSelectMultiple)
+
+        query = QueryDict('check_multi.a=a&check_multi.b=b')
+        with self.assertWarns(DeprecationWarning):
+            bound_form = LegacyForm(data=query)
+        self.assertListEqual(bound_form.data.getlist('check_multi'), ['A', 'B'])
+        self.assertNotIn('check_multi.a', bound_form.data)
+        self.assertTrue(query.get('check_multi.a'), "submitted data must remain unmodified")
+
     def test_invalid_email(self):
         in_data = copy.deepcopy(self.valid_data)
         in_data['email'] = 'no.email.address'
@@ -246,6 +285,18 @@ class NgModelFormMixinTest(TestCase):
         self.assertTrue(bound_form.errors.pop('sub1.radio_choices'))
         self.assertFalse(bound_form.errors)
 
+    def test_errors_as_json_data(self):
+        in_data = copy.deepcopy(self.valid_data)
+        in_data.update(email='no.email', sex='X', select_multi=['a', 'X'])
+        in_data['sub1']['select_choices'] = 'X'
+        bound_form = DummyForm(data=in_data)
+        self.assertFalse(bound_form.is_valid())
+        json_data = bound_form.errors_as_json_data()
+        expected = json.loads(JsonResponse(bound_form.errors).content.decode('utf-8'))
+        self.assertDictEqual(json_data, expected)
+        self.assertListEqual(sorted(json_data.keys()), ['email', 'select_multi', 'sex', 'sub1.select_choices'])
+        self.assertListEqual(json_data['sex'], ["Select a valid choice. X is not one of the available choices."])
+
     def test_initial_data(self):
         initial_data = self.unbound_form.get_initial_data()
         initial_keys = list(initial_data.keys())
@@ -264,3 +315,182 @@ class InvalidNgModelFormMixinTest(TestCase):
     def test_invalid_form(self):
         # create a form with an invalid Meta class
         self.assertRaises(TypeError, InvalidForm)
+
+
+class CssClassesForm(NgForm):
+    field_css_classes = {
+        '*': 'form-group has-feedback',
+        'phone': ["ng-class: {'ng-hide': sex==='f'};", '__default__'],
+        'email': 'email-group',
+    }
+    label_css_classes = {
+        '*': 'control-label',
+        'email': 'email-label',
+    }
+
+    phone = fields.CharField()
+    email = fields.EmailField()
+    name = fields.CharField()
+
+
+class CssClassesTest(TestCase):
+    def test_field_css_classes(self):
+        for _ in range(2):
+            # rendering twice must not modify the declared CSS classes
+            form = CssClassesForm()
+            self.assertEqual(form['phone'].css_classes(),
+                             "form-group has-feedback ng-class: {'ng-hide': sex==='f'};")
+            self.assertEqual(form['email'].css_classes(), 'email-group')
+            self.assertEqual(form['name'].css_classes(), 'form-group has-feedback')
+        self.assertIn('__default__', CssClassesForm.field_css_classes['phone'])
+
+    def test_extra_css_classes(self):
+        form = CssClassesForm()
+        self.assertSetEqual(set(form['email'].css_classes('extra').split()), {'email-group', 'extra'})
+
+    def test_label_css_classes(self):
+        form = CssClassesForm()
+        self.assertHTMLEqual(form['email'].label_tag(),
+                             '<label class="control-label email-label" for="id_email">Email</label>')
+        self.assertHTMLEqual(form['name'].label_tag(),
+                             '<label class="control-label" for="id_name">Name</label>')
+
+
+class CheckboxForm(NgModelFormMixin, NgForm):
+    scope_prefix = 'data'
+
+    name = fields.CharField()
+    check_multi = fields.MultipleChoiceField(choices=CHOICES, widget=widgets.CheckboxSelectMultiple)
+
+
+class FormClassValuesTest(TestCase):
+    def test_default_form_name(self):
+        self.assertEqual(DummyForm.__dict__['_default_form_name'], 'RHVtbXlGb3Jt')
+        self.assertEqual(DummyForm().form_name, 'RHVtbXlGb3Jt')
+        self.assertEqual(DummyForm(form_name='dummy').form_name, 'dummy')
+        self.assertEqual(CheckboxForm().form_name, 'Q2hlY2tib3hGb3Jt')
+
+    def test_ng_models(self):
+        self.assertEqual(SubForm2.__dict__['_ng_models'], frozenset(['select_choices', 'first_name']))
+        self.assertIsNone(SubForm1.get_ng_models())
+        self.assertNotIn('_ng_models', InvalidForm.__dict__)
+        self.assertEqual(SubForm2().get_initial_data(), {'select_choices': 'a', 'first_name': None})
+
+    def test_ng_field_attrs(self):
+        attrs = DummyForm().get_ng_field_attrs('email')
+        self.assertDictEqual(dict(attrs), {'ng-model': "dataroot['email']", 'ng-class': "fieldClass('email')"})
+        self.assertIs(DummyForm().get_ng_field_attrs('email'), attrs)
+        with self.assertRaises(TypeError):
+            attrs['ng-model'] = 'tampered'
+        sub_form = SubForm2(prefix='sub2', scope_prefix='data')
+        self.assertDictEqual(dict(sub_form.get_ng_field_attrs('first_name')), {'ng-model': "data['sub2.first_name']"})
+        self.assertDictEqual(dict(sub_form.get_ng_field_attrs('radio_choices')), {})
+
+    def test_widget_class(self):
+        first_form, second_form = DummyForm(), DummyForm()
+        first_form.as_p()
+        second_form.as_p()
+        self.assertIs(type(first_form.fields['email'].widget), type(second_form.fields['email'].widget))
+
+
+class FormDataViewTest(TestCase):
+    def test_ajax_data(self):
+        data = {'name': 'John', 'check_multi': {'a': True, 'b': False, 'c': True}}
+        form = CheckboxForm(data=data)
+        self.assertIsInstance(form.data, FormDataView)
+        self.assertEqual(form.data['check_multi'], ['a', 'c'])
+        self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data['check_multi'], ['a', 'c'])
+        self.assertDictEqual(data['check_multi'], {'a': True, 'b': False, 'c': True})
+
+    def test_prefixed_ajax_data(self):
+        data = {'sub': {'name': 'John', 'check_multi': {'b': True}}, 'name': 'Other'}
+        form = CheckboxForm(data=data, prefix='sub')
+        self.assertListEqual(list(form.data.keys()), ['sub.name', 'sub.check_multi'])
+        self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data, {'name': 'John', 'check_multi': ['b']})
+
+        form = CheckboxForm(data={'sub.name': 'Jane', 'name': 'Other'}, prefix='sub')
+        self.assertDictEqual(dict(form.data), {'sub.name': 'Jane', 'sub.check_multi': []})
+
+    def test_copy_on_write(self):
+        data = {'name': 'John'}
+        view = FormDataView(data)
+        view['name'] = 'Jane'
+        view['extra'] = 'value'
+        self.assertEqual(view['name'], 'Jane')
+        del view['extra']
+        self.assertNotIn('extra', view)
+        with self.assertRaises(KeyError):
+            del view['extra']
+        self.assertDictEqual(view.copy(), {'name': 'Jane'})
+        self.assertDictEqual(data, {'name': 'John'})
+
+
+class BoundFieldCacheTest(TestCase):
+    def test_bound_field_cache(self):
+        form = DummyForm()
+        self.assertIs(form['email'], form['email'])
+
+    def test_hidden_field_errors(self):
+        in_data = copy.deepcopy(NgModelFormMixinTest.valid_data)
+        in_data.pop('hide_me')
+        bound_form = DummyForm(data=in_data)
+        self.assertFalse(bound_form.is_valid())
+        errors = bound_form.non_field_errors()
+        self.assertEqual(errors[0][3], 'hide_me.$isEmpty()')
+        self.assertEqual(errors[0][5], '(Hidden field hide_me) This field is required.')
+        self.assertEqual(len(bound_form.non_field_errors()), len(errors))
+
+        # after revalidation, errors shall not be taken from the cache
+        bound_form.data['hide_me'] = 'hidden string'
+        bound_form.full_clean()
+        self.assertEqual(bound_form.non_field_errors()[0][3], '$error.rejected')
+
+
+class TupleErrorListTest(TestCase):
+    def test_safe_tuple(self):
+        error = SafeTuple(('my_form', 'djng-field-errors', '$pristine', '$valid', 'valid', 'Message'))
+        self.assertFalse(hasattr(error, '__dict__'))
+        self.assertEqual(error, ('my_form', 'djng-field-errors', '$pristine', '$valid', 'valid', 'Message'))
+        self.assertEqual(error.message, error[5])
+        self.assertIs(conditional_escape(error), error)
+
+    def test_validation_error_message(self):
+        error = SafeTuple(('my_form', 'djng-field-errors', '$pristine', '$pristine', 'invalid',
+                           ValidationError("Invalid value")))
+        errors = TupleErrorList([error])
+        self.assertEqual(errors[0][5], "Invalid value")
+        self.assertEqual([e[5] for e in errors], ["Invalid value"])
+        self.assertIsInstance(errors.data[0][5], ValidationError)
+
+    def test_membership(self):
+        errors = TupleErrorList([ValidationError("First error"), "Second error"])
+        self.assertIn("First error", errors)
+        self.assertNotIn("Third error", errors)
+        errors.append("Third error")
+        self.assertIn("Third error", errors)
+        errors.remove("Third error")
+        self.assertNotIn("Third error", errors)
+
+    def test_equality(self):
+        errors = TupleErrorList([ValidationError("First error"), "Second error"])
+        self.assertEqual(errors, ["First error", "Second error"])
+        self.assertEqual(errors, TupleErrorList(["First error", "Second error"]))
+        self.assertNotEqual(errors, ["First error"])
+        self.assertNotEqual(errors, ("First error", "Second error"))
+
+    def test_cached_as_ul(self):
+        potential_error = SafeTuple((mark_safe("my_form['name']"), 'djng-field-errors', '$dirty',
+                                     '$error.required', 'invalid', "This field is required."))
+        server_error = SafeTuple((mark_safe("my_form['name']"), 'djng-field-errors', '$pristine',
+                                  '$pristine', 'invalid', "Name <b>Doe</b> is rejected"))
+        errors = TupleErrorList([potential_error, server_error])
+        html = errors.as_ul()
+        self.assertInHTML('<ul ng-show="my_form[\'name\'].$dirty &amp;&amp; !my_form[\'name\'].$untouched" '
+                          'class="djng-field-errors" ng-cloak><li ng-show="my_form[\'name\'].$error.required" '
+                          'class="invalid">This field is required.</li></ul>', html)
+        self.assertIn('Name &lt;b&gt;Doe&lt;/b&gt; is rejected', html)
+        cache_info = _render_cached_error_list.cache_info()
+        self.assertEqual(TupleErrorList([potential_error, server_error]).as_ul(), html)
+        self.assertEqual(_render_cached_error_list.cache_info().hits, cache_info.hits + 1)
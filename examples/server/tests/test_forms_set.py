@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+from django.contrib.auth.models import Group
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from djng.forms import fields, NgForm, NgModelFormMixin, NgFormsSet
+
+from server.forms.forms_set import SubscribeForm, AddressForm
+
+
+class GroupForm(NgModelFormMixin, NgForm):
+    scope_prefix = 'group_data'
+    form_name = 'group_form'
+
+    group = fields.ModelChoiceField(queryset=Group.objects.all())
+
+
+class OtherGroupForm(GroupForm):
+    scope_prefix = 'other_group_data'
+    form_name = 'other_group_form'
+
+
+class NgFormsSetTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = Group.objects.create(name='Staff')
+        cls.admins = Group.objects.create(name='Admins')
+
+    def test_unbound_forms_set(self):
+        forms_set = NgFormsSet([SubscribeForm, AddressForm])
+        self.assertFalse(forms_set.is_bound)
+        self.assertFalse(forms_set.is_valid())
+        self.assertListEqual(list(forms_set.forms.keys()), ['subscribe_form', 'address_form'])
+        self.assertIsInstance(forms_set['address_form'], AddressForm)
+        self.assertFalse(forms_set['address_form'].is_bound)
+
+    def test_valid_forms_set(self):
+        data = {
+            'subscribe_data': {'sex': 'f', 'full_name': 'Jane Doe'},
+            'address_data': {'street_name': 'Main Street'},
+        }
+        forms_set = NgFormsSet([SubscribeForm, AddressForm], data=data)
+        self.assertTrue(forms_set.is_valid())
+        self.assertEqual(forms_set['address_form'].cleaned_data['street_name'], 'Main Street')
+
+    def test_invalid_forms_set(self):
+        data = {'subscribe_data': {'sex': 'f', 'full_name': 'John Doe'}}
+        forms_set = NgFormsSet([SubscribeForm, AddressForm], data=data)
+        self.assertFalse(forms_set.is_valid())
+        self.assertDictEqual(forms_set.errors_as_json_data(), {
+            'subscribe_form': {'__all__': ['The full name "John Doe" is rejected by the server.']},
+            'address_form': {'street_name': ['This field is required.']},
+        })
+
+    def test_duplicate_form_name(self):
+        with self.assertRaises(ValueError):
+            NgFormsSet([GroupForm, GroupForm])
+
+    def test_shared_prefetch(self):
+        data = {
+            'group_data': {'group': self.staff.pk},
+            'other_group_data': {'group': str(self.admins.pk)},
+        }
+        forms_set = NgFormsSet([GroupForm, OtherGroupForm], data=data)
+        with CaptureQueriesContext(connection) as context:
+            self.assertTrue(forms_set.is_valid())
+        self.assertEqual(len(context), 1)
+        self.assertEqual(forms_set['group_form'].cleaned_data['group'], self.staff)
+        self.assertEqual(forms_set['other_group_form'].cleaned_data['group'], self.admins)
+
+    def test_prefetch_invalid_choice(self):
+        data = {
+            'group_data': {'group': self.staff.pk},
+            'other_group_data': {'group': 'X'},
+        }
+        forms_set = NgFormsSet([GroupForm, OtherGroupForm], data=data)
+        self.assertFalse(forms_set.is_valid())
+        self.assertEqual(forms_set['group_form'].cleaned_data['group'], self.staff)
+        self.assertListEqual(list(forms_set.errors_as_json_data()['other_group_form'].keys()), ['group'])
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+import json
+
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.forms import widgets
+from django.test import TestCase, RequestFactory
+from django.views.generic import FormView
+
+from djng.forms import fields, NgForm, NgModelFormMixin
+from djng.views.mixins import JSONResponseMixin, RemoteChoicesMixin
+
+
+class CachedChoicesForm(NgModelFormMixin, NgForm):
+    scope_prefix = 'group_data'
+    form_name = 'cached_form'
+
+    group = fields.ModelChoiceField(queryset=Group.objects.all(), cache_choices=True, cache_timeout=60)
+    groups = fields.ModelMultipleChoiceField(queryset=Group.objects.order_by('name'), cache_choices=True,
+                                             required=False)
+
+
+class RemoteChoicesForm(NgModelFormMixin, NgForm):
+    scope_prefix = 'group_data'
+    form_name = 'remote_form'
+
+    group = fields.ModelChoiceField(queryset=Group.objects.order_by('name'), remote_choices=True,
+                                    search_fields=['name__istartswith'])
+    groups = fields.ModelMultipleChoiceField(queryset=Group.objects.order_by('name'), remote_choices=True,
+                                             required=False)
+
+
+class RemoteChoicesView(JSONResponseMixin, RemoteChoicesMixin, FormView):
+    form_class = RemoteChoicesForm
+
+
+class ModelChoicesTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.groups = [Group.objects.create(name='Group {:02d}'.format(k)) for k in range(60)]
+
+    def setUp(self):
+        cache.clear()
+
+    def test_cached_choices(self):
+        with self.assertNumQueries(2):
+            html = CachedChoicesForm().as_p()
+        self.assertEqual(html.count('<option value="{}"'.format(self.groups[0].pk)), 2)
+        with self.assertNumQueries(0):
+            self.assertEqual(CachedChoicesForm().as_p(), html)
+
+    def test_cache_version(self):
+        CachedChoicesForm().as_p()
+        Group.objects.create(name='New Group')
+        self.assertNotIn('New Group', CachedChoicesForm().as_p())
+        form = CachedChoicesForm()
+        form.fields['group'].cache_version = 2
+        self.assertIn('New Group', form.as_p())
+
+    def test_cached_choices_validation(self):
+        form = CachedChoicesForm(data={'group': self.groups[3].pk, 'groups': [self.groups[4].pk]})
+        self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data['group'], self.groups[3])
+        form = CachedChoicesForm(data={'group': 0})
+        self.assertFalse(form.is_valid())
+        self.assertIn('group', form.errors)
+
+    def test_remote_choices_rendering(self):
+        with self.assertNumQueries(0):
+            html = RemoteChoicesForm().as_p()
+        self.assertIn('djng-remote-choices="remote_form.group"', html)
+        self.assertIn('djng-remote-choices="remote_form.groups"', html)
+        self.assertNotIn('Group 00', html)
+
+        form = RemoteChoicesForm(initial={'group': self.groups[5].pk, 'groups': [self.groups[6].pk]})
+        with self.assertNumQueries(2):
+            html = form.as_p()
+        self.assertIn('<option value="{}" selected>Group 05</option>'.format(self.groups[5].pk), html)
+        self.assertIn('<option value="{}" selected>Group 06</option>'.format(self.groups[6].pk), html)
+        self.assertNotIn('Group 07', html)
+
+    def test_remote_choices_validation(self):
+        data = {'group': self.groups[7].pk, 'groups': [self.groups[8].pk, self.groups[9].pk]}
+        form = RemoteChoicesForm(data=data)
+        with self.assertNumQueries(2):
+            self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data['group'], self.groups[7])
+        self.assertListEqual(list(form.cleaned_data['groups']), self.groups[8:10])
+
+    def test_fetch_choices(self):
+        field = RemoteChoicesForm().fields['group']
+        result = field.fetch_choices()
+        self.assertEqual(len(result['choices']), 50)
+        self.assertTrue(result['has_more'])
+        self.assertDictEqual(result['choices'][0], {'value': self.groups[0].pk, 'label': 'Group 00'})
+        result = field.fetch_choices(page=2)
+        self.assertEqual(len(result['choices']), 10)
+        self.assertFalse(result['has_more'])
+        result = field.fetch_choices(search='group 1')
+        self.assertListEqual([c['label'] for c in result['choices']], ['Group {}'.format(k) for k in range(10, 20)])
+        self.assertFalse(result['has_more'])
+
+    def test_remote_choices_view(self):
+        view = RemoteChoicesView.as_view()
+        request = RequestFactory().post(
+            '/', data=json.dumps({'field': 'remote_form.group', 'search': 'Group 5', 'page': 1}),
+            content_type='application/json', HTTP_X_REQUESTED_WITH='XMLHttpRequest',
+            HTTP_DJNG_REMOTE_METHOD='fetch_choices')
+        response = view(request)
+        self.assertEqual(response.status_code, 200)
+        result = json.loads(response.content.decode('utf-8'))
+        self.assertEqual(len(result['choices']), 10)
+
+        request = RequestFactory().post(
+            '/', data=json.dumps({'field': 'remote_form.unknown'}),
+            content_type='application/json', HTTP_X_REQUESTED_WITH='XMLHttpRequest',
+            HTTP_DJNG_REMOTE_METHOD='fetch_choices')
+        self.assertEqual(view(request).status_code, 404)
+
+    def test_remote_choices_widget(self):
+        with self.assertRaises(ImproperlyConfigured):
+            fields.ModelChoiceField(queryset=Group.objects.all(), remote_choices=True, widget=widgets.RadioSelect)
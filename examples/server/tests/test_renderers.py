@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+import datetime
+
+from django.forms import widgets
+from django.forms.renderers import DjangoTemplates
+from django.test import TestCase
+
+from djng.forms import fields, NgForm, NgModelFormMixin, NgFormValidationMixin
+from djng.forms.renderers import CompiledWidgetRenderer
+from djng.styling.bootstrap3.forms import Bootstrap3Form
+
+from server.forms.client_validation import SubscribeForm as ClientValidatedForm
+from server.forms.combined_validation import SubscribeForm as CombinedValidatedForm, default_subscribe_data
+from server.forms.subscribe_form import SubscribeForm as ModelScopeForm
+from server.tests import test_forms
+
+
+class EdgeCaseForm(NgModelFormMixin, NgFormValidationMixin, Bootstrap3Form):
+    scope_prefix = 'edge_data'
+    form_name = 'edge_form'
+
+    GROUPED_CHOICES = [
+        ('Europe', [('de', 'Germany'), ('fr', 'France & <Monaco>')]),
+        ('America', [('us', 'USA'), ('ca', 'Canada')]),
+        ('xx', 'Unknown'),
+    ]
+
+    title = fields.CharField(initial='"Quoted" & <escaped>')
+    grouped = fields.ChoiceField(choices=GROUPED_CHOICES)
+    grouped_multi = fields.MultipleChoiceField(choices=GROUPED_CHOICES)
+    grouped_radio = fields.ChoiceField(choices=GROUPED_CHOICES, widget=widgets.RadioSelect)
+    visit_date = fields.DateField(initial=datetime.date(2020, 2, 29))
+    visit_time = fields.TimeField(initial=datetime.time(13, 45))
+    visit_datetime = fields.DateTimeField(initial=datetime.datetime(2020, 2, 29, 13, 45))
+    duration = fields.DurationField(required=False)
+    amount = fields.DecimalField(max_digits=6, decimal_places=2, initial=1234.5)
+    homepage = fields.URLField(required=False)
+    remark = fields.CharField(widget=widgets.Textarea, initial='Line 1\nLine <2>')
+    multi_hidden = fields.MultipleChoiceField(choices=[('a', 'A'), ('b', 'B')], widget=widgets.MultipleHiddenInput,
+                                              initial=['a', 'b'])
+    nullable = fields.NullBooleanField()
+
+
+class CompiledWidgetRendererTest(TestCase):
+    """
+    Golden-output tests, asserting that the CompiledWidgetRenderer renders exactly the same markup
+    as the template based renderer.
+    """
+    def setUp(self):
+        self.maxDiff = None
+
+    def assertSameMarkup(self, form_class, render_method='as_div', **kwargs):
+        template_form = form_class(renderer=DjangoTemplates(), **kwargs)
+        compiled_form = form_class(renderer=CompiledWidgetRenderer(), **kwargs)
+        expected = getattr(template_form, render_method)()
+        self.assertEqual(getattr(compiled_form, render_method)(), expected)
+        return expected
+
+    def test_unbound_forms(self):
+        for form_class in (ClientValidatedForm, CombinedValidatedForm, ModelScopeForm, EdgeCaseForm):
+            for render_method in ('as_div', 'as_p', 'as_ul', 'as_table'):
+                self.assertSameMarkup(form_class, render_method)
+
+    def test_initial_data(self):
+        self.assertSameMarkup(CombinedValidatedForm, initial=default_subscribe_data)
+        self.assertSameMarkup(ModelScopeForm, initial=default_subscribe_data)
+
+    def test_valid_bound_forms(self):
+        data = dict(default_subscribe_data, first_name='Jane', password='secret')
+        for form_class in (ClientValidatedForm, CombinedValidatedForm, ModelScopeForm):
+            self.assertSameMarkup(form_class, data=data)
+
+    def test_invalid_bound_forms(self):
+        data = dict(default_subscribe_data, email='no.email', weight=20, height='<tall>', notifyme=['fax'])
+        for form_class in (ClientValidatedForm, CombinedValidatedForm, ModelScopeForm):
+            self.assertSameMarkup(form_class, data=data)
+
+    def test_bound_edge_cases(self):
+        data = {
+            'title': '<script>alert("x")</script>',
+            'grouped': 'fr',
+            'grouped_multi': ['de', 'xx'],
+            'grouped_radio': 'ca',
+            'visit_date': 'invalid',
+            'amount': '12.34',
+            'remark': '',
+            'multi_hidden': ['b'],
+        }
+        self.assertSameMarkup(EdgeCaseForm, data=data)
+        self.assertSameMarkup(EdgeCaseForm, render_method='as_p', data=data)
+
+    def test_model_forms(self):
+        self.assertSameMarkup(test_forms.DummyForm, render_method='as_p')
+        self.assertSameMarkup(test_forms.DummyForm, render_method='as_p', data=test_forms.NgModelFormMixinTest.valid_data)
+
+    def test_default_renderer(self):
+        class CompiledForm(NgForm):
+            default_renderer = CompiledWidgetRenderer
+
+            name = fields.CharField()
+
+        form = CompiledForm()
+        self.assertIsInstance(form.renderer, CompiledWidgetRenderer)
+        self.assertHTMLEqual(str(form['name']), '<input type="text" name="name" required id="id_name">')
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+import os
+import shutil
+import tempfile
+import time
+from io import StringIO
+
+from django.apps import apps
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command, CommandError
+from django.test import SimpleTestCase
+
+from djng.core import upload_temp
+from djng.core.upload_temp import scan_upload_temp, sweep_upload_temp
+from djng.forms.fields import FileField
+
+
+class UploadTempSweeperTest(SimpleTestCase):
+    def setUp(self):
+        self.location = tempfile.mkdtemp()
+        self.storage = FileSystemStorage(location=self.location)
+        now = time.time()
+        for name, age, size in [('old.jpg', 7200, 100), ('sha256/ab/older.jpg', 9000, 200),
+                                ('recent.jpg', 600, 300), ('new.jpg', 60, 400)]:
+            name = self.storage.save(name, ContentFile(b'x' * size))
+            os.utime(self.storage.path(name), (now - age, now - age))
+        self.now = now
+
+    def tearDown(self):
+        shutil.rmtree(self.location)
+
+    def remaining_files(self):
+        return sorted(name for batch in scan_upload_temp(self.storage) for name, _, _ in batch)
+
+    def test_scan_in_batches(self):
+        batches = list(scan_upload_temp(self.storage, batch_size=3))
+        self.assertListEqual([len(batch) for batch in batches], [3, 1])
+
+    def test_sweep_by_age(self):
+        result = sweep_upload_temp(self.storage, max_age=3600, max_size=None, now=self.now)
+        self.assertEqual(result, (4, 2, 300))
+        self.assertListEqual(self.remaining_files(), ['new.jpg', 'recent.jpg'])
+
+    def test_sweep_by_quota(self):
+        result = sweep_upload_temp(self.storage, max_age=0, max_size=500, now=self.now)
+        self.assertEqual(result, (4, 3, 600))
+        self.assertListEqual(self.remaining_files(), ['new.jpg'])
+
+    def test_reuploaded_digest_file(self):
+        with self.settings(DJNG_UPLOAD_DEDUPLICATE=True, DJNG_UPLOAD_STORAGE_OPTIONS={'location': self.location}):
+            temp_name = FileField.store_temp_file(SimpleUploadedFile('notes.txt', b'shared content'))
+            self.assertTrue(temp_name.startswith('sha256/'))
+            past = self.now - 7200
+            os.utime(self.storage.path(temp_name), (past, past))
+
+            # uploading the same content again, must keep the shared file from being swept
+            self.assertEqual(FileField.store_temp_file(SimpleUploadedFile('notes.txt', b'shared content')), temp_name)
+            sweep_upload_temp(self.storage, max_age=3600, max_size=None)
+            self.assertTrue(self.storage.exists(temp_name))
+
+    def test_dry_run(self):
+        result = sweep_upload_temp(self.storage, max_age=3600, max_size=None, dry_run=True, now=self.now)
+        self.assertEqual(result, (4, 2, 300))
+        self.assertEqual(len(self.remaining_files()), 4)
+
+    def test_management_command(self):
+        with self.settings(DJNG_UPLOAD_STORAGE_OPTIONS={'location': self.location}):
+            stdout = StringIO()
+            call_command('djng_sweep_uploads', max_age=3600, stdout=stdout)
+        self.assertEqual(stdout.getvalue().strip(), "Removed 2 of 4 files, reclaiming 300\xa0bytes.")
+
+    def test_refuse_sweeping_media_root(self):
+        with self.settings(MEDIA_ROOT=self.location, DJNG_UPLOAD_TEMP=''):
+            with self.assertRaises(CommandError):
+                call_command('djng_sweep_uploads', max_age=3600, stdout=StringIO())
+        with self.settings(MEDIA_ROOT=os.path.join(self.location, 'media')):
+            with self.assertRaises(ImproperlyConfigured):
+                sweep_upload_temp(self.storage, max_age=3600, max_size=None)
+        self.assertEqual(len(self.remaining_files()), 4)
+
+    def test_sweeper_not_started_on_startup(self):
+        with self.settings(DJNG_UPLOAD_TEMP_SWEEP_INTERVAL=60):
+            apps.get_app_config('djng').ready()
+            self.assertIsNone(upload_temp._sweeper)
@@ -2,7 +2,7 @@
 from django.conf.urls import url
 from django.urls import reverse_lazy
 from django.views.generic import RedirectView
-from djng.views.upload import FileUploadView
+from djng.views.upload import DirectUploadView, FileUploadView
 
 from server.views.classic_subscribe import SubscribeView as ClassicSubscribeView
 from server.views.client_validation import SubscribeView as ClientValidationView
@@ -31,5 +31,6 @@ urlpatterns = [
         name='djng_3way_databinding'),
     url(r'^form_data_valid', NgFormDataValidView.as_view(), name='form_data_valid'),
     url(r'^upload/$', FileUploadView.as_view(), name='fileupload'),
+    url(r'^upload/direct/$', DirectUploadView.as_view(), name='fileupload-direct'),
     url(r'^$', RedirectView.as_view(url=reverse_lazy('djng_classic_subscription'))),
 ]
@@ -29,4 +29,4 @@ class SubscribeView(FormView):
         if form.is_valid():
             return JsonResponse({'success_url': force_text(self.success_url)})
         else:
-            return JsonResponse({form.form_name: form.errors}, status=422)
+            return JsonResponse({form.form_name: form.errors_as_json_data()}, status=422)